@@ -0,0 +1,48 @@
+"""Measure how long `scoutos run` takes before it starts running the app.
+
+Each measurement starts a fresh interpreter, so nothing is imported yet.
+Run with `make bench` or `python benchmarks/bench_import_time.py`.
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SAMPLES = 10
+
+APP_PATH = Path(__file__).parent.parent / "examples" / "load_from_yaml" / "app.yaml"
+
+STAGES = {
+    "import scoutos": "import scoutos",
+    "import cli": "import scoutos.cli.main",
+    "import cli + load app": (
+        "import scoutos.cli.main; from pathlib import Path; "
+        f"scoutos.App.load_from_file(Path({str(APP_PATH)!r}))"
+    ),
+}
+
+
+def milliseconds_to_run(code: str) -> float:
+    samples = []
+    for _ in range(SAMPLES):
+        started_at = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+        samples.append(time.perf_counter() - started_at)
+
+    return statistics.median(samples) * 1e3
+
+
+def main() -> None:
+    baseline = milliseconds_to_run("pass")
+    print(f"{'stage':<24}{'median':>10}")
+    print(f"{'interpreter startup':<24}{baseline:>7.0f} ms")
+    for stage, code in STAGES.items():
+        print(f"{stage:<24}{milliseconds_to_run(code) - baseline:>7.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Compare the cost of an App run under each schema validation mode.
+
+Run with `make bench` or `python benchmarks/bench_schema_validation.py`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+from scoutos import App, Depends
+from scoutos.blocks import Identity, Input, Output
+
+if TYPE_CHECKING:
+    from scoutos.app import Validation
+
+RUNS = 2_000
+
+MESSAGE_SCHEMA = {
+    "type": "object",
+    "required": ["text", "user", "score"],
+    "properties": {
+        "text": {"type": "string", "minLength": 1},
+        "user": {"enum": ["bot", "me"]},
+        "score": {"type": "number", "minimum": 0, "maximum": 1},
+    },
+}
+
+SCHEMA = {
+    "type": "object",
+    "required": ["messages"],
+    "properties": {"messages": {"type": "array", "items": MESSAGE_SCHEMA}},
+}
+
+RUN_INPUT = {
+    "messages": [
+        {"text": f"message {index}", "user": "bot", "score": 0.5} for index in range(50)
+    ]
+}
+
+
+def create_app(validation: Validation) -> App:
+    depends = [Depends.AnyType({"path": "input.messages"})]
+
+    return App(
+        blocks=[
+            Input({"key": "input", "input_schema": SCHEMA, "output_schema": SCHEMA}),
+            Identity(
+                {
+                    "key": "identity",
+                    "depends": depends,
+                    "input_schema": SCHEMA,
+                    "output_schema": SCHEMA,
+                }
+            ),
+            Output(
+                {
+                    "key": "output",
+                    "depends": [Depends.AnyType({"path": "identity.messages"})],
+                    "input_schema": SCHEMA,
+                }
+            ),
+        ],
+        validation=validation,
+        validation_sample_rate=0.1,
+    )
+
+
+async def microseconds_per_run(app: App) -> float:
+    started_at = time.perf_counter()
+    for _ in range(RUNS):
+        await app.run(RUN_INPUT)
+
+    return (time.perf_counter() - started_at) / RUNS * 1e6
+
+
+async def main() -> None:
+    print(f"{'validation':<12}{'per run':>12}")
+    for validation in ("off", "sampled", "always"):
+        elapsed = await microseconds_per_run(create_app(validation))
+        print(f"{validation:<12}{elapsed:>9.0f} us")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,13 +1,54 @@
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .app import App, AppExecutionError
 from .condition import Condition
 from .dependencies import Depends
-from .secret import Secret, SecretNotFoundError
+from .plan import ExecutionPlan, ExecutionPlanError
+from .query import Query, QueryError, compile_query
+from .retry import CircuitBreakerPolicy, CircuitOpenError, RetryPolicy
+from .run_context import RunContext
+from .schema import SchemaError, SchemaValidationError, compile_schema
+from .timings import BlockTimings
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .secret import Secret, SecretNotFoundError
+
+# `Secret` is only needed by apps that use secrets, and brings in `httpx`.
+_LAZY_EXPORTS = {
+    "Secret": ".secret",
+    "SecretNotFoundError": ".secret",
+}
 
 __all__ = [
     "App",
     "AppExecutionError",
+    "BlockTimings",
+    "CircuitBreakerPolicy",
+    "CircuitOpenError",
     "Condition",
     "Depends",
+    "ExecutionPlan",
+    "ExecutionPlanError",
+    "Query",
+    "QueryError",
+    "RetryPolicy",
+    "RunContext",
+    "SchemaError",
+    "SchemaValidationError",
     "Secret",
     "SecretNotFoundError",
+    "compile_query",
+    "compile_schema",
 ]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        message = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(message)
+
+    return getattr(import_module(module, __name__), name)
@@ -1,41 +1,147 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import json
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, TypeVar
+import random
+import time
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Literal,
+    TypeVar,
+)
 from uuid import uuid4
 
 from pydantic import BaseModel
+from typing_extensions import Self, TypedDict, Unpack
 
-from scoutos.blocks.base import Block
+from scoutos.blocks.base import Block, BlockOutput, BlockTimeoutError
+from scoutos.blocks.input import INPUT_BLOCK_ID
+from scoutos.blocks.output import OUTPUT_BLOCK_ID
+from scoutos.cache import create_snapshot_key
 from scoutos.constants import THE_START_OF_TIME_AND_SPACE
-from scoutos.utils import get_current_timestamp, read_data_from_file
+from scoutos.events import (
+    BlockFinished,
+    BlockSkipped,
+    BlockStarted,
+    LoopIteration,
+    RunEvent,
+    RunFinished,
+)
+from scoutos.plan import ExecutionPlan
+from scoutos.run_context import RunContext
+from scoutos.run_state import RunState
+from scoutos.timings import critical_path_ns
+from scoutos.transport import Transport
+from scoutos.utils import format_timestamp_ns, parse_data, read_data_from_file
 
 if TYPE_CHECKING:  # pragma: no cover
     from pathlib import Path
 
-    from scoutos.blocks.base import BlockOutput
+    from scoutos.cache import CacheBackend
+    from scoutos.checkpoint import Checkpoint, CheckpointStore
+    from scoutos.plan import DependencySlot
 
 
 InitialInput = TypeVar("InitialInput", bound=dict)
 
+Scheduler = Literal["sequential", "concurrent"]
+"""How the App runs the dependencies of a block.
+
+`sequential` runs them one after another, in the order they are declared.
+`concurrent` starts every dependency that is not yet resolved at once, so
+independent branches only cost as much as the slowest of them.
+"""
+
+Validation = Literal["off", "sampled", "always"]
+"""Whether blocks check their input and output against their schemas.
+
+`always` checks every block run. `off` never does, trading safety for
+throughput. `sampled` checks a random share of runs, see
+`validation_sample_rate`; a run is either checked entirely or not at all.
+"""
+
+
+Retention = Literal["full", "trimmed", "none"]
+"""Which block outputs a run keeps, and returns in `RunResult.block_output`.
+
+`full` keeps every output. `trimmed` keeps every output too, but only the
+latest `retained_iterations` outputs of a looping block keep their payload.
+`none` returns no intermediate payloads: the payload of a block is dropped as
+soon as no block left to run can read it, bounding the memory a run uses to
+the outputs still needed. Only the `output` block keeps its payload. Dropped
+outputs keep their metadata and are marked as `trimmed`.
+"""
+
 
 class AppConfig(BaseModel):
     blocks: list[dict]
 
 
+class AppOptions(TypedDict, total=False):
+    """The keyword arguments of `App` besides its blocks, which the loaders
+    pass through to it."""
+
+    max_concurrency: int | None
+    scheduler: Scheduler
+    validation: Validation
+    validation_sample_rate: float
+    retention: Retention
+    retained_iterations: int
+    checkpoints: CheckpointStore | None
+    transport: Transport | None
+
+
 @dataclass
 class RunResult:
     """Result returned when App is run."""
 
     app_output: dict
-    app_run_end_ts: str
+    app_run_duration_ns: int
     app_run_id: str
     app_run_path: list[str]
-    app_run_start_ts: str
+    app_run_started_at_ns: int
     block_output: list[BlockOutput]
     ok: bool
     session_id: str
+    app_run_input: dict = field(default_factory=dict)
+    error: Exception | None = None
+    """The exception that stopped the run, when `ok` is False."""
+
+    timed_out_block: str | None = None
+    """Key of the block that exceeded its time budget, if any."""
+
+    critical_path_ns: int = 0
+    """The longest chain of block `run` time through the run's dependencies,
+    i.e. the duration the run would have if the engine took no time."""
+
+    io_wait_ns: int = 0
+    """Time spent in block `run` methods, summed over every block execution.
+    Exceeds the run's duration when blocks run concurrently."""
+
+    engine_overhead_ns: int = 0
+    """The part of `app_run_duration_ns` not explained by `critical_path_ns`:
+    resolving dependencies, validation, caching, scheduling and waiting for
+    run slots."""
+
+    @property
+    def app_run_start_ts(self) -> str:
+        return format_timestamp_ns(self.app_run_started_at_ns)
+
+    @property
+    def skipped_blocks(self) -> list[str]:
+        """Keys of the blocks that were skipped, in the order they were."""
+        return [output.block_id for output in self.block_output if output.skipped]
+
+    @property
+    def app_run_end_ts(self) -> str:
+        return format_timestamp_ns(
+            self.app_run_started_at_ns + self.app_run_duration_ns
+        )
 
     def __str__(self) -> str:  # pragma: no cover
         return "\n".join(
@@ -46,6 +152,7 @@ class RunResult:
                 f"Run Started At: {self.app_run_start_ts}",
                 f"Run Completed At: {self.app_run_end_ts}",
                 f"Status: {self.ok}",
+                *([f"Error: {self.error!r}"] if self.error else []),
                 f"Blocks Executed: {self.app_run_path}",
                 "---",
                 json.dumps(self.app_output, indent=2),
@@ -54,112 +161,681 @@ class RunResult:
 
 
 class App:
-    """App is the entrypoint to ScoutOS Gen-AI Powered Applications."""
+    """App is the entrypoint to ScoutOS Gen-AI Powered Applications.
 
-    def __init__(self, blocks: list[Block]):
+    An App holds configuration only; each run keeps its state in its own
+    `RunContext`, so a single App can be run any number of times, including
+    concurrently.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        blocks: list[Block],
+        *,
+        max_concurrency: int | None = None,
+        scheduler: Scheduler = "sequential",
+        validation: Validation = "always",
+        validation_sample_rate: float = 0.1,
+        retention: Retention = "full",
+        retained_iterations: int = 1,
+        checkpoints: CheckpointStore | None = None,
+        transport: Transport | None = None,
+    ):
+        if max_concurrency is not None and max_concurrency < 1:
+            message = "`max_concurrency` must be at least 1"
+            raise ValueError(message)
+
+        if not 0 <= validation_sample_rate <= 1:
+            message = "`validation_sample_rate` must be between 0 and 1"
+            raise ValueError(message)
+
+        if retained_iterations < 1:
+            message = "`retained_iterations` must be at least 1"
+            raise ValueError(message)
+
+        self._plan = ExecutionPlan.compile(blocks)
         self._blocks = {block.key: block for block in blocks}
-        self._block_outputs: list[BlockOutput] = []
-        self._initial_input: dict = {}
+        self._max_concurrency = max_concurrency
+        self._run_slots: tuple[asyncio.AbstractEventLoop, asyncio.Semaphore] | None = (
+            None
+        )
+        self._scheduler = scheduler
+        self._validation = validation
+        self._validation_sample_rate = validation_sample_rate
+        self._retention = retention
+        self._retained_iterations = retained_iterations
+        self._checkpoints = checkpoints
+        self._owns_transport = transport is None
+        self._transport = transport if transport is not None else Transport()
+        for block in blocks:
+            block.transport = self._transport
 
     @classmethod
-    def load(cls, data: dict) -> App:
-        config = AppConfig.model_validate(data)
-        blocks = [Block.load(block_data) for block_data in config.blocks]
-        return App(blocks)
+    def load(cls, data: dict, **options: Unpack[AppOptions]) -> Self:
+        """Load an App from its config. The `options` are passed to the
+        App, e.g. its `scheduler`."""
+        return cls._load_config(AppConfig.model_validate(data), **options)
+
+    @classmethod
+    def load_from_file(
+        cls,
+        path: Path,
+        *,
+        cache: CacheBackend | None = None,
+        **options: Unpack[AppOptions],
+    ) -> Self:
+        """Load an App from a JSON or YAML file. The `options` are passed to
+        the App, e.g. its `scheduler`.
+
+        If a `cache` is provided, the validated config is stored in it under a
+        hash of the file contents and the scoutos version, and later loads of
+        the same file skip parsing and validating it.
+        """
+        if cache is None:
+            return cls.load(read_data_from_file(path), **options)
+
+        contents = path.read_bytes()
+        key = create_snapshot_key(contents, path.suffix)
+        config = cache.get(key)
+        if config is None:
+            config = AppConfig.model_validate(parse_data(contents, path.suffix))
+            cache.set(key, config)
+
+        return cls._load_config(config, **options)
 
     @classmethod
-    def load_from_file(cls, path: Path) -> App:
-        data = read_data_from_file(path)
-        return cls.load(data)
+    def _load_config(cls, config: AppConfig, **options: Unpack[AppOptions]) -> Self:
+        blocks = [Block.load(block_data) for block_data in config.blocks]
+        return cls(blocks, **options)
 
     @property
     def blocks(self) -> dict[str, Block]:
         return self._blocks
 
     @property
-    def current_output(self) -> list[BlockOutput]:
-        return sorted(
-            [output for block in self.blocks.values() for output in block.output],
-            key=lambda block_output: block_output.block_run_end_ts,
-        )
+    def plan(self) -> ExecutionPlan:
+        """The execution plan compiled from the blocks when the App was
+        created."""
+        return self._plan
+
+    @property
+    def max_concurrency(self) -> int | None:
+        """The maximum number of blocks that may execute at the same time,
+        across all the runs of the App, or `None` when unbounded."""
+        return self._max_concurrency
 
     @property
-    def current_path(self) -> list[str]:
-        """The path of blocks executed returned as a list of strings"""
-        return [block_output.block_id for block_output in self.current_output]
+    def scheduler(self) -> Scheduler:
+        return self._scheduler
+
+    @property
+    def validation(self) -> Validation:
+        return self._validation
+
+    @property
+    def validation_sample_rate(self) -> float:
+        """The share of runs checked against block schemas when `validation`
+        is `sampled`."""
+        return self._validation_sample_rate
+
+    @property
+    def retention(self) -> Retention:
+        return self._retention
+
+    @property
+    def retained_iterations(self) -> int:
+        """The number of latest outputs of a looping block that keep their
+        payload when `retention` is `trimmed`."""
+        return self._retained_iterations
+
+    @property
+    def checkpoints(self) -> CheckpointStore | None:
+        """The store runs are checkpointed to, so they can be resumed."""
+        return self._checkpoints
+
+    @property
+    def transport(self) -> Transport:
+        """The pooled HTTP clients shared by the App's blocks."""
+        return self._transport
+
+    async def close(self) -> None:
+        """Close the HTTP connections held by the App. A `transport` passed
+        to the App is left open, since it may be shared."""
+        if self._owns_transport:
+            await self._transport.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        await self.close()
 
     def get_block(self, block_id: str) -> Block:
         return self.blocks[block_id]
 
-    def get_output(self, block_id: str) -> BlockOutput:
-        try:
-            return self.blocks[block_id].output[-1]
-        except KeyError as orig_err:
+    def get_output(self, context: RunContext, block_id: str) -> BlockOutput:
+        output = context.state.latest(block_id)
+        if output is None:
             message = f"Output for `block_id`: {block_id} not found"
-            raise AppExecutionError(message) from orig_err
+            raise AppExecutionError(message)
+
+        return output
 
     async def run(
         self,
         app_run_input: dict | None = None,
         *,
+        deadline: float | None = None,
         run_until: str = "output",
         session_id: str | None = None,
+        app_run_id: str | None = None,
     ) -> RunResult:
-        """Run the application."""
+        """Run the application.
+
+        If a `deadline` is given, the run may take at most that many seconds.
+        Each block is given the time that remains, or its own `timeout` if
+        shorter. A block that exceeds its budget is cancelled and the run
+        returns a result with `ok=False` naming it in `timed_out_block`.
+
+        An `app_run_id` can be provided to identify the run, for instance to
+        `resume` it if it fails.
+        """
+        context = self._create_context(
+            app_run_input,
+            deadline=deadline,
+            session_id=session_id,
+            app_run_id=app_run_id,
+        )
+
+        return await self._execute(context, run_until)
 
-        app_run_id = str(uuid4())
-        session_id = session_id or str(uuid4())
-        app_run_start_ts = get_current_timestamp()
+    async def resume(
+        self,
+        app_run_id: str,
+        *,
+        deadline: float | None = None,
+        run_until: str = "output",
+    ) -> RunResult:
+        """Resume a run from its checkpoint.
+
+        The outputs recorded before the run stopped are restored, so only the
+        blocks that had not completed are executed: loops left midway carry on
+        from their latest iteration, and the rest of the run proceeds as
+        usual. Requires the App to have been created with `checkpoints`.
+        """
+        if self._checkpoints is None:
+            message = "Resuming a run requires the App to have a checkpoint store"
+            raise AppExecutionError(message)
 
-        await self._run_until(run_until, initial_input=app_run_input)
+        checkpoint = self._checkpoints.load(app_run_id)
+        if checkpoint is None:
+            message = f"No checkpoint found for run {app_run_id}"
+            raise AppExecutionError(message)
 
-        app_run_end_ts = get_current_timestamp()
+        context = self._create_context(
+            checkpoint.initial_input, deadline=deadline, checkpoint=checkpoint
+        )
 
-        return RunResult(
-            app_output=self.get_output("output").output,
-            app_run_end_ts=app_run_end_ts,
-            app_run_id=app_run_id,
-            app_run_path=self.current_path,
-            app_run_start_ts=app_run_start_ts,
-            block_output=self.current_output,
-            ok=True,
+        return await self._execute(context, run_until, resume=True)
+
+    async def run_stream(
+        self,
+        app_run_input: dict | None = None,
+        *,
+        deadline: float | None = None,
+        run_until: str = "output",
+        session_id: str | None = None,
+        app_run_id: str | None = None,
+    ) -> AsyncIterator[RunEvent]:
+        """Run the application, yielding events as the run progresses.
+
+        Events are yielded as blocks start and finish and as loops iterate.
+        The last event is always `RunFinished`, carrying the same `RunResult`
+        that `run` would have returned. Errors that `run` would raise are
+        raised once the events preceding them have been yielded.
+        """
+        events: asyncio.Queue[RunEvent | None] = asyncio.Queue()
+        context = self._create_context(
+            app_run_input,
+            deadline=deadline,
             session_id=session_id,
+            app_run_id=app_run_id,
         )
+        context.events = events
 
-    async def _run_until(
+        async def execute() -> RunResult:
+            try:
+                return await self._execute(context, run_until)
+            finally:
+                events.put_nowait(None)
+
+        task = asyncio.ensure_future(execute())
+        try:
+            while (event := await events.get()) is not None:
+                yield event
+
+            yield RunFinished(await task)
+        finally:
+            task.cancel()
+
+    async def run_many(
         self,
-        block_id: str,
+        inputs: Iterable[dict] | AsyncIterable[dict],
         *,
-        initial_input: dict | None = None,
-    ) -> None:
-        initial_input = initial_input or {}
-        current_block = self.get_block(block_id)
+        concurrency: int = 10,
+        deadline: float | None = None,
+        preserve_order: bool = False,
+        run_until: str = "output",
+    ) -> AsyncIterator[RunResult]:
+        """Run the application once for every input, yielding results as they
+        become available.
+
+        At most `concurrency` runs are in progress at once, and the next input
+        is only pulled from `inputs` when a run finishes, so large or
+        unbounded sources are never drained into memory. Results are yielded
+        in completion order unless `preserve_order` is set. A failing run
+        yields a `RunResult` with `ok=False` and its `error` instead of
+        aborting the batch. `deadline` applies to each run individually.
+        """
+        if concurrency < 1:
+            message = "`concurrency` must be at least 1"
+            raise ValueError(message)
+
+        source = _iterate(inputs)
+        exhausted = False
+        tasks: list[asyncio.Future[RunResult]] = []
 
-        if current_block.has_exceeded_run_count:
-            message = f"Exceeded Run Count for {current_block}"
-            raise AppExecutionError(message)
+        try:
+            while True:
+                while not exhausted and len(tasks) < concurrency:
+                    try:
+                        app_run_input = await anext(source)
+                    except StopAsyncIteration:
+                        exhausted = True
+                    else:
+                        tasks.append(
+                            asyncio.ensure_future(
+                                self._run_reporting_errors(
+                                    app_run_input,
+                                    deadline=deadline,
+                                    run_until=run_until,
+                                )
+                            )
+                        )
+
+                if not tasks:
+                    return
+
+                if preserve_order:
+                    yield await tasks.pop(0)
+                    continue
+
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in [task for task in tasks if task in done]:
+                    tasks.remove(task)
+                    yield task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _execute(
+        self, context: RunContext, run_until: str, *, resume: bool = False
+    ) -> RunResult:
+        try:
+            if resume:
+                await self._continue(context, run_until)
+            else:
+                await self._run_until(context, run_until)
+        except BlockTimeoutError as timeout_error:
+            return self._create_result(context, error=timeout_error)
+
+        return self._create_result(context)
+
+    async def _run_reporting_errors(
+        self, app_run_input: dict, *, deadline: float | None, run_until: str
+    ) -> RunResult:
+        context = self._create_context(app_run_input, deadline=deadline)
+        try:
+            await self._run_until(context, run_until)
+        except Exception as error:  # noqa: BLE001
+            return self._create_result(context, error=error)
+
+        return self._create_result(context)
+
+    def _get_run_slots(self) -> asyncio.Semaphore | None:
+        """The slots shared by the runs of the App in the running event loop.
+        A semaphore belongs to the event loop it is first used in, so it is
+        replaced when the App is run from another one."""
+        if self._max_concurrency is None:
+            return None
+
+        loop = asyncio.get_running_loop()
+        if self._run_slots is None or self._run_slots[0] is not loop:
+            self._run_slots = (loop, asyncio.Semaphore(self._max_concurrency))
+
+        return self._run_slots[1]
+
+    def _create_context(
+        self,
+        app_run_input: dict | None,
+        *,
+        deadline: float | None = None,
+        session_id: str | None = None,
+        app_run_id: str | None = None,
+        checkpoint: Checkpoint | None = None,
+    ) -> RunContext:
+        context = RunContext(
+            deadline=time.monotonic() + deadline if deadline is not None else None,
+            initial_input=app_run_input or {},
+            run_slots=self._get_run_slots(),
+            validate_schemas=self._should_validate(),
+            state=RunState(
+                checkpoint.outputs if checkpoint is not None else (),
+                retained_iterations=self._retained_iterations_for_run(),
+            ),
+        )
+        if checkpoint is not None:
+            context.app_run_id = checkpoint.app_run_id
+            context.session_id = checkpoint.session_id
+        else:
+            context.app_run_id = app_run_id or context.app_run_id
+            context.session_id = session_id or context.session_id
+
+        if checkpoint is None and self._checkpoints is not None:
+            self._checkpoints.begin(
+                context.app_run_id, context.session_id, context.initial_input
+            )
+
+        return context
 
-        for dep in current_block.depends:
-            if dep.is_resolved(
-                self.current_output,
-                since=current_block.last_run_completed_at or THE_START_OF_TIME_AND_SPACE
-                if dep.requires_rerun
-                else THE_START_OF_TIME_AND_SPACE,
+    def _retained_iterations_for_run(self) -> int | None:
+        if self._retention == "trimmed":
+            return self._retained_iterations
+        # Dependencies only read the latest output of a block, so without
+        # intermediate outputs in the result, earlier iterations are dead.
+        if self._retention == "none":
+            return 1
+
+        return None
+
+    def _should_validate(self) -> bool:
+        if self._validation == "sampled":
+            return random.random() < self._validation_sample_rate  # noqa: S311
+
+        return self._validation == "always"
+
+    def _create_result(
+        self, context: RunContext, *, error: Exception | None = None
+    ) -> RunResult:
+        app_output: dict = {}
+        if error is None:
+            output = self.get_output(context, OUTPUT_BLOCK_ID)
+            app_output = {} if output.skipped else output.output
+
+        if self._retention == "none":
+            for block_id in self._blocks.keys() - {OUTPUT_BLOCK_ID}:
+                context.state.drop_payloads(block_id)
+
+        # A completed run has nothing left to resume.
+        if error is None and self._checkpoints is not None:
+            self._checkpoints.delete(context.app_run_id)
+        duration_ns = time.perf_counter_ns() - context.started_at_perf_ns
+        critical_path = critical_path_ns(context.state.log, self._plan.upstream)
+
+        return RunResult(
+            app_output=app_output,
+            app_run_duration_ns=duration_ns,
+            app_run_id=context.app_run_id,
+            app_run_path=list(context.state.path),
+            app_run_started_at_ns=context.started_at_ns,
+            block_output=list(context.state.log),
+            ok=error is None,
+            session_id=context.session_id,
+            app_run_input=context.initial_input,
+            error=error,
+            timed_out_block=error.block_id
+            if isinstance(error, BlockTimeoutError)
+            else None,
+            critical_path_ns=critical_path,
+            io_wait_ns=sum(output.timings.run_ns for output in context.state.log),
+            engine_overhead_ns=max(duration_ns - critical_path, 0),
+        )
+
+    async def _run_until(self, context: RunContext, block_id: str) -> None:
+        """Run `block_id`, and anything it depends upon, until it terminates.
+
+        Callers asking for a block that is already executing wait on that
+        execution instead of starting another one.
+        """
+        in_flight = context.in_flight.get(block_id)
+        if in_flight is None or in_flight.done():
+            in_flight = asyncio.ensure_future(self._settle(context, block_id))
+            context.in_flight[block_id] = in_flight
+
+        await in_flight
+
+    async def _continue(self, context: RunContext, run_until: str) -> None:
+        """Continue a run restored from a checkpoint.
+
+        A block that has an output is considered resolved, so loops the run
+        stopped in the middle of are settled first, before `run_until` is run
+        unless it had already completed.
+        """
+        for block_id in dict.fromkeys(context.state.path):
+            block = self._blocks.get(block_id)
+            if (
+                block is not None
+                and not context.state.is_skipped(block_id)
+                and not block.has_met_termination_condition(context)
+            ):
+                await self._run_until(context, block_id)
+
+        if context.state.latest(run_until) is None:
+            await self._run_until(context, run_until)
+
+    async def _settle(self, context: RunContext, block_id: str) -> None:
+        """Run a block until it meets its termination condition.
+
+        Loops are executed iteratively: after the first iteration only the
+        dependencies declared with `requires_rerun` are refreshed, since every
+        other dependency stays resolved for the rest of the run.
+        """
+        if context.state.is_skipped(block_id):
+            return
+
+        current_block = self.get_block(block_id)
+        slots = self._plan.slots[block_id]
+
+        if current_block.run_count(context) == 0 and not await self._is_taken(
+            context, current_block
+        ):
+            self._skip(context, block_id)
+            self._release(context, block_id)
+            return
+
+        while True:
+            if current_block.has_exceeded_run_count(context):
+                message = f"Exceeded Run Count for {current_block}"
+                raise AppExecutionError(message)
+
+            await self._run_dependencies(context, current_block, slots)
+            if _only_requires_skipped_blocks(context, slots):
+                self._skip(context, block_id)
+                self._release(context, block_id)
+                return
+
+            override_input = (
+                context.initial_input
+                if current_block.key == INPUT_BLOCK_ID
+                and current_block.run_count(context) == 0
+                else None
+            )
+            queued_at_perf_ns = time.perf_counter_ns()
+            async with context.run_slots or contextlib.nullcontext():
+                queue_wait_ns = time.perf_counter_ns() - queued_at_perf_ns
+                context.emit(
+                    BlockStarted(block_id, iteration=current_block.run_count(context))
+                )
+                block_output = await current_block.outter_run(
+                    context, override_input=override_input
+                )
+            block_output.timings.queue_wait_ns = queue_wait_ns
+            self._record(context, block_output)
+            context.emit(BlockFinished(block_output))
+
+            if current_block.has_met_termination_condition(context):
+                self._release(context, block_id)
+                return
+
+            context.emit(
+                LoopIteration(block_id, iteration=current_block.run_count(context))
+            )
+
+            slots = self._plan.rerun_slots[block_id]
+
+    async def _is_taken(self, context: RunContext, block: Block) -> bool:
+        """Evaluate the `when` condition of `block`, running what the
+        condition depends upon first."""
+        condition = block.when
+        if condition is None:
+            return True
+
+        slots = self._plan.condition_slots[block.key]
+        await self._run_dependencies(context, block, slots)
+        if any(
+            slot.is_required and context.state.is_skipped(slot.block_id)
+            for slot in slots
+        ):
+            return False
+
+        return condition.is_satisfied(context)
+
+    def _release(self, context: RunContext, block_id: str) -> None:
+        """Record that `block_id` has settled and, when intermediate outputs
+        are not retained, drop the payloads no block can read any more.
+
+        A block is finished once it has settled and every looping block that
+        runs it again has finished. The payload of a block is dead once every
+        block that may read it has finished.
+        """
+        if self._retention != "none":
+            return
+
+        context.settled.add(block_id)
+        plan = self._plan
+        pending = [block_id]
+        while pending:
+            key = pending.pop()
+            if (
+                key in context.finished
+                or key not in context.settled
+                or not context.finished.issuperset(plan.rerun_by[key])
             ):
                 continue
 
-            await self._run_until(
-                dep.block_id,
-                initial_input=initial_input,
+            context.finished.add(key)
+            pending.extend(slot.block_id for slot in plan.rerun_slots[key])
+            read = (
+                slot.block_id for slot in (*plan.condition_slots[key], *plan.slots[key])
             )
+            for upstream_key in (key, *read):
+                if upstream_key != OUTPUT_BLOCK_ID and context.finished.issuperset(
+                    plan.readers[upstream_key]
+                ):
+                    context.state.drop_payloads(upstream_key)
+
+    def _skip(self, context: RunContext, block_id: str) -> None:
+        """Record that `block_id` is skipped, along with the blocks it reads
+        that have not run and that no block left to run reads."""
+        block_output: BlockOutput = BlockOutput(
+            block_id=block_id,
+            block_run_id=str(uuid4()),
+            ok=True,
+            output=None,
+            started_at_ns=time.time_ns(),
+            skipped=True,
+        )
+        self._record(context, block_output)
+        context.emit(BlockSkipped(block_output))
+
+        plan = self._plan
+        for slot in (*plan.condition_slots[block_id], *plan.slots[block_id]):
+            upstream_key = slot.block_id
+            if (
+                upstream_key != INPUT_BLOCK_ID
+                and upstream_key not in context.in_flight
+                and context.state.latest(upstream_key) is None
+                and all(
+                    context.state.is_skipped(reader)
+                    for reader in plan.readers[upstream_key]
+                )
+            ):
+                self._skip(context, upstream_key)
+                self._release(context, upstream_key)
+
+    def _record(self, context: RunContext, block_output: BlockOutput) -> None:
+        context.state.append(block_output)
+        if self._checkpoints is not None:
+            self._checkpoints.append(context.app_run_id, block_output)
 
-        await current_block.outter_run(
-            self.current_output,
-            override_input=initial_input if current_block.key == "input" else None,
+    async def _run_dependencies(
+        self,
+        context: RunContext,
+        block: Block,
+        slots: tuple[DependencySlot, ...],
+    ) -> None:
+        if self._scheduler == "sequential":
+            for slot in slots:
+                if not self._is_dependency_resolved(context, block, slot):
+                    await self._run_until(context, slot.block_id)
+            return
+
+        pending = list(
+            dict.fromkeys(
+                slot.block_id
+                for slot in slots
+                if not self._is_dependency_resolved(context, block, slot)
+            )
+        )
+        tasks = [
+            asyncio.ensure_future(self._run_until(context, block_id))
+            for block_id in pending
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    def _is_dependency_resolved(
+        self, context: RunContext, block: Block, slot: DependencySlot
+    ) -> bool:
+        dep = slot.dependency
+        return dep.is_resolved(
+            context,
+            since=block.last_run_seq(context)
+            if dep.requires_rerun
+            else THE_START_OF_TIME_AND_SPACE,
         )
 
-        if not current_block.has_met_termination_condition(self.current_output):
-            await self._run_until(current_block.key)
+
+def _only_requires_skipped_blocks(
+    context: RunContext, slots: tuple[DependencySlot, ...]
+) -> bool:
+    required = [slot.block_id for slot in slots if slot.is_required]
+    return bool(required) and all(
+        context.state.is_skipped(block_id) for block_id in required
+    )
+
+
+async def _iterate(inputs: Iterable[dict] | AsyncIterable[dict]) -> AsyncIterator[dict]:
+    if isinstance(inputs, AsyncIterable):
+        async for item in inputs:
+            yield item
+    else:
+        for item in inputs:
+            yield item
 
 
 class AppExecutionError(Exception):
@@ -1,16 +1,45 @@
-from .base import Block, BlockBaseConfig, BlockExecutionError, BlockInitializationError
-from .function import Function
-from .http import Http
-from .identity import Identity
-from .input import Input
-from .output import Output
-from .template import Template
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from .base import (
+    Block,
+    BlockBaseConfig,
+    BlockExecutionError,
+    BlockInitializationError,
+    BlockRequestError,
+    BlockTimeoutError,
+    BlockValidationError,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .function import Function
+    from .http import Http
+    from .identity import Identity
+    from .input import Input
+    from .output import Output
+    from .template import Template
+
+# Blocks are imported on first access, so importing `scoutos.blocks` does not
+# import the dependencies of every block, e.g. `httpx` for `Http`.
+_LAZY_EXPORTS = {
+    "Function": ".function",
+    "Http": ".http",
+    "Identity": ".identity",
+    "Input": ".input",
+    "Output": ".output",
+    "Template": ".template",
+}
 
 __all__ = [
     "Block",
     "BlockBaseConfig",
     "BlockExecutionError",
     "BlockInitializationError",
+    "BlockRequestError",
+    "BlockTimeoutError",
+    "BlockValidationError",
     "Function",
     "Http",
     "Identity",
@@ -18,3 +47,12 @@ __all__ = [
     "Output",
     "Template",
 ]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        message = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(message)
+
+    return getattr(import_module(module, __name__), name)
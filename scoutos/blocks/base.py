@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from abc import ABC, ABCMeta, abstractmethod
-from dataclasses import dataclass
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     ClassVar,
@@ -11,15 +15,45 @@ from typing import (
 )
 from uuid import uuid4
 
-from typing_extensions import Required, TypedDict
+from typing_extensions import Required, Self, TypedDict
 
+from scoutos.blocks.registry import load_block_class
+from scoutos.cache import (
+    CacheBackend,
+    CacheKeyError,
+    create_cache_key,
+    get_default_cache,
+)
+from scoutos.constants import THE_START_OF_TIME_AND_SPACE
 from scoutos.dependencies.base import Dependency
-from scoutos.utils import get_current_timestamp
+from scoutos.retry import (
+    RETRYABLE_STATUS_CODES,
+    RetryPolicy,
+    backoff_delay,
+    parse_retry_after,
+)
+from scoutos.schema import SchemaValidationError, Validator, compile_schema
+from scoutos.timings import BlockTimings
+from scoutos.transport import get_default_transport
+from scoutos.utils import accepts_positional_args, format_timestamp_ns
+
+if TYPE_CHECKING:  # pragma: no cover
+    import httpx
+
+    from scoutos.condition import Condition
+    from scoutos.run_context import RunContext
+    from scoutos.transport import Transport
 
 RunInput = TypeVar("RunInput")
 RunOutput = TypeVar("RunOutput")
 
-RunUntil = Callable[[dict], bool]
+RunUntil = Callable[[dict], bool] | Callable[[dict, int], bool]
+
+_budget_deadline: ContextVar[float | None] = ContextVar(
+    "scoutos_budget_deadline", default=None
+)
+"""Value of `time.monotonic()` at which the block running in the current
+context is cancelled, if it has a time budget."""
 
 
 class BlockBaseConfig(TypedDict, total=False):
@@ -36,14 +70,52 @@ class BlockBaseConfig(TypedDict, total=False):
     """
 
     input_schema: dict[str, Any]
-    """JSON Schema for input"""
+    """JSON Schema for input, checked before the block runs. See
+    `scoutos.schema` for the supported keywords."""
 
     output_schema: dict[str, Any]
-    """JSON Schema for output"""
+    """JSON Schema for output, checked after the block runs."""
+
+    cache: CacheBackend | bool
+    """Opt-in memoization. When set, the block's output is stored under a hash
+    of its type, configuration and resolved input, and later runs with the
+    same input reuse it instead of running the block. `True` uses a shared
+    in-memory cache; pass a `CacheBackend` to choose the storage.
+
+    Keys are the same in every process. Configuration that cannot be hashed
+    deterministically, such as objects without a `repr` of their own, is
+    rejected unless `cache_version` is set, and runs whose input cannot be
+    hashed are not cached."""
+
+    cache_version: str
+    """Stands in for the configuration entries of a cached block that cannot
+    be hashed deterministically. Change it whenever their behaviour changes,
+    to invalidate the outputs cached so far."""
+
+    timeout: float
+    """If provided, the maximum number of seconds a single run of the block may
+    take before it is cancelled."""
+
+    retry: RetryPolicy
+    """If provided, the block runs again, after a backoff, when it fails with
+    a retryable `BlockRequestError`, e.g. on a 429 or 503 response or a lost
+    connection. Each attempt has its own `timeout`, but retries never extend
+    past the run's deadline."""
 
     run_until: RunUntil
     """If provided, this repersents a condition that while false, will cause the
-    block to re-execute."""
+    block to re-execute. It is called with the resolved dependencies and, if it
+    accepts a second argument, the number of times the block has run so far."""
+
+    when: Condition
+    """If provided, the block only runs if the condition is satisfied. It is
+    evaluated once the condition's own dependencies resolve, before any of the
+    block's dependencies run. Otherwise the block is skipped, along with the
+    blocks it reads that have not run and that only skipped blocks read, other
+    than the Input block. Skipped blocks are recorded in the run path.
+    Dependencies on a skipped block resolve to their `default_value`, or are
+    left out of the input, and blocks that only require skipped blocks are
+    skipped too."""
 
 
 @dataclass
@@ -52,11 +124,43 @@ class BlockOutput(Generic[RunOutput]):
 
     block_id: str
     block_run_id: str
-    block_run_start_ts: str
-    block_run_end_ts: str
     ok: bool
     output: RunOutput
 
+    seq: int = THE_START_OF_TIME_AND_SPACE
+    """Position of this output in its run, assigned when the output is
+    recorded. Outputs are ordered by it, never by their timestamps."""
+
+    started_at_ns: int = 0
+    """Wall clock time the block run started at, in nanoseconds since the
+    epoch. Only used to render `block_run_start_ts`."""
+
+    duration_ns: int = 0
+    """Time the block run took, measured with a monotonic clock."""
+
+    cached: bool = False
+    """True if the output was taken from the block's cache."""
+
+    timings: BlockTimings = field(default_factory=BlockTimings)
+    """How `duration_ns` splits into the phases of the block run."""
+
+    skipped: bool = False
+    """True if the block did not run because its `when` condition was not
+    satisfied, or it required the output of a skipped block. Skipped blocks
+    have no output."""
+
+    trimmed: bool = False
+    """True if `output` has been dropped to bound the memory used by the run,
+    keeping only the metadata. See `App(retention=...)`."""
+
+    @property
+    def block_run_start_ts(self) -> str:
+        return format_timestamp_ns(self.started_at_ns)
+
+    @property
+    def block_run_end_ts(self) -> str:
+        return format_timestamp_ns(self.started_at_ns + self.duration_ns)
+
 
 BLOCK_TYPE_ATTR = "TYPE"
 BLOCK_TYPE_KEY = "type"
@@ -84,8 +188,14 @@ class Block(ABC, Generic[RunInput, RunOutput], metaclass=BlockMeta):
 
     DEFAULT_MAX_RUNS = 10
 
+    OUTPUT_SCHEMA: ClassVar[dict[str, Any]] = {}
+    """JSON Schema of the output the block's implementation guarantees, used
+    when no `output_schema` is configured. It is trusted rather than checked
+    at runtime."""
+
     _initialized_with_super = False
     _is_base_class = True
+    _transport: Transport | None = None
 
     def __init__(self, config: BlockBaseConfig):
         self._initialized_with_super = True
@@ -94,16 +204,24 @@ class Block(ABC, Generic[RunInput, RunOutput], metaclass=BlockMeta):
             raise TypeError(message)
 
         self._config = config
-        self._output: list[BlockOutput[RunOutput]] = []
+        if self.cache is not None:
+            # Fail on configuration that could never be cached, rather than
+            # on every run.
+            self._cache_key(None)
+        self._input_validator = compile_schema(config.get("input_schema"))
+        self._output_validator = compile_schema(config.get("output_schema"))
 
     @classmethod
     def load(cls, config: dict) -> Block:
+        config = dict(config)
         block_type = config.pop(BLOCK_TYPE_KEY, None)
         if not block_type:
             message = f"Expected {BLOCK_TYPE_KEY} to be provided"
             raise TypeError(message)
 
-        block_cls = BlockMeta.REGISTERED_BLOCKS.get(block_type)
+        block_cls = BlockMeta.REGISTERED_BLOCKS.get(block_type) or load_block_class(
+            block_type
+        )
         if not block_cls:
             message = f"{block_type} is not registered"
             raise ValueError(message)
@@ -115,58 +233,95 @@ class Block(ABC, Generic[RunInput, RunOutput], metaclass=BlockMeta):
         return block_cls(config)
 
     @property
-    def depends(self) -> list[Dependency]:
-        return self._config.get("depends", [])
+    def cache(self) -> CacheBackend | None:
+        """The cache memoizing this block's outputs, if caching is enabled."""
+        cache = self._config.get("cache", False)
+        if cache is True:
+            return get_default_cache()
+
+        return cache if isinstance(cache, CacheBackend) else None
 
     @property
-    def has_exceeded_run_count(self) -> bool:
-        return self.run_count >= self.max_runs
+    def depends(self) -> list[Dependency]:
+        return self._config.get("depends", [])
 
     @property
     def key(self) -> str:
         """Key that uniquely identifies _this_ block."""
         return self._config["key"]
 
-    @property
-    def last_run_completed_at(self) -> str | None:
-        """Returns a string representation of a timestamp of when the last run
-        for this block was completed at."""
-        if len(self.output) == 0:
-            return None
-
-        return self.output[-1].block_run_end_ts
-
     @property
     def max_runs(self) -> int:
         return self._config.get("max_runs", self.DEFAULT_MAX_RUNS)
 
     @property
-    def output(self) -> list[BlockOutput[RunOutput]]:
-        return self._output
+    def timeout(self) -> float | None:
+        """The maximum number of seconds a single run of the block may take."""
+        return self._config.get("timeout")
 
     @property
-    def run_count(self) -> int:
-        return len(self._output)
+    def retry(self) -> RetryPolicy | None:
+        """The policy for running the block again after a transient failure."""
+        return self._config.get("retry")
 
     @property
     def run_until(self) -> RunUntil:
         return self._config.get("run_until", lambda _data: True)
 
-    def has_met_termination_condition(self, current_output: list[BlockOutput]) -> bool:
+    @property
+    def transport(self) -> Transport:
+        """The pooled HTTP clients the block sends requests through: those of
+        the App it belongs to, or the process-wide default ones."""
+        return self._transport or get_default_transport()
+
+    @transport.setter
+    def transport(self, transport: Transport) -> None:
+        self._transport = transport
+
+    @property
+    def when(self) -> Condition | None:
+        """The condition under which the block runs, if any."""
+        return self._config.get("when")
+
+    def has_exceeded_run_count(self, context: RunContext) -> bool:
+        return self.run_count(context) >= self.max_runs
+
+    def has_met_termination_condition(self, context: RunContext) -> bool:
         return (
-            not self.requires_rerun(current_output) or self.run_count >= self.max_runs
+            not self.requires_rerun(context) or self.run_count(context) >= self.max_runs
         )
 
-    def resolve_deps(self, block_output: list[BlockOutput]) -> dict:
-        return {dep.key: dep.resolve(block_output) for dep in self.depends}
+    def last_run_seq(self, context: RunContext) -> int:
+        """The sequence number of the latest output of this block in the given
+        run, or `THE_START_OF_TIME_AND_SPACE` if it has not run yet."""
+        last_output = context.state.latest(self.key)
+        if last_output is None:
+            return THE_START_OF_TIME_AND_SPACE
+
+        return last_output.seq
+
+    def run_count(self, context: RunContext) -> int:
+        """The number of times this block has run in the given run."""
+        return context.state.run_count(self.key)
+
+    def resolve_deps(self, context: RunContext) -> dict:
+        return {
+            dep.key: dep.resolve(context)
+            for dep in self.depends
+            if not dep.is_skipped(context)
+        }
 
-    def requires_rerun(self, current_output: list[BlockOutput]) -> bool:
-        data = self.resolve_deps(current_output)
-        return not self.run_until(data)
+    def requires_rerun(self, context: RunContext) -> bool:
+        data = self.resolve_deps(context)
+        run_until = self.run_until
+        if accepts_positional_args(run_until, 2):
+            return not run_until(data, self.run_count(context))  # type: ignore[call-arg]
+
+        return not run_until(data)  # type: ignore[call-arg]
 
     async def outter_run(
         self,
-        current_state: list[BlockOutput],
+        context: RunContext,
         *,
         override_input: dict | None = None,
     ) -> BlockOutput[RunOutput]:
@@ -178,24 +333,149 @@ class Block(ABC, Generic[RunInput, RunOutput], metaclass=BlockMeta):
         if not self._initialized_with_super:
             raise BlockInitializationError
 
-        block_run_start_ts = get_current_timestamp()
+        started_at_ns = time.time_ns()
+        started_at_perf_ns = time.perf_counter_ns()
         block_run_id = str(uuid4())
-        block_input = override_input or self.resolve_deps(current_state)
-        output = await self.run(block_input)
-        block_run_end_ts = get_current_timestamp()
-
-        run_output = BlockOutput(
+        block_input = override_input or self.resolve_deps(context)
+        resolved_at_perf_ns = time.perf_counter_ns()
+        run_ns = 0
+        retries = 0
+        backoff_ns = 0
+        if context.validate_schemas:
+            self._validate("input", self._input_validator, block_input)
+
+        cache = self.cache
+        cache_key = None
+        cached_output = None
+        if cache is not None:
+            cache_key = self._cache_key(block_input)
+            if cache_key is not None:
+                cached_output = cache.get(cache_key)
+
+        if cached_output is not None:
+            output = cached_output
+        else:
+            run_started_at_perf_ns = time.perf_counter_ns()
+            output, retries, backoff_ns = await self._run_with_retries(
+                context, block_input
+            )
+            run_ns = time.perf_counter_ns() - run_started_at_perf_ns
+            if context.validate_schemas:
+                self._validate("output", self._output_validator, output)
+            if cache is not None and cache_key is not None:
+                cache.set(cache_key, output)
+
+        duration_ns = time.perf_counter_ns() - started_at_perf_ns
+        resolve_ns = resolved_at_perf_ns - started_at_perf_ns
+
+        return BlockOutput(
             ok=True,
             block_id=self.key,
             block_run_id=block_run_id,
-            block_run_start_ts=block_run_start_ts,
-            block_run_end_ts=block_run_end_ts,
             output=output,
+            started_at_ns=started_at_ns,
+            duration_ns=duration_ns,
+            cached=cached_output is not None,
+            timings=BlockTimings(
+                resolve_ns=resolve_ns,
+                run_ns=run_ns,
+                overhead_ns=duration_ns - resolve_ns - run_ns,
+                retries=retries,
+                backoff_ns=backoff_ns,
+            ),
         )
 
-        self._output.append(run_output)
+    def _cache_key(self, block_input: dict | None) -> str | None:
+        """The key the output for `block_input` is cached under, or `None`
+        if the input cannot be hashed deterministically."""
+        block_type = getattr(self, BLOCK_TYPE_ATTR, type(self).__name__)
+        try:
+            return create_cache_key(block_type, dict(self._config), block_input)
+        except CacheKeyError:
+            if block_input is None:
+                raise
+            return None
 
-        return run_output
+    def _validate(self, kind: str, validator: Validator | None, value: Any) -> None:  # noqa: ANN401
+        if validator is None:
+            return
+
+        try:
+            validator(value)
+        except SchemaValidationError as validation_error:
+            raise BlockValidationError(
+                self.key, kind, validation_error
+            ) from validation_error
+
+    async def _run_with_retries(
+        self, context: RunContext, block_input: dict
+    ) -> tuple[RunOutput, int, int]:
+        """Run the block within its budget, trying again according to its
+        `retry` policy. Returns the output, the number of retries and the
+        nanoseconds spent backing off."""
+        policy = self.retry
+        attempt = 1
+        backoff_ns = 0
+        while True:
+            try:
+                output = await self._run_within_budget(context, block_input)
+            except BlockRequestError as request_error:
+                delay = (
+                    backoff_delay(policy, attempt, request_error.retry_after)
+                    if policy is not None and request_error.retryable
+                    else None
+                )
+                remaining_time = context.remaining_time()
+                if delay is None or (
+                    remaining_time is not None and delay >= remaining_time
+                ):
+                    raise
+
+                backoff_started_at_perf_ns = time.perf_counter_ns()
+                await asyncio.sleep(delay)
+                backoff_ns += time.perf_counter_ns() - backoff_started_at_perf_ns
+                attempt += 1
+            else:
+                return output, attempt - 1, backoff_ns
+
+    async def _run_within_budget(
+        self, context: RunContext, block_input: dict
+    ) -> RunOutput:
+        """Run the block, cancelling it if it exceeds its own `timeout` or the
+        time remaining before the run's deadline, whichever is shorter."""
+        budgets = [
+            budget
+            for budget in (self.timeout, context.remaining_time())
+            if budget is not None
+        ]
+        if not budgets:
+            return await self.run(block_input)
+
+        budget = min(budgets)
+        deadline = time.monotonic() + budget
+        token = _budget_deadline.set(deadline)
+        try:
+            return await asyncio.wait_for(self.run(block_input), max(budget, 0))
+        except asyncio.TimeoutError as timeout_error:
+            # The event loop may fire the timeout up to a clock tick early. A
+            # timeout raised by the block itself before its deadline is not
+            # the block running out of time.
+            resolution = time.get_clock_info("monotonic").resolution
+            if time.monotonic() + resolution < deadline:
+                raise
+            raise BlockTimeoutError(self.key, budget) from timeout_error
+        finally:
+            _budget_deadline.reset(token)
+
+    def remaining_budget(self) -> float | None:
+        """Seconds left before the current run of the block is cancelled, or
+        `None` without a time budget. Meant to be called from `run`, to bound
+        the block's own I/O, e.g. as the timeout of a client."""
+        deadline = _budget_deadline.get()
+        if deadline is None:
+            return None
+
+        return max(deadline - time.monotonic(), 0)
 
     @property
     def input_schema(self) -> dict[str, Any]:
@@ -206,7 +486,7 @@ class Block(ABC, Generic[RunInput, RunOutput], metaclass=BlockMeta):
     def output_schema(self) -> dict[str, Any]:
         """Returns valid JSON Schema representing the output generated by the
         run method"""
-        return self._config.get("output_schema", {})
+        return self._config.get("output_schema", self.OUTPUT_SCHEMA)
 
     @abstractmethod
     async def run(self, run_input: dict) -> RunOutput:
@@ -217,6 +497,56 @@ class BlockExecutionError(Exception):
     """Raised when a block raises during execution"""
 
 
+class BlockTimeoutError(BlockExecutionError):
+    """Raised when a block exceeds its time budget and has been cancelled."""
+
+    def __init__(self, block_id: str, budget: float):
+        self.block_id = block_id
+        self.budget = budget
+        message = f"Block {block_id} exceeded its time budget of {budget:.3f}s"
+        super().__init__(message)
+
+
+class BlockRequestError(BlockExecutionError):
+    """Raised when a request sent by a block fails. It is retryable when no
+    response was received, or the response status describes a transient
+    failure."""
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        status_code: int | None = None,
+        retry_after: float | None = None,
+    ):
+        self.status_code = status_code
+        self.retry_after = retry_after
+        super().__init__(message)
+
+    @property
+    def retryable(self) -> bool:
+        return self.status_code is None or self.status_code in RETRYABLE_STATUS_CODES
+
+    @classmethod
+    def from_response(cls, message: str, response: httpx.Response) -> Self:
+        return cls(
+            message,
+            status_code=response.status_code,
+            retry_after=parse_retry_after(response.headers.get("Retry-After")),
+        )
+
+
+class BlockValidationError(BlockExecutionError):
+    """Raised when the input or output of a block does not match its schema."""
+
+    def __init__(self, block_id: str, kind: str, error: SchemaValidationError):
+        self.block_id = block_id
+        self.kind = kind
+        self.error = error
+        message = f"The {kind} of block {block_id} does not match its schema: {error}"
+        super().__init__(message)
+
+
 class BlockInitializationError(Exception):
     """This is raised when blocks have not been initialized correctly."""
 
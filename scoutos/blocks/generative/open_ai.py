@@ -1,7 +1,8 @@
-from openai import OpenAI as OGOpenAI
+from openai import NOT_GIVEN, APIConnectionError, APIStatusError, AsyncOpenAI
 from typing_extensions import Required
 
-from scoutos.blocks import BlockBaseConfig
+from scoutos.blocks import BlockBaseConfig, BlockRequestError
+from scoutos.retry import parse_retry_after
 
 from .base import Generative
 from .types import GenerativeOutput
@@ -23,12 +24,34 @@ class OpenAI(Generative):
         self._model = config["model"]
 
     async def run(self, run_input: dict) -> GenerativeOutput:
-        client = OGOpenAI(api_key=self._api_key)
-        messages = run_input["messages"]
-        response = client.chat.completions.create(
-            model=self._model,
-            messages=messages,
+        # With a retry policy, the engine retries on its own, so the client
+        # does not multiply the attempts.
+        client = (
+            AsyncOpenAI(api_key=self._api_key)
+            if self.retry is None
+            else AsyncOpenAI(api_key=self._api_key, max_retries=0)
         )
+        messages = run_input["messages"]
+        budget = self.remaining_budget()
+        try:
+            async with client:
+                response = await client.chat.completions.create(
+                    model=self._model,
+                    messages=messages,
+                    timeout=NOT_GIVEN if budget is None else budget,
+                )
+        except APIStatusError as status_error:
+            message = f"OpenAI request failed: {status_error.message}"
+            raise BlockRequestError(
+                message,
+                status_code=status_error.status_code,
+                retry_after=parse_retry_after(
+                    status_error.response.headers.get("Retry-After")
+                ),
+            ) from status_error
+        except APIConnectionError as connection_error:
+            message = f"OpenAI request failed: {connection_error.message}"
+            raise BlockRequestError(message) from connection_error
 
         return {
             "id": response.id,
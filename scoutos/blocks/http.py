@@ -1,12 +1,28 @@
 from __future__ import annotations
 
-from typing import Literal
+import asyncio
+import json
+import tempfile
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterator, Literal
 
 import httpx
 import jinja2
 from typing_extensions import Required
 
-from scoutos.blocks.base import Block, BlockBaseConfig
+from scoutos.blocks.base import (
+    Block,
+    BlockBaseConfig,
+    BlockExecutionError,
+    BlockRequestError,
+)
+from scoutos.cache import (
+    CacheBackend,
+    CachedResponse,
+    create_http_cache_key,
+    get_default_http_cache,
+)
+from scoutos.transport import ResponseTooLargeError
 
 ALLOWED_METHOD_VERBS = Literal["GET", "POST"]
 
@@ -14,7 +30,33 @@ ALLOWED_METHOD_VERBS = Literal["GET", "POST"]
 class HttpConfig(BlockBaseConfig, total=False):
     headers: dict[str, str] | None
     method: Literal["get", "post"]
-    response_type: Literal["json", "text"]
+    response_type: Literal["json", "text", "ndjson", "bytes", "file"]
+    """How the response body is returned as `result`:
+
+    - `json`, the default, the decoded JSON document.
+    - `text`, the body as a string.
+    - `ndjson`, the list of records of a newline-delimited JSON body, each
+      decoded as soon as its line has been received.
+    - `bytes`, the raw body.
+    - `file`, the body streamed to a temporary file, which is never held in
+      memory as a whole. `result` holds its `path`, `size` and
+      `content_type`; the file is left for the caller to remove. See
+      `iter_ndjson` to read NDJSON records from it one at a time.
+    """
+
+    max_body_size: int | None
+    """The largest response body, in bytes, the block accepts before failing.
+    By default, bodies of any size are accepted."""
+
+    http_cache: CacheBackend | bool
+    """Opt-in caching of GET responses, as directed by their `Cache-Control`
+    and `Expires` headers. Fresh responses are reused without a request, and
+    stale ones are revalidated with `If-None-Match` / `If-Modified-Since`, so
+    an unchanged resource answers `304 Not Modified` and its decoded `result`
+    is reused. `True` uses a shared in-memory LRU cache; pass a
+    `CacheBackend`, e.g. a `SQLiteCache`, to choose the storage. Responses
+    with `response_type="file"` are never cached."""
+
     url: Required[str]
 
 
@@ -26,18 +68,169 @@ class Http(Block):
         self._headers = config.get("headers", {})
         self._method = config.get("method", "get")
         self._response_type = config.get("response_type", "json")
+        self._max_body_size = config.get("max_body_size")
         self._url = jinja2.Template(config["url"])
+        self._http_cache = config.get("http_cache", False)
+
+    @property
+    def http_cache(self) -> CacheBackend | None:
+        """The cache of the block's GET responses, if HTTP caching applies."""
+        if self._method != "get" or self._response_type == "file":
+            return None
+
+        if self._http_cache is True:
+            return get_default_http_cache()
+
+        return self._http_cache if isinstance(self._http_cache, CacheBackend) else None
 
     async def run(self, run_input: dict) -> dict:
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
+        url = self._url.render(run_input)
+        request = f"{self._method.upper()} {url}"
+        headers = dict(self._headers or {})
+
+        http_cache = self.http_cache
+        cache_key = None
+        cached: CachedResponse | None = None
+        entry: CachedResponse | None = None
+        if http_cache is not None:
+            cache_key = create_http_cache_key(url, headers, self._response_type)
+            cached = http_cache.get(cache_key)
+            if cached is not None and cached.is_fresh:
+                return {"result": cached.value}
+            if cached is not None:
+                headers.update(cached.validators)
+
+        # Files are streamed to disk, and are never read in full to be shared
+        # with identical requests in flight.
+        extensions = (
+            {"coalesce": False}
+            if self._response_type == "file"
+            else {"max_body_size": self._max_body_size}
+        )
+        try:
+            async with self.transport.client(url).stream(
                 self._method,
-                self._url.render(run_input),
-                data=run_input,
-                headers=self._headers,
-            )
+                url,
+                data=run_input if self._method == "post" else None,
+                headers=headers,
+                extensions=extensions,
+            ) as response:
+                if (
+                    cached is not None
+                    and response.status_code == httpx.codes.NOT_MODIFIED
+                ):
+                    result = cached.value
+                    entry = cached.revalidated(response.headers)
+                elif response.is_error:
+                    message = f"{request} failed with {response.status_code}"
+                    raise BlockRequestError.from_response(message, response)
+                else:
+                    result = await self._read(request, response)
+                    if (
+                        http_cache is not None
+                        and response.status_code == httpx.codes.OK
+                    ):
+                        entry = CachedResponse.from_headers(result, response.headers)
+        except ResponseTooLargeError as too_large:
+            raise HttpResponseTooLargeError(
+                request, too_large.max_body_size
+            ) from too_large
+        except httpx.TransportError as transport_error:
+            message = f"{request} failed: {transport_error}"
+            raise BlockRequestError(message) from transport_error
+
+        if http_cache is not None and cache_key is not None and entry is not None:
+            http_cache.set(cache_key, entry)
+
+        return {"result": result}
+
+    async def _read(self, request: str, response: httpx.Response) -> Any:  # noqa: ANN401
+        chunks = self._iter_body(request, response)
+        if self._response_type == "file":
+            return await _download(chunks, response)
+
+        if self._response_type == "ndjson":
+            return [record async for record in _decode_ndjson(chunks)]
+
+        body = bytearray()
+        async for chunk in chunks:
+            body += chunk
+
+        if self._response_type == "bytes":
+            return bytes(body)
 
         if self._response_type == "json":
-            return {"result": response.json()}
+            return json.loads(body)
+
+        return body.decode(response.encoding or "utf-8", errors="replace")
+
+    async def _iter_body(
+        self, request: str, response: httpx.Response
+    ) -> AsyncIterator[bytes]:
+        """The chunks of the response body, failing as soon as the body is
+        known to exceed `max_body_size`."""
+        max_body_size = self._max_body_size
+        if max_body_size is None:
+            async for chunk in response.aiter_bytes():
+                yield chunk
+            return
+
+        content_length = response.headers.get("Content-Length", "")
+        if content_length.isdigit() and int(content_length) > max_body_size:
+            raise HttpResponseTooLargeError(request, max_body_size)
+
+        size = 0
+        async for chunk in response.aiter_bytes():
+            size += len(chunk)
+            if size > max_body_size:
+                raise HttpResponseTooLargeError(request, max_body_size)
+            yield chunk
+
+
+def iter_ndjson(path: str | Path) -> Iterator[Any]:
+    """Read the records of a newline-delimited JSON file one at a time, e.g.
+    one downloaded with `response_type="file"`."""
+    with Path(path).open("rb") as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+async def _decode_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+    pending = b""
+    async for chunk in chunks:
+        *lines, pending = (pending + chunk).split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield json.loads(line)
+
+    if pending.strip():
+        yield json.loads(pending)
+
+
+async def _download(chunks: AsyncIterator[bytes], response: httpx.Response) -> dict:
+    size = 0
+    with tempfile.NamedTemporaryFile(prefix="scoutos-http-", delete=False) as file:
+        try:
+            async for chunk in chunks:
+                await asyncio.to_thread(file.write, chunk)
+                size += len(chunk)
+        except BaseException:
+            file.close()
+            await asyncio.to_thread(Path(file.name).unlink)
+            raise
+
+    return {
+        "path": file.name,
+        "size": size,
+        "content_type": response.headers.get("Content-Type"),
+    }
+
+
+class HttpResponseTooLargeError(BlockExecutionError):
+    """Raised when a response body exceeds the `max_body_size` of its block."""
 
-        return {"result": response.text}
+    def __init__(self, request: str, max_body_size: int):
+        self.max_body_size = max_body_size
+        message = f"{request} returned a body larger than {max_body_size} bytes"
+        super().__init__(message)
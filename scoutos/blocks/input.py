@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any
+
 from .base import Block, BlockBaseConfig
 
 INPUT_BLOCK_ID = "input"
@@ -17,5 +19,11 @@ class Input(Block):
         config["key"] = INPUT_BLOCK_ID
         super().__init__(config)
 
+    @property
+    def output_schema(self) -> dict[str, Any]:
+        """The block outputs its input, so unless configured otherwise its
+        output has the shape of its input."""
+        return self._config.get("output_schema", self.input_schema)
+
     async def run(self, run_input: dict) -> dict:
         return run_input
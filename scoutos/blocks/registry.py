@@ -0,0 +1,71 @@
+"""Where to find the class of each block type, without importing it.
+
+Block classes register themselves when their module is imported, so an App
+could only use the block types that happened to be imported already. The
+registry maps every block type shipped with scoutos to the class that
+implements it, and `load_block_class` imports that class on first use. An
+App therefore only pays for the dependencies of the blocks it uses: `openai`
+for `generative_openai`, `httpx` for `scoutos_http`, and so on.
+
+Other packages can provide block types through the `scoutos.blocks` entry
+point group, the name of each entry point being the block type:
+
+    [tool.poetry.plugins."scoutos.blocks"]
+    "acme:search" = "acme.blocks:Search"
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from importlib import import_module
+from importlib.metadata import EntryPoint, entry_points
+from types import MappingProxyType
+from typing import Any
+
+ENTRY_POINT_GROUP = "scoutos.blocks"
+
+BUILTIN_BLOCKS = MappingProxyType(
+    {
+        "generative_openai": "scoutos.blocks.generative.open_ai:OpenAI",
+        "scoutos:slack:get_channels": "scoutos.blocks.slack.get_channels:GetChannels",
+        "scoutos:slack:get_messages": "scoutos.blocks.slack.get_messages:GetMessages",
+        "scoutos:slack:get_thread": "scoutos.blocks.slack.get_thread:GetThread",
+        "scoutos:slack:get_user_info": "scoutos.blocks.slack.get_user_info:GetUserInfo",
+        "scoutos_function": "scoutos.blocks.function:Function",
+        "scoutos_http": "scoutos.blocks.http:Http",
+        "scoutos_identity": "scoutos.blocks.identity:Identity",
+        "scoutos_input": "scoutos.blocks.input:Input",
+        "scoutos_output": "scoutos.blocks.output:Output",
+        "scoutos_template": "scoutos.blocks.template:Template",
+    }
+)
+"""Block types shipped with scoutos, mapped to `module:ClassName`."""
+
+
+def load_block_class(block_type: str) -> Any:  # noqa: ANN401
+    """Import the class implementing `block_type`, looking at the blocks
+    shipped with scoutos first and installed entry points second. Returns
+    `None` if no class provides the block type."""
+    target = BUILTIN_BLOCKS.get(block_type)
+    if target is not None:
+        module_name, _, class_name = target.partition(":")
+        return getattr(import_module(module_name), class_name)
+
+    entry_point = _entry_points().get(block_type)
+    if entry_point is not None:
+        return entry_point.load()
+
+    return None
+
+
+def block_types() -> list[str]:
+    """Every block type that can be loaded, without importing any of them."""
+    return sorted({*BUILTIN_BLOCKS, *_entry_points()})
+
+
+@lru_cache(maxsize=1)
+def _entry_points() -> dict[str, EntryPoint]:
+    return {
+        entry_point.name: entry_point
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP)
+    }
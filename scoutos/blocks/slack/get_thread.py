@@ -5,7 +5,7 @@ from typing import Literal
 import httpx
 from pydantic import BaseModel, ValidationError
 
-from scoutos.blocks import BlockExecutionError
+from scoutos.blocks import BlockExecutionError, BlockRequestError
 
 from .base import Slack
 from .types import Message, ResponseMetadata  # noqa: TCH001
@@ -60,23 +60,28 @@ class GetThread(Slack):
         params = validated_input.model_dump()
         url = f"{self._http_api_url}/conversations.replies"
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(url, headers=headers, params=params)
-                response.raise_for_status()
+        client = self.transport.client(url)
+        try:
+            response = await client.get(url, headers=headers, params=params)
+            response.raise_for_status()
 
-                data = response.json()
+            data = response.json()
 
-                if not data.get("ok"):
-                    message = data.get("error", "an unknown exception occurred")
-                    raise BlockExecutionError(message)
+            if not data.get("ok"):
+                message = data.get("error", "an unknown exception occurred")
+                raise BlockExecutionError(message)
 
-                return GetThreadOutput.model_validate(data)
+            return GetThreadOutput.model_validate(data)
 
-            except ValidationError as validation_error:
-                message = "output failed data validation"
-                raise BlockExecutionError(message) from validation_error
+        except ValidationError as validation_error:
+            message = "output failed data validation"
+            raise BlockExecutionError(message) from validation_error
 
-            except httpx.HTTPStatusError as http_status_error:
-                message = "http request failed"
-                raise BlockExecutionError(message) from http_status_error
+        except httpx.HTTPStatusError as http_status_error:
+            message = "http request failed"
+            raise BlockRequestError.from_response(
+                message, http_status_error.response
+            ) from http_status_error
+        except httpx.TransportError as transport_error:
+            message = "http request failed"
+            raise BlockRequestError(message) from transport_error
@@ -2,7 +2,7 @@ import httpx
 from pydantic import TypeAdapter, ValidationError
 from typing_extensions import TypedDict
 
-from scoutos.blocks import BlockExecutionError
+from scoutos.blocks import BlockExecutionError, BlockRequestError
 
 from .base import Slack
 
@@ -37,22 +37,27 @@ class GetUserInfo(Slack):
         params = {"user": validated_input["user_id"]}
         url = f"{self._http_api_url}/users.info"
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(url, headers=headers, params=params)
-                response.raise_for_status()
-
-                data = response.json()
-
-                if not data.get("ok"):
-                    message = data.get("error", "An unknown exception occurred")
-                    raise BlockExecutionError(message)
-
-                return output_adapter.validate_python(data.get("user", {}))
-
-            except ValidationError as validation_error:
-                message = "output failed data validation"
-                raise BlockExecutionError(message) from validation_error
-            except httpx.HTTPStatusError as http_status_error:
-                message = "http request failed"
-                raise BlockExecutionError(message) from http_status_error
+        client = self.transport.client(url)
+        try:
+            response = await client.get(url, headers=headers, params=params)
+            response.raise_for_status()
+
+            data = response.json()
+
+            if not data.get("ok"):
+                message = data.get("error", "An unknown exception occurred")
+                raise BlockExecutionError(message)
+
+            return output_adapter.validate_python(data.get("user", {}))
+
+        except ValidationError as validation_error:
+            message = "output failed data validation"
+            raise BlockExecutionError(message) from validation_error
+        except httpx.HTTPStatusError as http_status_error:
+            message = "http request failed"
+            raise BlockRequestError.from_response(
+                message, http_status_error.response
+            ) from http_status_error
+        except httpx.TransportError as transport_error:
+            message = "http request failed"
+            raise BlockRequestError(message) from transport_error
@@ -1,3 +1,5 @@
+from typing import Any, ClassVar
+
 from jinja2 import Template as JinjaTemplate
 from typing_extensions import Required
 
@@ -12,6 +14,12 @@ class TemplateConfig(BlockBaseConfig):
 class Template(Block):
     TYPE = "scoutos_template"
 
+    OUTPUT_SCHEMA: ClassVar[dict[str, Any]] = {
+        "type": "object",
+        "required": ["result"],
+        "properties": {"result": {"type": "string"}},
+    }
+
     def __init__(self, config: TemplateConfig):
         super().__init__(config)
         self._template = JinjaTemplate(config["template"])
@@ -0,0 +1,19 @@
+from .base import CacheBackend, CacheStats
+from .http import CachedResponse, create_http_cache_key, get_default_http_cache
+from .key import CacheKeyError, create_cache_key, create_snapshot_key
+from .memory import MemoryCache, get_default_cache
+from .sqlite import SQLiteCache
+
+__all__ = [
+    "CacheBackend",
+    "CacheKeyError",
+    "CacheStats",
+    "CachedResponse",
+    "MemoryCache",
+    "SQLiteCache",
+    "create_cache_key",
+    "create_http_cache_key",
+    "create_snapshot_key",
+    "get_default_cache",
+    "get_default_http_cache",
+]
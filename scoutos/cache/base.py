@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class CacheStats:
+    """Hit and miss counters of a cache backend."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CacheBackend(ABC):
+    """Storage for memoized block outputs, keyed by content hash.
+
+    `None` is used to signal a miss, so it is never stored.
+    """
+
+    def __init__(self):
+        self._stats = CacheStats()
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._stats
+
+    def get(self, key: str) -> Any:  # noqa: ANN401
+        """Return the value stored under `key`, or `None` on a miss."""
+        value = self._get(key)
+        if value is None:
+            self._stats.misses += 1
+        else:
+            self._stats.hits += 1
+
+        return value
+
+    def set(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Store `value` under `key`, replacing any previous value."""
+        if value is not None:
+            self._set(key, value)
+
+    @abstractmethod
+    def _get(self, key: str) -> Any:  # noqa: ANN401
+        """Look up `key` without updating the stats."""
+
+    @abstractmethod
+    def _set(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Store `value`, which is never `None`, under `key`."""
@@ -0,0 +1,154 @@
+"""Caching of HTTP responses according to their `Cache-Control` and `Expires`
+headers, as a private cache would.
+
+The decoded response is stored along with its validators, so a fresh entry is
+served without a request, and a stale one is revalidated with a conditional
+request: a `304 Not Modified` answer reuses the stored value without
+downloading or decoding the body again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Any, Mapping
+
+from .memory import MemoryCache
+
+STORED_HEADERS = ("Cache-Control", "Expires", "ETag", "Last-Modified")
+"""Response headers kept with a cached value, to revalidate it later."""
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A decoded response body and what is needed to reuse it."""
+
+    value: Any
+    headers: Mapping[str, str]
+    """The `STORED_HEADERS` of the response the value was decoded from."""
+
+    expires_at: float
+    """Wall clock time, in seconds since the epoch, until which the value can
+    be used without revalidation."""
+
+    @classmethod
+    def from_headers(
+        cls,
+        value: Any,  # noqa: ANN401
+        headers: Mapping[str, str],
+    ) -> CachedResponse | None:
+        """The entry for a response with the given headers, or `None` if the
+        response may not be stored or could never be reused."""
+        directives = parse_cache_control(headers.get("Cache-Control"))
+        if "no-store" in directives:
+            return None
+
+        entry = cls(
+            value=value,
+            headers={
+                name: headers[name] for name in STORED_HEADERS if headers.get(name)
+            },
+            expires_at=time.time() + freshness_lifetime(headers, directives),
+        )
+        if not entry.is_fresh and not entry.validators:
+            return None
+
+        return entry
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.expires_at > time.time()
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """The headers that make a request conditional on the entry being
+        outdated."""
+        validators = {}
+        if "ETag" in self.headers:
+            validators["If-None-Match"] = self.headers["ETag"]
+        if "Last-Modified" in self.headers:
+            validators["If-Modified-Since"] = self.headers["Last-Modified"]
+
+        return validators
+
+    def revalidated(self, headers: Mapping[str, str]) -> CachedResponse | None:
+        """The entry updated with the headers of a `304 Not Modified`
+        response, which replace those stored with the value."""
+        updated = dict(self.headers)
+        for name in (*STORED_HEADERS, "Age", "Date"):
+            value = headers.get(name)
+            if value:
+                updated[name] = value
+
+        return CachedResponse.from_headers(self.value, updated)
+
+
+def parse_cache_control(value: str | None) -> dict[str, str | None]:
+    """The directives of a `Cache-Control` header, by lowercased name."""
+    directives: dict[str, str | None] = {}
+    for directive in (value or "").split(","):
+        name, _, argument = directive.partition("=")
+        name = name.strip().lower()
+        if name:
+            directives[name] = argument.strip().strip('"') or None
+
+    return directives
+
+
+def freshness_lifetime(
+    headers: Mapping[str, str], directives: Mapping[str, str | None]
+) -> float:
+    """Seconds a response remains fresh from now, according to `max-age` or
+    `Expires`, less its `Age`. Without either, or with `no-cache`, a response
+    is stale immediately and has to be revalidated before each use."""
+    if "no-cache" in directives:
+        return 0
+
+    max_age = directives.get("max-age")
+    if max_age is not None:
+        lifetime = float(max_age) if max_age.isdigit() else 0
+    else:
+        expires = _parse_http_date(headers.get("Expires"))
+        if expires is None:
+            return 0
+
+        date = _parse_http_date(headers.get("Date"))
+        lifetime = expires - (date if date is not None else time.time())
+
+    age = headers.get("Age", "")
+    return max(lifetime - (float(age) if age.isdigit() else 0), 0)
+
+
+def create_http_cache_key(
+    url: str, headers: Mapping[str, str] | None, response_type: str
+) -> str:
+    """Key of the cached response to a GET request, which depends on how the
+    body is decoded as well as on the request itself."""
+    payload = json.dumps(
+        ["http", url, dict(headers or {}), response_type],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _parse_http_date(value: str | None) -> float | None:
+    if not value:
+        return None
+
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=1)
+def get_default_http_cache() -> MemoryCache:
+    """The process-wide cache used by Http blocks configured with
+    `http_cache: true`."""
+    return MemoryCache()
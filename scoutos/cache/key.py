@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+from types import BuiltinFunctionType, CodeType, FunctionType
+from typing import Any
+
+from pydantic import BaseModel
+
+from scoutos.utils import get_package_version
+
+NON_SEMANTIC_CONFIG_KEYS = frozenset(
+    {
+        "cache",
+        "depends",
+        "http_cache",
+        "input_schema",
+        "key",
+        "max_runs",
+        "output_schema",
+        "retry",
+        "run_until",
+        "timeout",
+        "when",
+    }
+)
+"""Config entries that do not change what a block outputs for a given input.
+The dependencies only matter through the input they resolve to."""
+
+
+def create_cache_key(block_type: str, config: dict, block_input: Any) -> str:  # noqa: ANN401
+    """Return a content hash identifying a block run.
+
+    Two runs share a key when they are of the same block type, with the same
+    configuration, given the same input. Keys are stable across processes, so
+    values that cannot be fingerprinted deterministically raise
+    `CacheKeyError`, unless they are configuration entries and the config
+    sets a `cache_version` to stand in for them.
+    """
+    semantic_config = {}
+    for key, value in config.items():
+        if key in NON_SEMANTIC_CONFIG_KEYS:
+            continue
+        try:
+            semantic_config[key] = _encode(value)
+        except CacheKeyError:
+            if "cache_version" not in config:
+                raise
+
+    payload = _encode([block_type, semantic_config, _encode(block_input)])
+
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def create_snapshot_key(contents: bytes, suffix: str) -> str:
+    """Return a content hash identifying an App config file. The scoutos
+    version is part of the key, so upgrading invalidates every snapshot."""
+    header = f"{_code_version()}:{suffix}:".encode()
+    return hashlib.sha256(header + contents).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _code_version() -> str:
+    """The installed scoutos version or, when running from a source checkout
+    where it is unknown, the time its sources were last modified, so that
+    editing the blocks invalidates the snapshots of their configs."""
+    version = get_package_version()
+    if version != "unknown":
+        return version
+
+    package = Path(__file__).parent.parent
+    modified_ns = max(path.stat().st_mtime_ns for path in package.rglob("*.py"))
+    return f"{version}-{modified_ns}"
+
+
+def _encode(value: Any) -> str:  # noqa: ANN401
+    return json.dumps(
+        value, default=_fingerprint, sort_keys=True, separators=(",", ":")
+    )
+
+
+def _fingerprint(value: Any) -> Any:  # noqa: ANN401
+    """Stand-ins for values JSON cannot encode."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (set, frozenset)):
+        return sorted(_encode(item) for item in value)
+    if isinstance(value, bytes):
+        return hashlib.sha256(value).hexdigest()
+    if isinstance(value, (type, BuiltinFunctionType)):
+        return f"{value.__module__}.{value.__qualname__}"
+    if isinstance(value, FunctionType):
+        return _fingerprint_function(value)
+    # The default `repr` includes the address of the object, which differs
+    # between processes.
+    if type(value).__repr__ is not object.__repr__ and not callable(value):
+        return f"{type(value).__qualname__}:{value!r}"
+
+    message = (
+        f"{type(value).__qualname__} values cannot be fingerprinted deterministically"
+    )
+    raise CacheKeyError(message)
+
+
+def _fingerprint_function(fn: FunctionType) -> str:
+    """Identify a function by its name, its code, and the values it closes
+    over or defaults to, so lambdas built by the same factory with different
+    arguments do not collide."""
+    try:
+        closure = [cell.cell_contents for cell in fn.__closure__ or ()]
+    except ValueError as empty_cell:
+        message = f"{fn.__qualname__} closes over an unassigned variable"
+        raise CacheKeyError(message) from empty_cell
+
+    digest = hashlib.sha256(_fingerprint_code(fn.__code__).encode())
+    digest.update(_encode([closure, fn.__defaults__, fn.__kwdefaults__]).encode())
+
+    return f"{fn.__module__}.{fn.__qualname__}:{digest.hexdigest()}"
+
+
+def _fingerprint_code(code: CodeType) -> str:
+    """Hash the bytecode and constants of `code`, recursing into the code of
+    nested functions and comprehensions, whose `repr` is not stable."""
+    digest = hashlib.sha256(code.co_code)
+    digest.update(_encode(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            digest.update(_fingerprint_code(const).encode())
+        else:
+            digest.update(_encode(const).encode())
+
+    return digest.hexdigest()
+
+
+class CacheKeyError(ValueError):
+    """Raised when a value has no fingerprint that is the same in every
+    process, e.g. an object without a `repr` of its own."""
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any
+
+from .base import CacheBackend
+
+
+class MemoryCache(CacheBackend):
+    """An in-process LRU cache with an optional time to live.
+
+    Values are stored by reference, so blocks sharing a cache should not
+    mutate their inputs.
+    """
+
+    DEFAULT_MAX_SIZE = 1024
+
+    def __init__(self, *, max_size: int = DEFAULT_MAX_SIZE, ttl: float | None = None):
+        super().__init__()
+        self._entries: OrderedDict[str, tuple[float | None, Any]] = OrderedDict()
+        self._max_size = max_size
+        self._ttl = ttl
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get(self, key: str) -> Any:  # noqa: ANN401
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def _set(self, key: str, value: Any) -> None:  # noqa: ANN401
+        expires_at = time.monotonic() + self._ttl if self._ttl is not None else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+
+@lru_cache(maxsize=1)
+def get_default_cache() -> MemoryCache:
+    """The process-wide cache used by blocks configured with `cache: true`."""
+    return MemoryCache()
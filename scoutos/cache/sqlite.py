@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import pickle
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+from .base import CacheBackend
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    expires_at REAL
+)
+"""
+
+
+class SQLiteCache(CacheBackend):
+    """An on-disk cache that can be shared between processes.
+
+    Values are pickled, so they must be picklable, and expiry uses wall clock
+    time since it is compared across processes. Expired entries are pruned on
+    every write, and with a `max_size`, so are the entries written least
+    recently beyond it.
+    """
+
+    def __init__(
+        self, path: str | Path, *, ttl: float | None = None, max_size: int | None = None
+    ):
+        super().__init__()
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._ttl = ttl
+        self._max_size = max_size
+        self._connection = sqlite3.connect(self._path, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(SCHEMA)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _get(self, key: str) -> Any:  # noqa: ANN401
+        row = self._connection.execute(
+            "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        value, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            self._connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+            return None
+
+        return pickle.loads(value)  # noqa: S301
+
+    def __len__(self) -> int:
+        (count,) = self._connection.execute("SELECT COUNT(*) FROM cache").fetchone()
+        return count
+
+    def _set(self, key: str, value: Any) -> None:  # noqa: ANN401
+        now = time.time()
+        expires_at = now + self._ttl if self._ttl is not None else None
+        self._connection.execute(
+            "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, pickle.dumps(value), expires_at),
+        )
+        self._connection.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+        # Replacing a row gives it a new rowid, so rowids follow write order.
+        if self._max_size is not None:
+            self._connection.execute(
+                "DELETE FROM cache WHERE rowid NOT IN "
+                "(SELECT rowid FROM cache ORDER BY rowid DESC LIMIT ?)",
+                (self._max_size,),
+            )
@@ -0,0 +1,10 @@
+from .base import Checkpoint, CheckpointStore
+from .filesystem import FileCheckpointStore
+from .sqlite import SQLiteCheckpointStore
+
+__all__ = [
+    "Checkpoint",
+    "CheckpointStore",
+    "FileCheckpointStore",
+    "SQLiteCheckpointStore",
+]
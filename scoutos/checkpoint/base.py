@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from scoutos.blocks.base import BlockOutput
+
+
+@dataclass
+class Checkpoint:
+    """What has been persisted of a run, enough to resume it."""
+
+    app_run_id: str
+    session_id: str
+    initial_input: dict
+    outputs: list[BlockOutput] = field(default_factory=list)
+    """The outputs recorded so far, in the order they completed."""
+
+
+class CheckpointStore(ABC):
+    """Persists the outputs of a run as they complete, keyed by `app_run_id`,
+    so a failed run can be resumed without redoing the blocks that succeeded.
+
+    Outputs are pickled, so their payloads must be picklable.
+    """
+
+    @abstractmethod
+    def begin(self, app_run_id: str, session_id: str, initial_input: dict) -> None:
+        """Record the start of a run, discarding any previous checkpoint
+        stored under the same `app_run_id`."""
+
+    @abstractmethod
+    def append(self, app_run_id: str, output: BlockOutput) -> None:
+        """Persist `output`, which has just been recorded by the run."""
+
+    @abstractmethod
+    def load(self, app_run_id: str) -> Checkpoint | None:
+        """Return the checkpoint of `app_run_id`, or `None` if there is
+        none."""
+
+    @abstractmethod
+    def delete(self, app_run_id: str) -> None:
+        """Discard the checkpoint of `app_run_id`, if any."""
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import pickle
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .base import Checkpoint, CheckpointStore
+
+if TYPE_CHECKING:  # pragma: no cover
+    from scoutos.blocks.base import BlockOutput
+
+RUN_FILE = "run.pickle"
+OUTPUT_SUFFIX = ".output.pickle"
+
+
+class FileCheckpointStore(CheckpointStore):
+    """Keeps each run in a directory of its own, with one file per output.
+
+    Files are written to a temporary name and then renamed, so a process
+    crashing midway never leaves a partially written output behind.
+    """
+
+    def __init__(self, path: str | Path):
+        self._path = Path(path)
+        self._path.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def begin(self, app_run_id: str, session_id: str, initial_input: dict) -> None:
+        self.delete(app_run_id)
+        run_path = self._run_path(app_run_id)
+        run_path.mkdir()
+        _write(run_path / RUN_FILE, (session_id, initial_input))
+
+    def append(self, app_run_id: str, output: BlockOutput) -> None:
+        _write(self._run_path(app_run_id) / f"{output.seq:08d}{OUTPUT_SUFFIX}", output)
+
+    def load(self, app_run_id: str) -> Checkpoint | None:
+        run_path = self._run_path(app_run_id)
+        if not (run_path / RUN_FILE).exists():
+            return None
+
+        session_id, initial_input = _read(run_path / RUN_FILE)
+        return Checkpoint(
+            app_run_id=app_run_id,
+            session_id=session_id,
+            initial_input=initial_input,
+            outputs=[
+                _read(output_path)
+                for output_path in sorted(run_path.glob(f"*{OUTPUT_SUFFIX}"))
+            ],
+        )
+
+    def delete(self, app_run_id: str) -> None:
+        shutil.rmtree(self._run_path(app_run_id), ignore_errors=True)
+
+    def _run_path(self, app_run_id: str) -> Path:
+        if app_run_id in {"", ".", ".."} or Path(app_run_id).name != app_run_id:
+            message = f"Invalid app_run_id: {app_run_id!r}"
+            raise ValueError(message)
+
+        return self._path / app_run_id
+
+
+def _write(path: Path, value: Any) -> None:  # noqa: ANN401
+    temporary_path = path.with_name(f".{path.name}.tmp")
+    temporary_path.write_bytes(pickle.dumps(value))
+    temporary_path.replace(path)
+
+
+def _read(path: Path) -> Any:  # noqa: ANN401
+    return pickle.loads(path.read_bytes())  # noqa: S301
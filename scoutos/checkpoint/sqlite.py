@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import pickle
+import sqlite3
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .base import Checkpoint, CheckpointStore
+
+if TYPE_CHECKING:  # pragma: no cover
+    from scoutos.blocks.base import BlockOutput
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    app_run_id TEXT PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    initial_input BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS outputs (
+    app_run_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    output BLOB NOT NULL,
+    PRIMARY KEY (app_run_id, seq)
+);
+"""
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """Keeps runs in a single SQLite database, which can be shared between
+    processes."""
+
+    def __init__(self, path: str | Path):
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self._path, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(SCHEMA)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def begin(self, app_run_id: str, session_id: str, initial_input: dict) -> None:
+        self.delete(app_run_id)
+        self._connection.execute(
+            "INSERT INTO runs (app_run_id, session_id, initial_input) VALUES (?, ?, ?)",
+            (app_run_id, session_id, pickle.dumps(initial_input)),
+        )
+
+    def append(self, app_run_id: str, output: BlockOutput) -> None:
+        self._connection.execute(
+            "INSERT OR REPLACE INTO outputs (app_run_id, seq, output) VALUES (?, ?, ?)",
+            (app_run_id, output.seq, pickle.dumps(output)),
+        )
+
+    def load(self, app_run_id: str) -> Checkpoint | None:
+        run = self._connection.execute(
+            "SELECT session_id, initial_input FROM runs WHERE app_run_id = ?",
+            (app_run_id,),
+        ).fetchone()
+        if run is None:
+            return None
+
+        session_id, initial_input = run
+        outputs = self._connection.execute(
+            "SELECT output FROM outputs WHERE app_run_id = ? ORDER BY seq",
+            (app_run_id,),
+        )
+        return Checkpoint(
+            app_run_id=app_run_id,
+            session_id=session_id,
+            initial_input=pickle.loads(initial_input),  # noqa: S301
+            outputs=[pickle.loads(output) for (output,) in outputs],  # noqa: S301
+        )
+
+    def delete(self, app_run_id: str) -> None:
+        self._connection.execute(
+            "DELETE FROM outputs WHERE app_run_id = ?", (app_run_id,)
+        )
+        self._connection.execute("DELETE FROM runs WHERE app_run_id = ?", (app_run_id,))
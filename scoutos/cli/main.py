@@ -2,15 +2,27 @@ from __future__ import annotations
 
 import asyncio
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 
 from scoutos import App
+from scoutos.cache import SQLiteCache
 from scoutos.cli.utils import parse_json
+from scoutos.env import get_cache_dir
+
+if TYPE_CHECKING:  # pragma: no cover
+    from scoutos.app import RunResult
 
 app = typer.Typer()
 
+SNAPSHOT_CACHE_TTL = 30 * 24 * 60 * 60
+"""Seconds an app snapshot is kept for after it was cached."""
+
+SNAPSHOT_CACHE_MAX_SIZE = 256
+"""The number of app snapshots kept, the least recently cached ones being
+dropped first."""
+
 
 @app.command()
 def about() -> None:
@@ -30,14 +42,36 @@ def run(
             help="JSON Stringified data to be used as app run input",
         ),
     ] = "",
+    no_cache: Annotated[  # noqa: FBT002
+        bool,
+        typer.Option(
+            "--no-cache",
+            help="Parse the app file again instead of using its cached snapshot",
+        ),
+    ] = False,
 ) -> None:
     config_file_path = Path(path)
-    app = App.load_from_file(config_file_path)
+    cache = (
+        None
+        if no_cache
+        else SQLiteCache(
+            get_cache_dir() / "apps.sqlite",
+            ttl=SNAPSHOT_CACHE_TTL,
+            max_size=SNAPSHOT_CACHE_MAX_SIZE,
+        )
+    )
+    app = App.load_from_file(config_file_path, cache=cache)
     parsed_app_input = parse_json(app_input)
-    result = asyncio.run(app.run(parsed_app_input))
+    result = asyncio.run(_run(app, parsed_app_input))
 
     typer.echo(result)
 
 
+async def _run(app: App, app_input: dict) -> RunResult:
+    """Run `app`, closing its HTTP connections once it is done."""
+    async with app:
+        return await app.run(app_input)
+
+
 if __name__ == "__main__":
     app()
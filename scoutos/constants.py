@@ -1 +1,2 @@
-THE_START_OF_TIME_AND_SPACE = "1970-01-01"
+THE_START_OF_TIME_AND_SPACE = -1
+"""The sequence number preceding the first output of every run."""
@@ -5,6 +5,7 @@ from scoutos.dependencies.base import Dependency, UnsatisfiedDependencyError
 
 class AnyDependency(Dependency[Any]):
     TYPE = "any"
+    __slots__ = ()
 
     def parse(self, value: Any) -> Any:  # noqa: ANN401
         if value is None:
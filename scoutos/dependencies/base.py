@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import re
 from abc import ABC, ABCMeta, abstractmethod
 from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar
 
 from typing_extensions import Required, TypedDict
 
 from scoutos.constants import THE_START_OF_TIME_AND_SPACE
-from scoutos.utils import DefaultValue, get_nested_value_from_dict
+from scoutos.query import compile_query, is_query
+from scoutos.utils import DefaultValue, PathGetter, compile_path
 
 if TYPE_CHECKING:  # pragma: no cover
     from scoutos.blocks.base import BlockOutput
+    from scoutos.run_context import RunContext
 
 
 DEPENDENCY_TYPE_ATTR = "TYPE"
@@ -35,6 +38,8 @@ class DependencyMeta(ABCMeta):
 
 T = TypeVar("T")
 
+_END_OF_BLOCK_ID = re.compile(r"[.\[{]")
+
 
 class DependencyBaseConfig(Generic[T], TypedDict, total=False):
     path: Required[str]
@@ -44,10 +49,34 @@ class DependencyBaseConfig(Generic[T], TypedDict, total=False):
 
 
 class Dependency(ABC, Generic[T], metaclass=DependencyMeta):
+    """A value a block reads from the output of another block.
+
+    Dependencies are resolved on every block run, so their path is parsed and
+    compiled once, and they use `__slots__`. Subclasses should declare
+    `__slots__ = ()` to keep instances free of a `__dict__`.
+    """
+
+    __slots__ = (
+        "_block_id",
+        "_default_value",
+        "_expression",
+        "_get_value",
+        "_key",
+        "_path",
+        "_requires_rerun",
+        "_segments",
+    )
+
     _is_base_class = True
 
+    COMPATIBLE_TYPES: ClassVar[frozenset[str] | None] = None
+    """The JSON types `parse` may be able to coerce, or `None` if it accepts
+    any value. Dependencies on values declared with none of these types are
+    rejected when the App is loaded."""
+
     @classmethod
     def load(cls, config: dict) -> Dependency:
+        config = dict(config)
         dependency_type = config.pop(DEPENDENCY_TYPE_KEY, None)
         if not dependency_type:
             message = f"Expected {DEPENDENCY_TYPE_KEY} to be provided"
@@ -66,21 +95,36 @@ class Dependency(ABC, Generic[T], metaclass=DependencyMeta):
     ):
         """Express a dependency on the output of another block.
 
-        path: str - the path to the dependency, separated by `.`
+        path: str - the path to the dependency, separated by `.`, starting
+            with the key of the block. The rest of the path can be a query,
+            see `scoutos.query`, e.g. `slack.messages[*].text`.
         """
         self._default_value: DefaultValue = DefaultValue(
             is_set=config.get("default_value") is not None,
             value=config.get("default_value"),
         )
-        self._key = config.get("key", config["path"].split(".")[-1])
         self._path = config["path"]
+        self._block_id = _END_OF_BLOCK_ID.split(self._path, maxsplit=1)[0]
+        self._expression = self._path[len(self._block_id) :].removeprefix(".")
+        self._segments: tuple[str, ...] = ()
+        self._get_value: PathGetter | None = None
+        key = self._path.rsplit(".", 1)[-1]
+        if is_query(self._expression):
+            query = compile_query(self._expression)
+            self._get_value = query
+            key = query.name or self._block_id
+        elif self._expression:
+            self._segments = tuple(self._expression.split("."))
+            self._get_value = compile_path(self._segments)
+
+        self._key = config.get("key", key)
         self._requires_rerun = config.get("requires_rerun", False)
 
     @property
     def block_id(self) -> str:
         """The ID of the block where this dependency is satisfied. It is the
         first component of the path."""
-        return self._path.split(".")[0]
+        return self._block_id
 
     @property
     def default_value(self) -> DefaultValue[T]:
@@ -96,11 +140,19 @@ class Dependency(ABC, Generic[T], metaclass=DependencyMeta):
     def path(self) -> str:
         """The path to the value found in output. Note this does not include the
         block_id, which we provide separately."""
-        segments = self._path.split(".")[1:]
-        if len(segments) == 0:
+        if not self._expression:
             raise DependencyPathError
 
-        return ".".join(segments)
+        return self._expression
+
+    @property
+    def segments(self) -> tuple[str, ...]:
+        """The components of a plain `path`. Components made of digits index
+        into lists. Queries have no segments."""
+        if not self._expression:
+            raise DependencyPathError
+
+        return self._segments
 
     @property
     def requires_rerun(self) -> bool:
@@ -113,45 +165,51 @@ class Dependency(ABC, Generic[T], metaclass=DependencyMeta):
 
     def is_resolved(
         self,
-        current_output: list[BlockOutput],
+        context: RunContext,
         *,
-        since: str = THE_START_OF_TIME_AND_SPACE,
+        since: int = THE_START_OF_TIME_AND_SPACE,
     ) -> bool:
         return (
-            self.resolved_with(current_output, since=since) is not None
+            self.resolved_with(context, since=since) is not None
             or self.default_value.is_set
         )
 
+    def is_skipped(self, context: RunContext) -> bool:
+        """True if the block this dependency reads from has been skipped and
+        there is no `default_value` to fall back on, in which case the value
+        is left out of the block's input."""
+        return not self.default_value.is_set and context.state.is_skipped(self.block_id)
+
     def resolved_with(
         self,
-        current_output: list[BlockOutput],
+        context: RunContext,
         *,
-        since: str,
+        since: int,
     ) -> BlockOutput | None:
-        for record in current_output[::-1]:
-            if record.block_id == self.block_id and record.block_run_end_ts > since:
-                return record
+        record = context.state.latest(self.block_id)
+        if record is not None and record.seq > since and not record.skipped:
+            return record
 
         return None
 
     def resolve(
-        self, current_output: list[BlockOutput], *, since: str = "1970-01-01"
+        self, context: RunContext, *, since: int = THE_START_OF_TIME_AND_SPACE
     ) -> T:
-        """Given the `current_output` evaluate the value of the dependency if
+        """Given the run `context` evaluate the value of the dependency if
         present. Raise if the dependency is not found and no default has been
         provided.
         """
-        resolving_output = self.resolved_with(current_output, since=since)
+        resolving_output = self.resolved_with(context, since=since)
 
         if resolving_output is None and not self.default_value.is_set:
             message = f"No result for {self.block_id} found"
             raise UnsatisfiedDependencyError(message)
 
-        value = (
-            get_nested_value_from_dict(self.path, resolving_output.output)
-            if resolving_output
-            else None
-        )
+        value = None
+        if resolving_output is not None:
+            if self._get_value is None:
+                raise DependencyPathError
+            value = self._get_value(resolving_output.output)
         if value is None and self.default_value.is_set:
             value = self.default_value.value
 
@@ -7,10 +7,16 @@ from scoutos.dependencies.base import Dependency, UnsatisfiedDependencyError
 
 class BoolDependency(Dependency[bool]):
     TYPE = "bool"
+    __slots__ = ()
+
+    COMPATIBLE_TYPES = frozenset({"boolean", "integer", "null", "number", "string"})
 
     adapter = TypeAdapter(bool)
 
     def parse(self, value: Any) -> bool:  # noqa: ANN401
+        if type(value) is bool:
+            return value
+
         try:
             return self.adapter.validate_python(value)
         except ValidationError as original_exception:
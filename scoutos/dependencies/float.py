@@ -7,10 +7,16 @@ from scoutos.dependencies.base import Dependency, UnsatisfiedDependencyError
 
 class FloatDependency(Dependency[float]):
     TYPE = "float"
+    __slots__ = ()
+
+    COMPATIBLE_TYPES = frozenset({"boolean", "integer", "null", "number", "string"})
 
     adapter = TypeAdapter(float)
 
     def parse(self, value: Any) -> float:  # noqa: ANN401
+        if type(value) is float:
+            return value
+
         try:
             return self.adapter.validate_python(value)
         except ValidationError as original_exception:
@@ -7,10 +7,16 @@ from scoutos.dependencies.base import Dependency, UnsatisfiedDependencyError
 
 class IntDependency(Dependency[int]):
     TYPE = "int"
+    __slots__ = ()
+
+    COMPATIBLE_TYPES = frozenset({"boolean", "integer", "null", "number", "string"})
 
     adapter = TypeAdapter(int)
 
     def parse(self, value: Any) -> int:  # noqa: ANN401
+        if type(value) is int:
+            return value
+
         try:
             return self.adapter.validate_python(value)
         except ValidationError as original_exception:
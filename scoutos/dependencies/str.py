@@ -7,10 +7,16 @@ from scoutos.dependencies.base import Dependency, UnsatisfiedDependencyError
 
 class StrDependency(Dependency[str]):
     TYPE = "str"
+    __slots__ = ()
+
+    COMPATIBLE_TYPES = frozenset({"string", "null"})
 
     adapter = TypeAdapter(str)
 
     def parse(self, value: Any) -> str:  # noqa: ANN401
+        if type(value) is str:
+            return value
+
         try:
             return self.adapter.validate_python(value)
         except ValidationError as original_exception:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from pathlib import Path
 
 
 def get_env(key: str, *, default_value: str | None = None) -> str:
@@ -11,3 +12,14 @@ def get_env(key: str, *, default_value: str | None = None) -> str:
         raise KeyError(message)
 
     return value
+
+
+def get_cache_dir() -> Path:
+    """Directory for scoutos' on-disk caches. Set `SCOUTOS_CACHE_DIR` to choose
+    it, otherwise `scoutos` in the user's cache directory is used."""
+    configured = os.environ.get("SCOUTOS_CACHE_DIR")
+    if configured:
+        return Path(configured)
+
+    user_cache_dir = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(user_cache_dir) / "scoutos"
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from scoutos.app import RunResult
+    from scoutos.blocks.base import BlockOutput
+
+
+@dataclass(frozen=True)
+class BlockStarted:
+    """A block has started executing."""
+
+    block_id: str
+    iteration: int
+    """The number of times the block has already run in this run."""
+
+
+@dataclass(frozen=True)
+class BlockFinished:
+    """A block has finished executing and its output has been recorded."""
+
+    block_output: BlockOutput
+
+
+@dataclass(frozen=True)
+class BlockSkipped:
+    """A block has been skipped rather than executed."""
+
+    block_output: BlockOutput
+
+
+@dataclass(frozen=True)
+class LoopIteration:
+    """A block has not met its termination condition and will run again."""
+
+    block_id: str
+    iteration: int
+    """The number of times the block has run so far."""
+
+
+@dataclass(frozen=True)
+class RunFinished:
+    """The run is complete. This is always the last event of a stream."""
+
+    result: RunResult
+
+
+RunEvent = BlockStarted | BlockFinished | BlockSkipped | LoopIteration | RunFinished
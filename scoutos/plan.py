@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping
+
+from scoutos.blocks.input import INPUT_BLOCK_ID
+from scoutos.dependencies.base import DependencyPathError
+from scoutos.schema import schema_types_at
+
+if TYPE_CHECKING:  # pragma: no cover
+    from scoutos.blocks.base import Block
+    from scoutos.dependencies.base import Dependency
+
+
+@dataclass(frozen=True)
+class DependencySlot:
+    """A dependency of a block, bound to the block that satisfies it."""
+
+    dependency: Dependency
+    """The dependency as declared on the block."""
+
+    block_id: str
+    """Key of the upstream block the dependency reads from."""
+
+    is_required: bool
+    """True if the upstream block has to run before the dependency can be
+    resolved, i.e. no `default_value` has been provided."""
+
+    requires_rerun: bool
+    """True if the upstream block has to run again before each repeated run
+    of the block."""
+
+
+@dataclass(frozen=True)
+class ExecutionPlan:
+    """The dependency graph of an App, compiled and validated once.
+
+    Edges only exist for required dependencies. Dependencies with a
+    `default_value` can be resolved before their block has run, which is what
+    makes loops possible, so they never order blocks.
+    """
+
+    order: tuple[str, ...]
+    """Block keys in topological order; upstream blocks come first."""
+
+    upstream: Mapping[str, tuple[str, ...]]
+    """For each block, the keys of the blocks it requires, in declared order."""
+
+    downstream: Mapping[str, tuple[str, ...]]
+    """For each block, the keys of the blocks that require it."""
+
+    slots: Mapping[str, tuple[DependencySlot, ...]]
+    """For each block, its dependencies bound to their upstream blocks."""
+
+    rerun_slots: Mapping[str, tuple[DependencySlot, ...]]
+    """For each block, the dependencies that have to be refreshed when the
+    block loops. All other dependencies stay resolved between iterations."""
+
+    condition_slots: Mapping[str, tuple[DependencySlot, ...]]
+    """For each block, the dependencies of its `when` condition, which are
+    resolved before any of the block's own dependencies."""
+
+    readers: Mapping[str, tuple[str, ...]]
+    """For each block, the keys of the blocks that may read its output, be it
+    through a dependency, required or not, or a `when` condition."""
+
+    rerun_by: Mapping[str, tuple[str, ...]]
+    """For each block, the keys of the looping blocks that run it again before
+    each of their iterations."""
+
+    @classmethod
+    def compile(cls, blocks: list[Block]) -> ExecutionPlan:
+        """Compile the plan for `blocks`, raising `ExecutionPlanError` if keys
+        are duplicated, a dependency refers to an unknown block, reads a value
+        of a type it cannot coerce, or required dependencies form a cycle."""
+        keys = [block.key for block in blocks]
+        duplicates = sorted({key for key in keys if keys.count(key) > 1})
+        if duplicates:
+            message = f"Duplicate block keys: {', '.join(duplicates)}"
+            raise ExecutionPlanError(message)
+
+        blocks_by_key = {block.key: block for block in blocks}
+        slots = {
+            block.key: _bind_slots(block, block.depends, blocks_by_key)
+            for block in blocks
+        }
+        condition_slots = {
+            block.key: _bind_slots(
+                block, block.when.depends if block.when else [], blocks_by_key
+            )
+            for block in blocks
+        }
+        upstream = {
+            key: tuple(
+                dict.fromkeys(
+                    slot.block_id
+                    for slot in (*condition_slots[key], *slots[key])
+                    if slot.is_required
+                )
+            )
+            for key in keys
+        }
+        downstream: dict[str, list[str]] = {key: [] for key in keys}
+        readers: dict[str, dict[str, None]] = {key: {} for key in keys}
+        rerun_by: dict[str, dict[str, None]] = {key: {} for key in keys}
+        for key in keys:
+            for upstream_key in upstream[key]:
+                downstream[upstream_key].append(key)
+            for slot in (*condition_slots[key], *slots[key]):
+                readers[slot.block_id][key] = None
+                if slot.requires_rerun:
+                    rerun_by[slot.block_id][key] = None
+
+        return cls(
+            order=_topological_order(keys, upstream, downstream),
+            upstream=MappingProxyType(upstream),
+            downstream=MappingProxyType(
+                {key: tuple(value) for key, value in downstream.items()}
+            ),
+            slots=MappingProxyType(slots),
+            rerun_slots=MappingProxyType(
+                {
+                    key: tuple(slot for slot in slots[key] if slot.requires_rerun)
+                    for key in keys
+                }
+            ),
+            condition_slots=MappingProxyType(condition_slots),
+            readers=MappingProxyType(
+                {key: tuple(value) for key, value in readers.items()}
+            ),
+            rerun_by=MappingProxyType(
+                {key: tuple(value) for key, value in rerun_by.items()}
+            ),
+        )
+
+
+def _bind_slots(
+    block: Block, depends: list[Dependency], blocks: dict[str, Block]
+) -> tuple[DependencySlot, ...]:
+    # The dependencies of the Input block describe the run input itself rather
+    # than other blocks, so they are never scheduled.
+    if block.key == INPUT_BLOCK_ID:
+        return ()
+
+    slots = []
+    for dep in depends:
+        upstream = blocks.get(dep.block_id)
+        if upstream is None:
+            message = f"`{block.key}` depends on unknown block `{dep.block_id}`"
+            raise ExecutionPlanError(message)
+
+        source_types = _source_types(dep, upstream)
+        compatible_types = dep.COMPATIBLE_TYPES
+        if (
+            source_types is not None
+            and compatible_types is not None
+            and source_types.isdisjoint(compatible_types)
+        ):
+            message = (
+                f"`{block.key}` reads `{dep.block_id}.{dep.path}` as "
+                f"{getattr(dep, 'TYPE', type(dep).__name__)}, but `{dep.block_id}` "
+                f"outputs {' or '.join(sorted(source_types))} there"
+            )
+            raise ExecutionPlanError(message)
+
+        slots.append(
+            DependencySlot(
+                dependency=dep,
+                block_id=dep.block_id,
+                is_required=not dep.default_value.is_set,
+                requires_rerun=dep.requires_rerun,
+            )
+        )
+
+    return tuple(slots)
+
+
+def _source_types(dep: Dependency, upstream: Block) -> frozenset[str] | None:
+    """Follow a plain dependency path through the output schema of the
+    upstream block. Queries reshape values, so their types are not inferred."""
+    try:
+        segments = dep.segments
+    except DependencyPathError:
+        return None
+
+    if not segments:
+        return None
+
+    return schema_types_at(upstream.output_schema, segments)
+
+
+def _topological_order(
+    keys: list[str],
+    upstream: dict[str, tuple[str, ...]],
+    downstream: dict[str, list[str]],
+) -> tuple[str, ...]:
+    """Kahn's algorithm, keeping declaration order between independent blocks."""
+    in_degree = {key: len(upstream[key]) for key in keys}
+    ready = [key for key in keys if in_degree[key] == 0]
+    order: list[str] = []
+
+    while ready:
+        key = ready.pop(0)
+        order.append(key)
+        for downstream_key in downstream[key]:
+            in_degree[downstream_key] -= 1
+            if in_degree[downstream_key] == 0:
+                ready.append(downstream_key)
+
+    if len(order) < len(keys):
+        cycle = [key for key in keys if in_degree[key] > 0]
+        message = f"Required dependencies form a cycle between: {', '.join(cycle)}"
+        raise ExecutionPlanError(message)
+
+    return tuple(order)
+
+
+class ExecutionPlanError(Exception):
+    """Raised when an App's blocks do not form a valid execution plan."""
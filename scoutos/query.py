@@ -0,0 +1,344 @@
+"""Query expressions for extracting values from block outputs.
+
+Dependencies can read more than a single value at a path. On top of plain
+`.` separated paths, a query supports:
+
+- `items[0]`, `items[-1]` to index a list,
+- `items[1:3]`, `items[::2]` to slice it,
+- `items[*]` to project over each element of a list, or value of a dict,
+- `items[?score > 0.5]`, `items[?user == 'bot']`, `items[?done]` to project
+  over the elements matching a filter, `@` referring to the element itself,
+- `{id, text: message.text}` to select several fields into a new dict.
+
+After a projection, the rest of the query is applied to each selected element
+and the non-null results are collected in a list, so `messages[*].text` is the
+text of every message.
+
+Queries are compiled once. Evaluating them walks the data in place: only the
+values being returned are ever collected.
+"""
+
+from __future__ import annotations
+
+import json
+import operator
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Mapping, NoReturn
+
+from pydantic import BaseModel
+
+QUERY_CHARACTERS = frozenset("[{")
+"""Characters that make a path a query rather than a plain path."""
+
+_FIELD = re.compile(r"[^.\[\]{}]+")
+_INDEX = re.compile(r"-?\d+")
+_SLICE = re.compile(r"(-?\d+)?:(-?\d+)?(?::(-?\d+)?)?")
+_FILTER = re.compile(r"\s*(.+?)\s*(?:(==|!=|<=|>=|<|>)\s*(.+?))?\s*")
+_COMPARISONS: dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+_CLOSING = {"[": "]", "{": "}"}
+
+
+def is_query(expression: str) -> bool:
+    """True if `expression` uses query syntax rather than being a plain path."""
+    return any(character in QUERY_CHARACTERS for character in expression)
+
+
+@dataclass(frozen=True)
+class _Step:
+    apply: Callable[[Any], Any]
+    """Applied to the current value. For projections, returns the elements the
+    rest of the query is applied to, or `None`."""
+
+    projects: bool = False
+
+
+class Query:
+    """A compiled query expression, evaluated by calling it with a value."""
+
+    __slots__ = ("_expression", "_name", "_steps")
+
+    def __init__(self, expression: str, steps: tuple[_Step, ...], name: str | None):
+        self._expression = expression
+        self._name = name
+        self._steps = steps
+
+    @property
+    def expression(self) -> str:
+        return self._expression
+
+    @property
+    def name(self) -> str | None:
+        """The last field the query reads, if any."""
+        return self._name
+
+    def __call__(self, data: Any) -> Any:  # noqa: ANN401
+        """Evaluate the query against `data`, returning `None` if nothing was
+        found."""
+        return _evaluate(self._steps, data, 0)
+
+    def __repr__(self) -> str:
+        return f"Query({self._expression!r})"
+
+
+@lru_cache(maxsize=1024)
+def compile_query(expression: str) -> Query:
+    """Compile `expression`, raising `QueryError` if it is not valid."""
+    steps, name = _Parser(expression).parse()
+    return Query(expression, tuple(steps), name)
+
+
+def _evaluate(steps: tuple[_Step, ...], data: Any, start: int) -> Any:  # noqa: ANN401
+    for position in range(start, len(steps)):
+        step = steps[position]
+        if data is None:
+            return None
+
+        if not step.projects:
+            data = step.apply(data)
+            continue
+
+        elements = step.apply(data)
+        if elements is None:
+            return None
+
+        results = []
+        for element in elements:
+            value = _evaluate(steps, element, position + 1)
+            if value is not None:
+                results.append(value)
+
+        return results
+
+    return data
+
+
+def _get_field(data: Any, name: str, index: int | None) -> Any:  # noqa: ANN401
+    if isinstance(data, Mapping):
+        return data.get(name)
+    if isinstance(data, BaseModel):
+        return getattr(data, name, None)
+    if index is not None and isinstance(data, (list, tuple)):
+        return data[index] if index < len(data) else None
+
+    return None
+
+
+def _field_step(name: str) -> _Step:
+    index = int(name) if name.isascii() and name.isdigit() else None
+    return _Step(lambda data: _get_field(data, name, index))
+
+
+def _index_step(index: int) -> _Step:
+    def apply(data: Any) -> Any:  # noqa: ANN401
+        if not isinstance(data, (list, tuple)) or not -len(data) <= index < len(data):
+            return None
+
+        return data[index]
+
+    return _Step(apply)
+
+
+def _slice_step(bounds: slice) -> _Step:
+    def apply(data: Any) -> Iterable[Any] | None:  # noqa: ANN401
+        if not isinstance(data, (list, tuple)):
+            return None
+
+        return (data[index] for index in range(*bounds.indices(len(data))))
+
+    return _Step(apply, projects=True)
+
+
+def _wildcard_step() -> _Step:
+    def apply(data: Any) -> Iterable[Any] | None:  # noqa: ANN401
+        if isinstance(data, (list, tuple)):
+            return data
+        if isinstance(data, Mapping):
+            return data.values()
+
+        return None
+
+    return _Step(apply, projects=True)
+
+
+def _filter_step(predicate: Callable[[Any], bool]) -> _Step:
+    def apply(data: Any) -> Iterable[Any] | None:  # noqa: ANN401
+        if not isinstance(data, (list, tuple)):
+            return None
+
+        return (element for element in data if predicate(element))
+
+    return _Step(apply, projects=True)
+
+
+def _multiselect_step(fields: tuple[tuple[str, Query], ...]) -> _Step:
+    return _Step(lambda data: {alias: query(data) for alias, query in fields})
+
+
+class _Parser:
+    def __init__(self, expression: str):
+        self._expression = expression
+        self._position = 0
+
+    def parse(self) -> tuple[list[_Step], str | None]:
+        steps: list[_Step] = []
+        name = None
+        expects_field = True
+
+        while self._position < len(self._expression):
+            character = self._expression[self._position]
+            if character == "[":
+                steps.append(self._parse_bracket(self._read_enclosed()))
+                expects_field = False
+            elif character == "{":
+                steps.append(self._parse_multiselect(self._read_enclosed()))
+                expects_field = False
+            elif character == "." and not expects_field:
+                self._position += 1
+                expects_field = True
+            else:
+                match = _FIELD.match(self._expression, self._position)
+                if match is None or not expects_field:
+                    self._fail(f"unexpected `{character}`")
+                name = match.group().strip()
+                if not name:
+                    self._fail("expected a field")
+                steps.append(_field_step(name))
+                self._position = match.end()
+                expects_field = False
+
+        if not steps or (expects_field and self._expression.endswith(".")):
+            self._fail("expected a field")
+
+        return steps, name
+
+    def _fail(self, reason: str) -> NoReturn:
+        message = f"Invalid query `{self._expression}`: {reason} at {self._position}"
+        raise QueryError(message)
+
+    def _read_enclosed(self) -> str:
+        """Read the brackets or braces starting at the current position, which
+        may nest and contain quoted strings, and return what they enclose."""
+        start = self._position
+        closing = [_CLOSING[self._expression[start]]]
+        quote = None
+        position = start + 1
+
+        while position < len(self._expression) and closing:
+            character = self._expression[position]
+            if quote is not None:
+                quote = None if character == quote else quote
+            elif character in "'\"":
+                quote = character
+            elif character in _CLOSING:
+                closing.append(_CLOSING[character])
+            elif character == closing[-1]:
+                closing.pop()
+            position += 1
+
+        if closing:
+            self._fail(f"unclosed `{self._expression[start]}`")
+
+        self._position = position
+        return self._expression[start + 1 : position - 1]
+
+    def _parse_bracket(self, content: str) -> _Step:
+        if content == "*":
+            return _wildcard_step()
+        if content.startswith("?"):
+            return _filter_step(self._parse_filter(content[1:]))
+        if _INDEX.fullmatch(content):
+            return _index_step(int(content))
+
+        match = _SLICE.fullmatch(content)
+        if match is None:
+            self._fail(f"invalid selector `[{content}]`")
+
+        start, stop, step = (int(bound) if bound else None for bound in match.groups())
+        if step == 0:
+            self._fail("slice step cannot be zero")
+
+        return _slice_step(slice(start, stop, step))
+
+    def _parse_filter(self, content: str) -> Callable[[Any], bool]:
+        match = _FILTER.fullmatch(content)
+        if match is None:
+            self._fail("expected a filter")
+
+        left, comparison, right = match.groups()
+        select = _identity if left == "@" else compile_query(left)
+        if comparison is None:
+            return lambda element: bool(select(element))
+
+        compare = _COMPARISONS[comparison]
+        expected = self._parse_literal(right)
+
+        def predicate(element: Any) -> bool:  # noqa: ANN401
+            try:
+                return compare(select(element), expected)
+            except TypeError:
+                return False
+
+        return predicate
+
+    def _parse_literal(self, literal: str) -> Any:  # noqa: ANN401
+        if len(literal) > 1 and literal[0] == literal[-1] == "'":
+            return literal[1:-1]
+
+        try:
+            return json.loads(literal)
+        except json.JSONDecodeError:
+            self._fail(f"invalid literal `{literal}`")
+
+    def _parse_multiselect(self, content: str) -> _Step:
+        fields = []
+        for item in _split_top_level(content):
+            alias, separator, expression = item.partition(":")
+            alias = alias.strip()
+            if not alias:
+                self._fail("expected a field name")
+
+            query = compile_query(expression.strip() if separator else alias)
+            fields.append((alias, query))
+
+        return _multiselect_step(tuple(fields))
+
+
+def _identity(value: Any) -> Any:  # noqa: ANN401
+    return value
+
+
+def _split_top_level(content: str) -> list[str]:
+    """Split `content` on the commas that are not nested in brackets, braces or
+    quotes."""
+    items = []
+    depth = 0
+    quote = None
+    start = 0
+    for position, character in enumerate(content):
+        if quote is not None:
+            quote = None if character == quote else quote
+        elif character in "'\"":
+            quote = character
+        elif character in "[{":
+            depth += 1
+        elif character in "]}":
+            depth -= 1
+        elif character == "," and depth == 0:
+            items.append(content[start:position])
+            start = position + 1
+
+    items.append(content[start:])
+    return items
+
+
+class QueryError(Exception):
+    """Raised when a query expression cannot be compiled."""
@@ -0,0 +1,166 @@
+"""Retrying failed requests, and failing fast on hosts that keep failing.
+
+A block declares a `RetryPolicy` in its configuration, and the engine runs it
+again, with exponential backoff and jitter, when it raises a retryable
+`BlockRequestError`. Circuit breakers are kept per host by the `Transport`
+the requests are sent through, so every block talking to a failing host
+stops sending it requests at once.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+from typing_extensions import TypedDict
+
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+"""Response statuses that describe a transient failure, worth retrying."""
+
+
+class RetryPolicy(TypedDict, total=False):
+    max_attempts: int
+    """The maximum number of times the block runs, including the first one
+    (default = 3)."""
+
+    initial_delay: float
+    """Seconds to wait before the first retry (default = 0.5)."""
+
+    max_delay: float
+    """The longest wait between two attempts, in seconds (default = 30). A
+    server asking, through `Retry-After`, to wait longer than this is not
+    retried."""
+
+    multiplier: float
+    """Factor the delay grows by after each retry (default = 2)."""
+
+    jitter: bool
+    """If true, the default, each delay is drawn uniformly between zero and
+    its exponential bound, so that clients failing together do not retry in
+    lockstep."""
+
+
+class CircuitBreakerPolicy(TypedDict, total=False):
+    failure_threshold: int
+    """The number of consecutive failures that opens the circuit of a host
+    (default = 5)."""
+
+    reset_after: float
+    """Seconds the circuit stays open before a single request is let through
+    to probe the host (default = 30)."""
+
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_INITIAL_DELAY = 0.5
+DEFAULT_MAX_DELAY = 30.0
+DEFAULT_MULTIPLIER = 2.0
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_AFTER = 30.0
+
+
+def backoff_delay(
+    policy: RetryPolicy, attempt: int, retry_after: float | None = None
+) -> float | None:
+    """Seconds to wait after the given failed `attempt`, counted from one, or
+    `None` if the policy does not allow another attempt."""
+    if attempt >= policy.get("max_attempts", DEFAULT_MAX_ATTEMPTS):
+        return None
+
+    max_delay = policy.get("max_delay", DEFAULT_MAX_DELAY)
+    if retry_after is not None and retry_after > max_delay:
+        return None
+
+    delay = min(
+        max_delay,
+        policy.get("initial_delay", DEFAULT_INITIAL_DELAY)
+        * policy.get("multiplier", DEFAULT_MULTIPLIER) ** (attempt - 1),
+    )
+    if policy.get("jitter", True):
+        delay = random.uniform(0, delay)  # noqa: S311
+
+    return max(delay, retry_after or 0)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait according to a `Retry-After` header, given either as a
+    number of seconds or as an HTTP date, or `None` if it is missing or
+    invalid."""
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(retry_at.timestamp() - time.time(), 0)
+
+
+class CircuitBreaker:
+    """Tracks the consecutive failures of a host.
+
+    The circuit opens once `failure_threshold` requests in a row have failed,
+    and requests are then rejected without being sent. After `reset_after`
+    seconds, a single request is let through and the circuit stays open
+    while it is: its success closes the circuit, its failure, or a lack of
+    answer within another `reset_after` seconds, opens it again.
+    """
+
+    def __init__(self, policy: CircuitBreakerPolicy):
+        self._failure_threshold = policy.get(
+            "failure_threshold", DEFAULT_FAILURE_THRESHOLD
+        )
+        self._reset_after = policy.get("reset_after", DEFAULT_RESET_AFTER)
+        self._failures = 0
+        self._opened_at: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """True while requests are being rejected."""
+        return self.retry_after > 0
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds left before a request is let through to probe the host."""
+        if self._opened_at is None:
+            return 0
+
+        return max(self._opened_at + self._reset_after - time.monotonic(), 0)
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now. Once the circuit has been open
+        for long enough, the request allowed is the probe."""
+        if self._opened_at is None:
+            return True
+        if self.is_open:
+            return False
+
+        self._opened_at = time.monotonic()
+        return True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._opened_at is not None or self._failures >= self._failure_threshold:
+            self._opened_at = time.monotonic()
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to a host whose circuit is open."""
+
+    def __init__(self, origin: str, retry_after: float):
+        self.origin = origin
+        self.retry_after = retry_after
+        message = (
+            f"The circuit of {origin} is open after repeated failures, "
+            f"retry in {retry_after:.1f}s"
+        )
+        super().__init__(message)
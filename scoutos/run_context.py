@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+from scoutos.run_state import RunState
+
+if TYPE_CHECKING:  # pragma: no cover
+    import asyncio
+
+    from scoutos.events import RunEvent
+
+
+def _new_id() -> str:
+    return str(uuid4())
+
+
+@dataclass
+class RunContext:
+    """Everything that belongs to a single run of an App.
+
+    Blocks and their dependencies are shared by every run of an App, so they
+    hold configuration only. The outputs a run produces, and the bookkeeping
+    needed to schedule it, live here instead. This is what allows one App to
+    serve many runs, including concurrent ones.
+    """
+
+    app_run_id: str = field(default_factory=_new_id)
+    session_id: str = field(default_factory=_new_id)
+    started_at_ns: int = field(default_factory=time.time_ns)
+    """Wall clock time the run started at, in nanoseconds since the epoch."""
+
+    started_at_perf_ns: int = field(default_factory=time.perf_counter_ns, repr=False)
+    """Monotonic clock reading taken when the run started."""
+
+    initial_input: dict = field(default_factory=dict)
+    """Input the run was started with, handed to the `input` block."""
+
+    state: RunState = field(default_factory=RunState)
+    """The outputs of the blocks executed so far."""
+
+    in_flight: dict[str, asyncio.Future[None]] = field(default_factory=dict, repr=False)
+    """Blocks currently executing, so concurrent requests can share them."""
+
+    settled: set[str] = field(default_factory=set, repr=False)
+    """Blocks that have met their termination condition, or been skipped, at
+    least once."""
+
+    finished: set[str] = field(default_factory=set, repr=False)
+    """Settled blocks that no looping block can run again, so they will not
+    read any output again during the run."""
+
+    run_slots: asyncio.Semaphore | None = field(default=None, repr=False)
+    """Bounds the number of blocks executing at once, if set. It is shared
+    by the concurrent runs of an App."""
+
+    deadline: float | None = None
+    """Value of `time.monotonic()` by which the run has to complete, if any."""
+
+    validate_schemas: bool = True
+    """Whether block inputs and outputs are checked against their schemas
+    during this run."""
+
+    events: asyncio.Queue[RunEvent | None] | None = field(default=None, repr=False)
+    """Receives progress events when the run is being streamed."""
+
+    def emit(self, event: RunEvent) -> None:
+        """Publish `event` if the run is being streamed."""
+        if self.events is not None:
+            self.events.put_nowait(event)
+
+    def remaining_time(self) -> float | None:
+        """Seconds left before the deadline, or `None` without a deadline."""
+        if self.deadline is None:
+            return None
+
+        return self.deadline - time.monotonic()
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import TYPE_CHECKING, Iterable, Sequence
+
+if TYPE_CHECKING:  # pragma: no cover
+    from scoutos.blocks.base import BlockOutput
+
+
+class RunState:
+    """The outputs produced by blocks during a run.
+
+    Outputs are kept in an append-only log, in the order they completed,
+    alongside an index of the latest output of each block. Looking up the
+    output a dependency resolves with therefore never scans the log.
+
+    Dependencies only ever read the latest output of a block. When
+    `retained_iterations` is set, only that many of the latest outputs of each
+    block keep their payload; older ones keep their metadata only.
+    """
+
+    def __init__(
+        self,
+        outputs: Iterable[BlockOutput] = (),
+        *,
+        retained_iterations: int | None = None,
+    ):
+        self._latest: dict[str, BlockOutput] = {}
+        self._log: list[BlockOutput] = []
+        self._path: list[str] = []
+        self._run_counts: dict[str, int] = {}
+        self._skipped: set[str] = set()
+        self._seqs: dict[str, list[int]] = {}
+        self._retained_from: dict[str, int] = {}
+        self._retained_iterations = retained_iterations
+
+        for output in outputs:
+            self.append(output)
+
+    @property
+    def log(self) -> Sequence[BlockOutput]:
+        """Every output recorded so far, in the order they completed."""
+        return self._log
+
+    @property
+    def path(self) -> Sequence[str]:
+        """The keys of the blocks executed so far, in the order they
+        completed."""
+        return self._path
+
+    def append(self, output: BlockOutput) -> int:
+        """Record `output`, assigning it the next sequence number of the run,
+        and return that sequence number."""
+        output.seq = len(self._log)
+        self._log.append(output)
+        self._path.append(output.block_id)
+        self._latest[output.block_id] = output
+        self._seqs.setdefault(output.block_id, []).append(output.seq)
+        if output.skipped:
+            self._skipped.add(output.block_id)
+        else:
+            self._run_counts[output.block_id] = self.run_count(output.block_id) + 1
+
+        if self._retained_iterations is not None:
+            self.drop_payloads(output.block_id, keep=self._retained_iterations)
+
+        return output.seq
+
+    def drop_payloads(self, block_id: str, *, keep: int = 0) -> None:
+        """Drop the payload of every output of `block_id` but the `keep`
+        latest ones. The outputs stay in the log, marked as `trimmed`."""
+        seqs = self._seqs.get(block_id, [])
+        start = self._retained_from.get(block_id, 0)
+        stop = max(len(seqs) - keep, start)
+        for seq in seqs[start:stop]:
+            output = self._log[seq]
+            if not output.skipped:
+                self._log[seq] = replace(output, output=None, trimmed=True)
+
+        self._retained_from[block_id] = stop
+        if seqs and stop == len(seqs):
+            self._latest[block_id] = self._log[seqs[-1]]
+
+    def is_skipped(self, block_id: str) -> bool:
+        """True if `block_id` has been skipped in this run."""
+        return block_id in self._skipped
+
+    def latest(self, block_id: str) -> BlockOutput | None:
+        """The most recent output of `block_id`, if it has run."""
+        return self._latest.get(block_id)
+
+    def run_count(self, block_id: str) -> int:
+        """The number of outputs recorded for `block_id`, not counting
+        skips."""
+        return self._run_counts.get(block_id, 0)
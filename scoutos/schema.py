@@ -0,0 +1,468 @@
+"""Validation of block inputs and outputs against JSON Schemas.
+
+Schemas are compiled once into a tree of closures, so checking a value only
+runs the checks its schema asks for. The commonly used subset of JSON Schema
+is supported: `type`, `enum`, `const`, `properties`, `required`,
+`additionalProperties`, `minProperties`, `maxProperties`, `items`,
+`minItems`, `maxItems`, `uniqueItems`, `minLength`, `maxLength`, `pattern`,
+`minimum`, `maximum`, `exclusiveMinimum`, `exclusiveMaximum`, `multipleOf`,
+`allOf`, `anyOf`, `oneOf` and `not`. Annotations such as
+`title`, `description` or `format` are ignored, and schemas using keywords
+that cannot be honoured, such as `$ref`, are rejected rather than silently
+accepted.
+"""
+
+from __future__ import annotations
+
+import operator
+import re
+from decimal import Decimal
+from typing import Any, Callable, Mapping, Sequence
+
+from pydantic import BaseModel
+
+Validator = Callable[[Any], None]
+"""Raises `SchemaValidationError` if the value does not match the schema."""
+
+UNSUPPORTED_KEYWORDS = frozenset(
+    {
+        "$defs",
+        "$dynamicRef",
+        "$ref",
+        "additionalItems",
+        "contains",
+        "definitions",
+        "dependencies",
+        "dependentRequired",
+        "dependentSchemas",
+        "else",
+        "if",
+        "patternProperties",
+        "prefixItems",
+        "propertyNames",
+        "then",
+        "unevaluatedItems",
+        "unevaluatedProperties",
+    }
+)
+
+
+def compile_schema(schema: Mapping[str, Any] | None) -> Validator | None:
+    """Compile `schema` into a validator, or return `None` if the schema
+    accepts anything. Raises `SchemaError` if the schema is not supported."""
+    if not schema:
+        return None
+
+    return _compile(schema)
+
+
+def schema_types_at(
+    schema: Mapping[str, Any], segments: Sequence[str]
+) -> frozenset[str] | None:
+    """The JSON types `schema` declares for the value found at `segments`, or
+    `None` if the schema does not say. Digit segments read array items."""
+    for segment in segments:
+        properties = schema.get("properties", {})
+        if segment in properties:
+            schema = properties[segment]
+        elif segment.isdigit() and "items" in schema:
+            schema = schema["items"]
+        else:
+            return None
+
+        if not isinstance(schema, Mapping):
+            return None
+
+    declared = schema.get("type")
+    if declared is None:
+        return None
+
+    return frozenset(declared if isinstance(declared, list) else [declared])
+
+
+def _is_object(value: Any) -> bool:  # noqa: ANN401
+    return isinstance(value, (dict, Mapping, BaseModel))
+
+
+def _is_number(value: Any) -> bool:  # noqa: ANN401
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value: Any) -> bool:  # noqa: ANN401
+    return _is_number(value) and (isinstance(value, int) or value.is_integer())
+
+
+def _count_properties(value: Any) -> int:  # noqa: ANN401
+    return len(value.model_dump() if isinstance(value, BaseModel) else value)
+
+
+def _json_key(value: Any) -> Any:  # noqa: ANN401
+    """A value that compares equal to the key of another value exactly when
+    JSON Schema considers both equal: booleans differ from numbers, while
+    `1` and `1.0` are the same number."""
+    if isinstance(value, bool):
+        return (bool, value)
+    if isinstance(value, BaseModel):
+        value = value.model_dump()
+    if isinstance(value, Mapping):
+        return (
+            dict,
+            frozenset((name, _json_key(item)) for name, item in value.items()),
+        )
+    if isinstance(value, (list, tuple)):
+        return (list, tuple(_json_key(item) for item in value))
+
+    return value
+
+
+_TYPES: dict[str, Callable[[Any], bool]] = {
+    "array": lambda value: isinstance(value, (list, tuple)),
+    "boolean": lambda value: isinstance(value, bool),
+    "integer": _is_integer,
+    "null": lambda value: value is None,
+    "number": _is_number,
+    "object": _is_object,
+    "string": lambda value: isinstance(value, str),
+}
+
+
+def _compile(schema: Any) -> Validator:  # noqa: ANN401
+    if schema is True or schema == {}:
+        return _accept
+    if schema is False:
+        return _reject
+    if not isinstance(schema, Mapping):
+        message = f"Expected a schema, got {schema!r}"
+        raise SchemaError(message)
+
+    unsupported = UNSUPPORTED_KEYWORDS.intersection(schema)
+    if unsupported:
+        message = f"Unsupported schema keywords: {', '.join(sorted(unsupported))}"
+        raise SchemaError(message)
+
+    checks = [
+        compile_check(schema)
+        for keyword, compile_check in _KEYWORDS.items()
+        if keyword in schema
+    ]
+    checks.extend(
+        _compile_bound(keyword, schema[keyword])
+        for keyword in _BOUNDS
+        if keyword in schema
+    )
+    if {"properties", "required", "additionalProperties"}.intersection(schema):
+        checks.append(_compile_object(schema))
+
+    if not checks:
+        return _accept
+    if len(checks) == 1:
+        return checks[0]
+
+    def validate(value: Any) -> None:  # noqa: ANN401
+        for check in checks:
+            check(value)
+
+    return validate
+
+
+def _accept(_value: Any) -> None:  # noqa: ANN401
+    return
+
+
+def _identity(value: Any) -> Any:  # noqa: ANN401
+    return value
+
+
+def _reject(_value: Any) -> None:  # noqa: ANN401
+    message = "no value is allowed"
+    raise SchemaValidationError(message)
+
+
+def _compile_type(schema: Mapping[str, Any]) -> Validator:
+    names = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+    unknown = [name for name in names if name not in _TYPES]
+    if unknown:
+        message = f"Unknown schema type: {', '.join(map(str, unknown))}"
+        raise SchemaError(message)
+
+    predicates = [_TYPES[name] for name in names]
+    expected = " or ".join(names)
+
+    def fail(value: Any) -> None:  # noqa: ANN401
+        message = f"expected {expected}, got {type(value).__name__}"
+        raise SchemaValidationError(message)
+
+    if len(predicates) == 1:
+        (predicate,) = predicates
+
+        def validate_type(value: Any) -> None:  # noqa: ANN401
+            if not predicate(value):
+                fail(value)
+
+        return validate_type
+
+    def validate_types(value: Any) -> None:  # noqa: ANN401
+        if not any(predicate(value) for predicate in predicates):
+            fail(value)
+
+    return validate_types
+
+
+def _compile_enum(schema: Mapping[str, Any]) -> Validator:
+    allowed = list(schema["enum"])
+    allowed_keys = [_json_key(item) for item in allowed]
+
+    def validate(value: Any) -> None:  # noqa: ANN401
+        if _json_key(value) not in allowed_keys:
+            message = f"{value!r} is not one of {allowed!r}"
+            raise SchemaValidationError(message)
+
+    return validate
+
+
+def _compile_const(schema: Mapping[str, Any]) -> Validator:
+    expected = schema["const"]
+    expected_key = _json_key(expected)
+
+    def validate(value: Any) -> None:  # noqa: ANN401
+        if _json_key(value) != expected_key:
+            message = f"expected {expected!r}, got {value!r}"
+            raise SchemaValidationError(message)
+
+    return validate
+
+
+def _compile_bound(keyword: str, bound: Any) -> Validator:  # noqa: ANN401
+    measure, applies, is_within, describe = _BOUNDS[keyword]
+
+    def validate(value: Any) -> None:  # noqa: ANN401
+        if applies(value) and not is_within(measure(value), bound):
+            message = f"{describe} {bound}"
+            raise SchemaValidationError(message)
+
+    return validate
+
+
+def _compile_multiple_of(schema: Mapping[str, Any]) -> Validator:
+    divisor = schema["multipleOf"]
+    # Decimals keep multiples of e.g. 0.1 exact, where floats would not be.
+    decimal_divisor = Decimal(str(divisor))
+
+    def validate(value: Any) -> None:  # noqa: ANN401
+        if not _is_number(value):
+            return
+
+        if isinstance(value, int) and isinstance(divisor, int):
+            remainder: int | Decimal = value % divisor
+        else:
+            remainder = Decimal(str(value)) % decimal_divisor
+        if remainder:
+            message = f"not a multiple of {divisor}"
+            raise SchemaValidationError(message)
+
+    return validate
+
+
+def _compile_unique_items(schema: Mapping[str, Any]) -> Validator:
+    if not schema["uniqueItems"]:
+        return _accept
+
+    def validate(value: Any) -> None:  # noqa: ANN401
+        if not isinstance(value, (list, tuple)):
+            return
+
+        keys = [_json_key(item) for item in value]
+        for index, key in enumerate(keys):
+            if key in keys[:index]:
+                message = f"item {index} is a duplicate"
+                raise SchemaValidationError(message)
+
+    return validate
+
+
+def _compile_pattern(schema: Mapping[str, Any]) -> Validator:
+    pattern = re.compile(schema["pattern"])
+
+    def validate(value: Any) -> None:  # noqa: ANN401
+        if isinstance(value, str) and pattern.search(value) is None:
+            message = f"does not match pattern {pattern.pattern!r}"
+            raise SchemaValidationError(message)
+
+    return validate
+
+
+def _compile_all_of(schema: Mapping[str, Any]) -> Validator:
+    validators = [_compile(subschema) for subschema in schema["allOf"]]
+
+    def validate(value: Any) -> None:  # noqa: ANN401
+        for validator in validators:
+            validator(value)
+
+    return validate
+
+
+def _count_matches(validators: list[Validator], value: Any) -> int:  # noqa: ANN401
+    matches = 0
+    for validator in validators:
+        try:
+            validator(value)
+        except SchemaValidationError:
+            continue
+        matches += 1
+
+    return matches
+
+
+def _compile_any_of(schema: Mapping[str, Any]) -> Validator:
+    validators = [_compile(subschema) for subschema in schema["anyOf"]]
+
+    def validate(value: Any) -> None:  # noqa: ANN401
+        for validator in validators:
+            try:
+                validator(value)
+            except SchemaValidationError:
+                continue
+            return
+
+        message = "does not match any of the allowed schemas"
+        raise SchemaValidationError(message)
+
+    return validate
+
+
+def _compile_one_of(schema: Mapping[str, Any]) -> Validator:
+    validators = [_compile(subschema) for subschema in schema["oneOf"]]
+
+    def validate(value: Any) -> None:  # noqa: ANN401
+        matches = _count_matches(validators, value)
+        if matches != 1:
+            message = f"matches {matches} of the schemas instead of exactly one"
+            raise SchemaValidationError(message)
+
+    return validate
+
+
+def _compile_not(schema: Mapping[str, Any]) -> Validator:
+    validator = _compile(schema["not"])
+
+    def validate(value: Any) -> None:  # noqa: ANN401
+        if _count_matches([validator], value):
+            message = "matches a schema it should not"
+            raise SchemaValidationError(message)
+
+    return validate
+
+
+def _compile_object(schema: Mapping[str, Any]) -> Validator:
+    properties = {
+        name: _compile(subschema)
+        for name, subschema in schema.get("properties", {}).items()
+    }
+    required = tuple(schema.get("required", ()))
+    additional = schema.get("additionalProperties", True)
+    validate_additional = None if additional is True else _compile(additional)
+
+    def validate(value: Any) -> None:  # noqa: ANN401
+        if isinstance(value, dict):
+            pass
+        elif isinstance(value, BaseModel):
+            value = value.model_dump()
+        elif not isinstance(value, Mapping):
+            return
+
+        for name in required:
+            if name not in value:
+                message = f"missing required property `{name}`"
+                raise SchemaValidationError(message)
+
+        for name, item in value.items():
+            validator = properties.get(name, validate_additional)
+            if validator is None:
+                continue
+            try:
+                validator(item)
+            except SchemaValidationError as error:
+                error.path.insert(0, name)
+                raise
+
+    return validate
+
+
+def _compile_items(schema: Mapping[str, Any]) -> Validator:
+    validator = _compile(schema["items"])
+
+    def validate(value: Any) -> None:  # noqa: ANN401
+        if not isinstance(value, (list, tuple)):
+            return
+
+        for index, item in enumerate(value):
+            try:
+                validator(item)
+            except SchemaValidationError as error:
+                error.path.insert(0, index)
+                raise
+
+    return validate
+
+
+_KEYWORDS: dict[str, Callable[[Mapping[str, Any]], Validator]] = {
+    "type": _compile_type,
+    "enum": _compile_enum,
+    "const": _compile_const,
+    "pattern": _compile_pattern,
+    "multipleOf": _compile_multiple_of,
+    "uniqueItems": _compile_unique_items,
+    "allOf": _compile_all_of,
+    "anyOf": _compile_any_of,
+    "oneOf": _compile_one_of,
+    "not": _compile_not,
+    "items": _compile_items,
+}
+
+_BOUNDS: dict[
+    str,
+    tuple[
+        Callable[[Any], Any],
+        Callable[[Any], bool],
+        Callable[[Any, Any], bool],
+        str,
+    ],
+] = {
+    "minLength": (len, _TYPES["string"], operator.ge, "shorter than"),
+    "maxLength": (len, _TYPES["string"], operator.le, "longer than"),
+    "minItems": (len, _TYPES["array"], operator.ge, "fewer items than"),
+    "maxItems": (len, _TYPES["array"], operator.le, "more items than"),
+    "minProperties": (
+        _count_properties,
+        _is_object,
+        operator.ge,
+        "fewer properties than",
+    ),
+    "maxProperties": (
+        _count_properties,
+        _is_object,
+        operator.le,
+        "more properties than",
+    ),
+    "minimum": (_identity, _is_number, operator.ge, "less than"),
+    "maximum": (_identity, _is_number, operator.le, "greater than"),
+    "exclusiveMinimum": (_identity, _is_number, operator.gt, "not greater than"),
+    "exclusiveMaximum": (_identity, _is_number, operator.lt, "not less than"),
+}
+
+
+class SchemaError(Exception):
+    """Raised when a schema cannot be compiled."""
+
+
+class SchemaValidationError(Exception):
+    """Raised when a value does not match its schema."""
+
+    def __init__(self, reason: str):
+        self.path: list[str | int] = []
+        self.reason = reason
+        super().__init__(reason)
+
+    def __str__(self) -> str:
+        location = ".".join(str(segment) for segment in self.path)
+        return f"{location}: {self.reason}" if location else self.reason
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import json
-from typing import Literal
-
-import httpx
+from typing import TYPE_CHECKING, Literal
 
 from scoutos.env import get_env
+from scoutos.transport import get_default_transport
 from scoutos.utils import DefaultValue
 
+if TYPE_CHECKING:  # pragma: no cover
+    from scoutos.transport import Transport
+
 SCOUTOS_SECRETS_ENDPOINT = "https://api.scoutos.com/v1/secrets"
 
 Env = Literal["production", "preview", "development"]
@@ -21,6 +23,7 @@ class Secret:
         default_value: str | None = None,
         env: Env = "production",
         scoutos_secret_key: str | None = None,
+        transport: Transport | None = None,
     ):
         self._env = env
         self._key = key
@@ -29,6 +32,7 @@ class Secret:
             value=default_value,
         )
         self._scoutos_secret_key = scoutos_secret_key
+        self._transport = transport
 
     @property
     def env(self) -> str:
@@ -63,8 +67,8 @@ class Secret:
             "Authorization": f"Bearer {self._scoutos_secret_key}",
         }
 
-        async with httpx.AsyncClient() as httpx_client:
-            response = await httpx_client.get(url, headers=headers)
+        transport = self._transport or get_default_transport()
+        response = await transport.client(url).get(url, headers=headers)
 
         try:
             value = response.json()["value"]
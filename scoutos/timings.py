@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Mapping, Sequence
+
+if TYPE_CHECKING:  # pragma: no cover
+    from scoutos.blocks.base import BlockOutput
+
+
+@dataclass
+class BlockTimings:
+    """Where the time of a single block execution went.
+
+    Every phase is measured with a monotonic clock, in nanoseconds. Together,
+    `resolve_ns`, `run_ns` and `overhead_ns` account for the `duration_ns` of
+    the block's output; `queue_wait_ns` precedes it.
+    """
+
+    queue_wait_ns: int = 0
+    """Time spent waiting for a free slot when the App bounds its
+    concurrency."""
+
+    resolve_ns: int = 0
+    """Time spent resolving the block's dependencies into its input."""
+
+    run_ns: int = 0
+    """Time spent in the block's own `run`, which for most blocks is time
+    spent waiting on I/O. Zero when the output was taken from the cache."""
+
+    overhead_ns: int = 0
+    """Time spent by the engine around `run`: schema validation, cache
+    lookups and bookkeeping."""
+
+    retries: int = 0
+    """The number of times `run` was tried again after a retryable failure,
+    see the block's `retry` policy."""
+
+    backoff_ns: int = 0
+    """The part of `run_ns` spent waiting between attempts."""
+
+
+def critical_path_ns(
+    outputs: Sequence[BlockOutput], upstream: Mapping[str, tuple[str, ...]]
+) -> int:
+    """The longest chain of block `run` time through the outputs of a run.
+
+    Each output extends the longest chain of the required upstream blocks it
+    read from and, for loops, of the block's previous iteration. This is the
+    latency the run would have if the engine itself took no time at all.
+    """
+    latest_chain: dict[str, int] = {}
+    longest = 0
+    for output in outputs:
+        previous = [
+            latest_chain[block_id]
+            for block_id in (*upstream.get(output.block_id, ()), output.block_id)
+            if block_id in latest_chain
+        ]
+        chain = max(previous, default=0) + output.timings.run_ns
+        latest_chain[output.block_id] = chain
+        longest = max(longest, chain)
+
+    return longest
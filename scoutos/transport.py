@@ -0,0 +1,331 @@
+"""Pooled HTTP clients shared by the blocks of an App.
+
+Opening an `httpx.AsyncClient` per request costs a new TCP and TLS handshake
+every time. A `Transport` instead keeps one long-lived client per origin, so
+requests to the same host reuse kept-alive connections. It can also keep a
+circuit breaker per origin, see `scoutos.retry`, and coalesce identical
+requests sent at the same time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping, cast
+
+from scoutos.retry import (
+    RETRYABLE_STATUS_CODES,
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+    CircuitOpenError,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    import httpx
+
+COALESCED_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+"""Methods of the requests that may share the response of an identical
+request in flight. They are safe and idempotent, so sending one request
+instead of several makes no difference to the server."""
+
+_RecordedResponse = tuple[int, list[tuple[bytes, bytes]], bytes, dict]
+
+
+@dataclass
+class PoolStats:
+    """Usage of the connection pool of a single origin."""
+
+    clients: int = 0
+    """The number of clients opened for the origin. More than one means the
+    pool had to be recreated, e.g. because it was used from another event
+    loop."""
+
+    requests: int = 0
+    """The number of requests sent."""
+
+    in_flight: int = 0
+    """The number of requests waiting on a response right now."""
+
+    peak_in_flight: int = 0
+    """The highest number of requests that were waiting on a response at the
+    same time, to compare against `max_connections`."""
+
+    coalesced: int = 0
+    """The number of requests answered with the response of an identical
+    request already in flight, instead of being sent."""
+
+
+class Transport:
+    """Owns long-lived, pooled HTTP clients, one per origin.
+
+    Clients are created on first use. Their connections belong to the event
+    loop they were opened in, so a client used from another event loop is
+    replaced. `http2` requires the `h2` package, e.g. `httpx[http2]`.
+
+    With a `circuit_breaker` policy, requests to an origin that keeps failing,
+    with a retryable status or without a response at all, raise
+    `CircuitOpenError` instead of being sent.
+
+    With `coalesce`, concurrent identical `GET`, `HEAD` and `OPTIONS`
+    requests without a body share a single request. Requests are identical
+    when their method, URL, including its query, and headers, including
+    their credentials, are. The shared response body is read in full before
+    it is handed to each of them, so requests whose body has to be streamed
+    opt out with the `{"coalesce": False}` request extension. The
+    `{"max_body_size": size}` extension bounds the body read, and raises
+    `ResponseTooLargeError` as soon as it is exceeded.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        http2: bool = False,
+        timeout: float | None = 5.0,
+        circuit_breaker: CircuitBreakerPolicy | None = None,
+        coalesce: bool = False,
+    ):
+        self._max_connections = max_connections
+        self._max_keepalive_connections = max_keepalive_connections
+        self._keepalive_expiry = keepalive_expiry
+        self._http2 = http2
+        self._timeout = timeout
+        self._clients: dict[
+            str, tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]
+        ] = {}
+        self._stats: dict[str, PoolStats] = {}
+        self._circuit_breaker = circuit_breaker
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._coalesce = coalesce
+
+    @property
+    def max_connections(self) -> int | None:
+        """The maximum number of connections open to a single origin."""
+        return self._max_connections
+
+    @property
+    def http2(self) -> bool:
+        return self._http2
+
+    @property
+    def coalesce(self) -> bool:
+        """Whether identical requests in flight at the same time are sent
+        once."""
+        return self._coalesce
+
+    @property
+    def stats(self) -> Mapping[str, PoolStats]:
+        """Pool usage, keyed by origin, e.g. `https://slack.com`."""
+        return MappingProxyType(self._stats)
+
+    def circuit_breaker(self, origin: str) -> CircuitBreaker | None:
+        """The circuit breaker of `origin`, or `None` if the transport does
+        not break circuits."""
+        if self._circuit_breaker is None:
+            return None
+
+        breaker = self._breakers.get(origin)
+        if breaker is None:
+            breaker = self._breakers[origin] = CircuitBreaker(self._circuit_breaker)
+
+        return breaker
+
+    def client(self, url: str) -> httpx.AsyncClient:
+        """The pooled client for the origin of `url`. Must be called from
+        within a running event loop."""
+        # Imported here so that importing scoutos does not import httpx.
+        import httpx  # noqa: PLC0415
+
+        origin = _origin(httpx.URL(url))
+        loop = asyncio.get_running_loop()
+        entry = self._clients.get(origin)
+        if entry is not None and entry[0] is loop:
+            return entry[1]
+
+        stats = self._stats.setdefault(origin, PoolStats())
+        stats.clients += 1
+        limits = httpx.Limits(
+            max_connections=self._max_connections,
+            max_keepalive_connections=self._max_keepalive_connections,
+            keepalive_expiry=self._keepalive_expiry,
+        )
+        transport = _MeteredTransport(
+            httpx.AsyncHTTPTransport(limits=limits, http2=self._http2),
+            stats,
+            origin,
+            self.circuit_breaker(origin),
+            coalesce=self._coalesce,
+        )
+        client = httpx.AsyncClient(
+            http2=self._http2,
+            limits=limits,
+            timeout=self._timeout,
+            transport=cast("httpx.AsyncBaseTransport", transport),
+        )
+        self._clients[origin] = (loop, client)
+
+        return client
+
+    async def aclose(self) -> None:
+        """Close every client opened from the running event loop, and forget
+        the clients of other event loops."""
+        loop = asyncio.get_running_loop()
+        clients, self._clients = self._clients, {}
+        for client_loop, client in clients.values():
+            if client_loop is loop:
+                await client.aclose()
+
+
+class _MeteredTransport:
+    """Wraps an `httpx` transport to keep the stats of its pool and the
+    circuit breaker of its origin, and to coalesce identical requests."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        stats: PoolStats,
+        origin: str,
+        breaker: CircuitBreaker | None,
+        *,
+        coalesce: bool = False,
+    ):
+        self._transport = transport
+        self._stats = stats
+        self._origin = origin
+        self._breaker = breaker
+        self._coalesce = coalesce
+        self._shared: dict[tuple, asyncio.Future[_RecordedResponse]] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = _coalescing_key(request) if self._coalesce else None
+        if key is None:
+            return await self._send(request)
+
+        # The request is sent from a task of its own, so that a caller giving
+        # up, e.g. on a timeout, does not cancel it for the others.
+        shared = self._shared.get(key)
+        if shared is None:
+            shared = asyncio.ensure_future(self._send_and_record(request))
+            self._shared[key] = shared
+            shared.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self._stats.coalesced += 1
+
+        status_code, headers, content, extensions = await asyncio.shield(shared)
+
+        # Imported here so that importing scoutos does not import httpx.
+        import httpx  # noqa: PLC0415
+
+        return httpx.Response(
+            status_code,
+            headers=headers,
+            content=content,
+            request=request,
+            extensions=extensions,
+        )
+
+    async def _send_and_record(self, request: httpx.Request) -> _RecordedResponse:
+        max_body_size = request.extensions.get("max_body_size")
+        response = await self._send(request)
+        try:
+            content = bytearray()
+            async for chunk in response.aiter_bytes():
+                content += chunk
+                if max_body_size is not None and len(content) > max_body_size:
+                    raise ResponseTooLargeError(str(request.url), max_body_size)
+        finally:
+            await response.aclose()
+
+        # The content has been decoded, and is handed out as is.
+        headers = [
+            (name, value)
+            for name, value in response.headers.raw
+            if name.lower() not in (b"content-encoding", b"content-length")
+        ]
+        extensions = {
+            name: response.extensions[name]
+            for name in ("http_version", "reason_phrase")
+            if name in response.extensions
+        }
+        return response.status_code, headers, bytes(content), extensions
+
+    def _forget(self, key: tuple, shared: asyncio.Future[_RecordedResponse]) -> None:
+        del self._shared[key]
+        # Every caller may have given up already, leaving nobody to see it.
+        if not shared.cancelled():
+            shared.exception()
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        breaker = self._breaker
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenError(self._origin, breaker.retry_after)
+
+        stats = self._stats
+        stats.requests += 1
+        stats.in_flight += 1
+        stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+        try:
+            response = await self._transport.handle_async_request(request)
+        except Exception:
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+        finally:
+            stats.in_flight -= 1
+
+        if breaker is not None:
+            if response.status_code in RETRYABLE_STATUS_CODES:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _coalescing_key(request: httpx.Request) -> tuple | None:
+    """What identifies `request` among concurrent ones, or `None` if it is not
+    safe to share its response."""
+    if (
+        request.method not in COALESCED_METHODS
+        or request.extensions.get("coalesce") is False
+        or request.headers.get("Content-Length", "0") != "0"
+        or "Transfer-Encoding" in request.headers
+    ):
+        return None
+
+    return (
+        request.method,
+        str(request.url),
+        tuple(sorted(request.headers.raw)),
+        request.extensions.get("max_body_size"),
+    )
+
+
+class ResponseTooLargeError(Exception):
+    """Raised when the body of a coalesced response exceeds the
+    `max_body_size` extension of its request."""
+
+    def __init__(self, url: str, max_body_size: int):
+        self.url = url
+        self.max_body_size = max_body_size
+        message = f"{url} returned a body larger than {max_body_size} bytes"
+        super().__init__(message)
+
+
+def _origin(url: httpx.URL) -> str:
+    port = f":{url.port}" if url.port is not None else ""
+    return f"{url.scheme}://{url.host}{port}"
+
+
+@lru_cache(maxsize=1)
+def get_default_transport() -> Transport:
+    """The process-wide transport used outside of an App, e.g. by blocks run on
+    their own or by secrets."""
+    return Transport()
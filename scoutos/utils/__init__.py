@@ -1,11 +1,22 @@
+from .accepts_positional_args import accepts_positional_args
+from .compile_path import PathGetter, compile_path
 from .default_value import DefaultValue
+from .format_timestamp_ns import format_timestamp_ns
 from .get_current_timestamp import get_current_timestamp
 from .get_nested_value_from_dict import get_nested_value_from_dict
+from .get_package_version import get_package_version
+from .parse_data import parse_data
 from .read_data_from_file import read_data_from_file
 
 __all__ = [
     "DefaultValue",
+    "PathGetter",
+    "accepts_positional_args",
+    "compile_path",
+    "format_timestamp_ns",
     "get_current_timestamp",
     "get_nested_value_from_dict",
+    "get_package_version",
+    "parse_data",
     "read_data_from_file",
 ]
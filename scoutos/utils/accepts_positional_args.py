@@ -0,0 +1,33 @@
+import inspect
+from functools import lru_cache
+from typing import Callable
+
+_POSITIONAL_KINDS = (
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+)
+
+
+def accepts_positional_args(fn: Callable, count: int) -> bool:
+    """Return True if `fn` can be called with `count` positional arguments."""
+    try:
+        return _cached_accepts_positional_args(fn, count)
+    except TypeError:
+        # Unhashable callables, e.g. instances of classes defining `__eq__`
+        # without `__hash__`, cannot be cached.
+        return _accepts_positional_args(fn, count)
+
+
+def _accepts_positional_args(fn: Callable, count: int) -> bool:
+    try:
+        parameters = inspect.signature(fn).parameters.values()
+    except (TypeError, ValueError):
+        return False
+
+    if any(param.kind == inspect.Parameter.VAR_POSITIONAL for param in parameters):
+        return True
+
+    return sum(param.kind in _POSITIONAL_KINDS for param in parameters) >= count
+
+
+_cached_accepts_positional_args = lru_cache(maxsize=1024)(_accepts_positional_args)
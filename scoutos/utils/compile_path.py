@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Callable
+
+PathGetter = Callable[[Any], Any]
+
+
+@lru_cache(maxsize=1024)
+def compile_path(segments: tuple[str, ...]) -> PathGetter:
+    """Compile `segments` into a function returning the value found at that
+    path of its argument, or `None` if it was not found.
+
+    Segments made of digits index into lists and tuples, so `choices.0.text`
+    reads the text of the first choice. Against a dict they are plain keys.
+    """
+    steps = tuple(
+        (segment, int(segment) if segment.isascii() and segment.isdigit() else None)
+        for segment in segments
+    )
+
+    if all(index is None for _, index in steps):
+        keys = tuple(segment for segment, _ in steps)
+        return _compile_key_path(keys)
+
+    def get(data: Any) -> Any:  # noqa: ANN401
+        for key, index in steps:
+            if index is not None and isinstance(data, (list, tuple)):
+                if index >= len(data):
+                    return None
+                data = data[index]
+                continue
+
+            try:
+                data = data[key]
+            except (KeyError, TypeError):
+                return None
+
+        return data
+
+    return get
+
+
+def _compile_key_path(keys: tuple[str, ...]) -> PathGetter:
+    # Paths without list indexes are by far the most common, and so are paths
+    # of a single key, so both skip the per-segment index check.
+    if len(keys) == 1:
+        (key,) = keys
+
+        def get_key(data: Any) -> Any:  # noqa: ANN401
+            try:
+                return data[key]
+            except (KeyError, TypeError):
+                return None
+
+        return get_key
+
+    def get_keys(data: Any) -> Any:  # noqa: ANN401
+        try:
+            for key in keys:
+                data = data[key]
+        except (KeyError, TypeError):
+            return None
+
+        return data
+
+    return get_keys
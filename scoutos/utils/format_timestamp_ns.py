@@ -0,0 +1,15 @@
+import datetime
+
+NANOSECONDS_PER_SECOND = 1_000_000_000
+NANOSECONDS_PER_MICROSECOND = 1_000
+
+
+def format_timestamp_ns(timestamp_ns: int) -> str:
+    """Return a timestamp, given in nanoseconds since the epoch, in UTC as a
+    string."""
+    seconds, remainder_ns = divmod(timestamp_ns, NANOSECONDS_PER_SECOND)
+    ts = datetime.datetime.fromtimestamp(seconds, tz=datetime.timezone.utc).replace(
+        microsecond=remainder_ns // NANOSECONDS_PER_MICROSECOND
+    )
+
+    return ts.isoformat().replace("+00:00", "Z")
@@ -0,0 +1,12 @@
+from functools import cache
+from importlib.metadata import PackageNotFoundError, version
+
+
+@cache
+def get_package_version(name: str = "scoutos") -> str:
+    """The installed version of `name`, or `unknown` when it is not installed,
+    e.g. when running from a source checkout."""
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return "unknown"
@@ -0,0 +1,19 @@
+import json
+
+import yaml
+
+YAMLLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+"""The safe loader backed by libyaml when PyYAML has been built with it, which
+parses many times faster than the pure Python one."""
+
+
+def parse_data(contents: str | bytes, suffix: str) -> dict:
+    """Parse the contents of a JSON or YAML file, given its suffix."""
+    if suffix == ".json":
+        return json.loads(contents)
+
+    if suffix in [".yml", ".yaml"]:
+        return yaml.load(contents, Loader=YAMLLoader)  # noqa: S506
+
+    message = f"No handler found for {suffix} filetype"
+    raise ValueError(message)
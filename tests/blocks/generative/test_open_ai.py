@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import pickle
+import time
 from pathlib import Path
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
+from openai import NOT_GIVEN, APIConnectionError, RateLimitError
 
-from scoutos.blocks import Block
+from scoutos.blocks import Block, BlockRequestError, BlockTimeoutError
 from scoutos.blocks.generative import Generative, OpenAI
 from scoutos.blocks.generative.types import GenerativeInput, GenerativeOutput
+from scoutos.run_context import RunContext
 
 
 def get_fixture_path(fixture_name: str) -> Path:
@@ -69,13 +74,13 @@ def test_initialization():
 
 @pytest.mark.asyncio()
 async def test_run(mocker):
-    mock_openai_class = mocker.patch("scoutos.blocks.generative.open_ai.OGOpenAI")
+    mock_openai_class = mocker.patch("scoutos.blocks.generative.open_ai.AsyncOpenAI")
 
     mock_client = MagicMock()
     mock_openai_class.return_value = mock_client
 
-    mock_client.chat.completions.create.return_value = get_fixture_contents(
-        "open_ai_completion_response"
+    mock_client.chat.completions.create = AsyncMock(
+        return_value=get_fixture_contents("open_ai_completion_response")
     )
 
     run_input = GenerativeInput(
@@ -120,6 +125,7 @@ async def test_run(mocker):
     mock_client.chat.completions.create.assert_called_once_with(
         model="gpt-3.5-turbo",
         messages=run_input["messages"],
+        timeout=NOT_GIVEN,
     )
 
     # # To re-record the fixture data for the OpenAI client:
@@ -131,3 +137,66 @@ async def test_run(mocker):
     # write_fixture(result.output, "open_ai_completion_response")  # noqa: ERA001
 
     assert result == expected_output
+
+
+@pytest.mark.asyncio()
+async def test_run_turns_api_errors_into_retryable_request_errors(mocker):
+    mock_openai_class = mocker.patch("scoutos.blocks.generative.open_ai.AsyncOpenAI")
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    mock_openai_class.return_value.chat.completions.create = AsyncMock()
+    mock_openai_class.return_value.chat.completions.create.side_effect = [
+        RateLimitError(
+            "Rate limit reached",
+            response=httpx.Response(429, headers={"Retry-After": "3"}, request=request),
+            body=None,
+        ),
+        APIConnectionError(request=request),
+    ]
+    block = OpenAI(
+        {
+            "api_key": "sooper-secret-api-key-shush",
+            "key": "test-generative-block",
+            "model": "gpt-3.5-turbo",
+            "retry": {"max_attempts": 2},
+        }
+    )
+
+    with pytest.raises(BlockRequestError, match="Rate limit reached") as e:
+        await block.run({"messages": []})
+
+    assert e.value.status_code == 429  # noqa: PLR2004
+    assert e.value.retry_after == 3  # noqa: PLR2004
+    with pytest.raises(BlockRequestError, match="Connection error") as e:
+        await block.run({"messages": []})
+
+    assert e.value.retryable
+    mock_openai_class.assert_called_with(
+        api_key="sooper-secret-api-key-shush", max_retries=0
+    )
+
+
+@pytest.mark.asyncio()
+async def test_run_is_cancelled_when_it_exceeds_its_time_budget(mocker):
+    mock_openai_class = mocker.patch("scoutos.blocks.generative.open_ai.AsyncOpenAI")
+
+    async def hang(**_kwargs: Any) -> None:
+        await asyncio.sleep(1)
+
+    create = AsyncMock(side_effect=hang)
+    mock_openai_class.return_value.chat.completions.create = create
+    block = OpenAI(
+        {
+            "api_key": "sooper-secret-api-key-shush",
+            "key": "test-generative-block",
+            "model": "gpt-3.5-turbo",
+            "timeout": 0.1,
+        }
+    )
+    started_at = time.monotonic()
+
+    with pytest.raises(BlockTimeoutError) as e:
+        await block.outter_run(RunContext(), override_input={"messages": []})
+
+    assert e.value.block_id == "test-generative-block"
+    assert time.monotonic() - started_at < 0.5  # noqa: PLR2004
+    assert 0 < create.call_args.kwargs["timeout"] <= 0.1  # noqa: PLR2004
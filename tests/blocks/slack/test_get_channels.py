@@ -7,7 +7,7 @@ from unittest.mock import patch
 import httpx
 import pytest
 
-from scoutos.blocks import BlockExecutionError
+from scoutos.blocks import BlockExecutionError, BlockRequestError
 from scoutos.blocks.slack import GetChannels
 
 FAKE_SLACK_TOKEN = "xobx-***"  # noqa: S105
@@ -125,3 +125,15 @@ async def test_when_invalid_user_data_returned():
         match="output failed data validation",
     ):
         await block.run({})
+
+
+@pytest.mark.asyncio()
+async def test_when_connection_fails():
+    block = create_block()
+
+    with patch(
+        HTTPX_GET_PATCH_PATH, side_effect=httpx.ConnectError("connection refused")
+    ), pytest.raises(BlockRequestError, match="http request failed") as excinfo:
+        await block.run({})
+
+    assert excinfo.value.retryable
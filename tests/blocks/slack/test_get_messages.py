@@ -5,7 +5,7 @@ from unittest.mock import patch
 import httpx
 import pytest
 
-from scoutos.blocks.base import BlockExecutionError
+from scoutos.blocks.base import BlockExecutionError, BlockRequestError
 from scoutos.blocks.slack import GetMessages
 
 FAKE_TOKEN = "xoxb-***"  # noqa: S105
@@ -105,3 +105,15 @@ async def test_when_reqeust_fails():
         return_value=stubbed_response,
     ), pytest.raises(BlockExecutionError, match="http request failed"):
         await block.run({"channel": FAKE_CHANNEL_ID})
+
+
+@pytest.mark.asyncio()
+async def test_when_connection_fails():
+    block = create_block()
+
+    with patch(
+        HTTPX_POST_PATCH_PATH, side_effect=httpx.ReadTimeout("timed out")
+    ), pytest.raises(BlockRequestError, match="http request failed") as excinfo:
+        await block.run({"channel": FAKE_CHANNEL_ID})
+
+    assert excinfo.value.status_code is None
@@ -5,7 +5,7 @@ from unittest.mock import patch
 import httpx
 import pytest
 
-from scoutos.blocks.base import BlockExecutionError
+from scoutos.blocks.base import BlockExecutionError, BlockRequestError
 from scoutos.blocks.slack import GetThread
 
 FAKE_TOKEN = "xoxb-***"  # noqa: S105
@@ -108,3 +108,13 @@ async def test_when_reqeust_fails():
         return_value=stubbed_response,
     ), pytest.raises(BlockExecutionError, match="http request failed"):
         await block.run({"channel": FAKE_CHANNEL_ID, "ts": FAKE_TS})
+
+
+@pytest.mark.asyncio()
+async def test_when_connection_fails():
+    block = create_block()
+
+    with patch(
+        HTTPX_GET_PATCH_PATH, side_effect=httpx.ConnectError("connection refused")
+    ), pytest.raises(BlockRequestError, match="http request failed"):
+        await block.run({"channel": FAKE_CHANNEL_ID, "ts": FAKE_TS})
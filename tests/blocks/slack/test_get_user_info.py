@@ -5,7 +5,7 @@ from unittest.mock import patch
 import httpx
 import pytest
 
-from scoutos.blocks import BlockExecutionError
+from scoutos.blocks import BlockExecutionError, BlockRequestError
 from scoutos.blocks.slack import GetUserInfo
 
 FAKE_SLACK_TOKEN = "xoxb-***"  # noqa: S105
@@ -111,3 +111,27 @@ async def test_when_invalid_user_data_returned(block):
         return_value=mock_response(status=200, json=stubbed_response),
     ), pytest.raises(BlockExecutionError, match="output failed data validation"):
         await block.run({"user_id": FAKE_USER_ID})
+
+
+@pytest.mark.asyncio()
+async def test_when_rate_limited(block):
+    response = httpx.Response(429, headers={"Retry-After": "30"}, text="Too Many")
+    response._request = httpx.Request("GET", "https://slack.com/api/users.info")  # noqa: SLF001
+    with patch(
+        "scoutos.blocks.slack.get_user_info.httpx.AsyncClient.get",
+        return_value=response,
+    ), pytest.raises(BlockRequestError, match="http request failed") as excinfo:
+        await block.run({"user_id": FAKE_USER_ID})
+
+    assert excinfo.value.retryable
+    assert excinfo.value.status_code == 429  # noqa: PLR2004
+    assert excinfo.value.retry_after == 30  # noqa: PLR2004
+
+
+@pytest.mark.asyncio()
+async def test_when_connection_fails(block):
+    with patch(
+        "scoutos.blocks.slack.get_user_info.httpx.AsyncClient.get",
+        side_effect=httpx.ConnectError("connection refused"),
+    ), pytest.raises(BlockRequestError, match="http request failed"):
+        await block.run({"user_id": FAKE_USER_ID})
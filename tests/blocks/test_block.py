@@ -1,3 +1,7 @@
+import asyncio
+import time
+
+import httpx
 import pytest
 from typing_extensions import Required
 
@@ -6,8 +10,15 @@ from scoutos.blocks.base import (
     BlockBaseConfig,
     BlockInitializationError,
     BlockOutput,
+    BlockRequestError,
+    BlockTimeoutError,
+    BlockValidationError,
 )
+from scoutos.cache import CacheKeyError, MemoryCache, get_default_cache
 from scoutos.dependencies import Depends
+from scoutos.run_context import RunContext
+from scoutos.run_state import RunState
+from scoutos.schema import SchemaError
 
 
 class MinimalBlockStub(Block):
@@ -21,8 +32,6 @@ def create_block_output(block_id: str, output: dict) -> BlockOutput:
     return BlockOutput(
         block_id=block_id,
         block_run_id="BLOCK-RUN-ID-1234",
-        block_run_end_ts="1970-01-01T00:00:000Z",
-        block_run_start_ts="1970-01-01T00:00:000Z",
         ok=True,
         output=output,
     )
@@ -75,6 +84,24 @@ def test_it_loads_from_valid_data():
     assert isinstance(some_block_instance, Block)
 
 
+def test_load_does_not_modify_the_data():
+    data = {
+        "type": "scoutos_identity",
+        "key": "identity",
+        "depends": [{"path": "input.value", "type": "str"}],
+    }
+    expected = {
+        "type": "scoutos_identity",
+        "key": "identity",
+        "depends": [{"path": "input.value", "type": "str"}],
+    }
+
+    Block.load(data)
+    Block.load(data)
+
+    assert data == expected
+
+
 def test_it_raises_when_missing_key():
     class AnotherBlock(Block):
         TYPE = "test_another_block"
@@ -105,7 +132,7 @@ async def test_it_raises_if_not_initialized_with_super():
     block = ImproperlyInitializedBlock({"key": "some_key"})
 
     with pytest.raises(BlockInitializationError):
-        await block.outter_run([])
+        await block.outter_run(RunContext())
 
 
 @pytest.mark.asyncio()
@@ -130,8 +157,8 @@ async def test_it_runs():
             "depends": [Depends.StrType({"path": "input.foo"})],
         }
     )
-    current_output = [create_block_output("input", {"foo": "baz"})]
-    result = await block.outter_run(current_output)
+    context = RunContext(state=RunState([create_block_output("input", {"foo": "baz"})]))
+    result = await block.outter_run(context)
 
     assert result.ok is True
     assert result.output == {"result": "baz--bazoo"}
@@ -163,3 +190,336 @@ def test_output_schema():
     block = SomeBlock({"key": "test:some_block"})
 
     assert block.output_schema == {}
+
+
+def test_block_output_renders_timestamps_lazily():
+    block_output = BlockOutput(
+        block_id="block_id",
+        block_run_id="BLOCK-RUN-ID-1234",
+        ok=True,
+        output={},
+        started_at_ns=1_000_000_000,
+        duration_ns=1_500_000,
+    )
+
+    assert block_output.block_run_start_ts == "1970-01-01T00:00:01Z"
+    assert block_output.block_run_end_ts == "1970-01-01T00:00:01.001500Z"
+
+
+@pytest.mark.asyncio()
+async def test_outter_run_measures_duration():
+    block = MinimalBlockStub({"key": "stub"})
+    result = await block.outter_run(RunContext(), override_input={"foo": "baz"})
+
+    assert result.duration_ns > 0
+    assert result.started_at_ns > 0
+
+
+class SlowBlockStub(Block):
+    TYPE = "test_slow_block_stub"
+
+    cancelled = False
+
+    async def run(self, run_input: dict) -> dict:
+        try:
+            await asyncio.sleep(run_input.get("sleep", 1))
+        except asyncio.CancelledError:
+            SlowBlockStub.cancelled = True
+            raise
+        return run_input
+
+
+@pytest.mark.asyncio()
+async def test_outter_run_cancels_block_exceeding_its_timeout():
+    SlowBlockStub.cancelled = False
+    block = SlowBlockStub({"key": "slow", "timeout": 0.01})
+
+    with pytest.raises(BlockTimeoutError, match="slow exceeded") as exc_info:
+        await block.outter_run(RunContext(), override_input={"sleep": 1})
+
+    assert block.timeout == 0.01  # noqa: PLR2004
+    assert exc_info.value.block_id == "slow"
+    assert SlowBlockStub.cancelled is True
+
+
+@pytest.mark.asyncio()
+async def test_outter_run_is_bounded_by_the_run_deadline():
+    block = SlowBlockStub({"key": "slow", "timeout": 10})
+    context = RunContext(deadline=time.monotonic() + 0.01)
+
+    with pytest.raises(BlockTimeoutError) as exc_info:
+        await block.outter_run(context, override_input={"sleep": 1})
+
+    assert exc_info.value.budget < 1
+
+
+class TimingOutBlockStub(Block):
+    TYPE = "test_timing_out_block_stub"
+
+    async def run(self, run_input: dict) -> dict:
+        message = "read timed out"
+        raise run_input["error"](message)
+
+
+@pytest.mark.asyncio()
+# Distinct classes before Python 3.11, the same one since.
+@pytest.mark.parametrize("error", [TimeoutError, asyncio.TimeoutError])
+async def test_outter_run_reraises_timeouts_raised_within_its_budget(error):
+    block = TimingOutBlockStub({"key": "socket", "timeout": 10})
+
+    with pytest.raises(error, match="read timed out"):
+        await block.outter_run(RunContext(), override_input={"error": error})
+
+
+@pytest.mark.asyncio()
+async def test_outter_run_completes_within_its_timeout():
+    block = SlowBlockStub({"key": "slow", "timeout": 1})
+    result = await block.outter_run(RunContext(), override_input={"sleep": 0})
+
+    assert result.output == {"sleep": 0}
+
+
+class FailingBlockStub(Block):
+    TYPE = "test_failing_block_stub"
+
+    def __init__(self, config: BlockBaseConfig, errors: list[BlockRequestError]):
+        super().__init__(config)
+        self.errors = errors
+        self.runs = 0
+
+    async def run(self, run_input: dict) -> dict:
+        self.runs += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return run_input
+
+
+NO_BACKOFF = {"initial_delay": 0, "jitter": False}
+
+
+@pytest.mark.asyncio()
+async def test_outter_run_retries_transient_failures():
+    block = FailingBlockStub(
+        {"key": "flaky", "retry": {"initial_delay": 0.01, "jitter": False}},
+        [BlockRequestError("down", status_code=503), BlockRequestError("reset")],
+    )
+
+    result = await block.outter_run(RunContext(), override_input={"foo": "baz"})
+
+    assert result.output == {"foo": "baz"}
+    assert block.runs == 3  # noqa: PLR2004
+    assert result.timings.retries == 2  # noqa: PLR2004
+    # Backoff of 0.01s, then 0.02s, all of which is part of `run`.
+    assert 30_000_000 <= result.timings.backoff_ns <= result.timings.run_ns  # noqa: PLR2004
+
+
+@pytest.mark.asyncio()
+async def test_outter_run_gives_up_after_max_attempts():
+    block = FailingBlockStub(
+        {"key": "flaky", "retry": {**NO_BACKOFF, "max_attempts": 2}},
+        [BlockRequestError("down", status_code=503) for _ in range(3)],
+    )
+
+    with pytest.raises(BlockRequestError, match="down"):
+        await block.outter_run(RunContext(), override_input={})
+
+    assert block.runs == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    ("config", "error"),
+    [
+        ({"key": "flaky"}, BlockRequestError("down", status_code=503)),
+        (
+            {"key": "flaky", "retry": NO_BACKOFF},
+            BlockRequestError("not found", status_code=404),
+        ),
+        (
+            {"key": "flaky", "retry": {**NO_BACKOFF, "max_delay": 1}},
+            BlockRequestError("slow down", status_code=429, retry_after=60),
+        ),
+    ],
+    ids=["without-policy", "not-retryable", "retry-after-too-long"],
+)
+async def test_outter_run_does_not_retry(config, error):
+    block = FailingBlockStub(config, [error])
+
+    with pytest.raises(BlockRequestError):
+        await block.outter_run(RunContext(), override_input={})
+
+    assert block.runs == 1
+
+
+@pytest.mark.asyncio()
+async def test_outter_run_does_not_retry_past_the_run_deadline():
+    block = FailingBlockStub(
+        {"key": "flaky", "retry": {"initial_delay": 5, "jitter": False}},
+        [BlockRequestError("down", status_code=503)],
+    )
+    context = RunContext(deadline=time.monotonic() + 1)
+
+    with pytest.raises(BlockRequestError):
+        await block.outter_run(context, override_input={})
+
+    assert block.runs == 1
+
+
+def test_block_request_error_from_response():
+    response = httpx.Response(503, headers={"Retry-After": "2"})
+
+    error = BlockRequestError.from_response("unavailable", response)
+
+    assert str(error) == "unavailable"
+    assert error.status_code == 503  # noqa: PLR2004
+    assert error.retry_after == 2  # noqa: PLR2004
+    assert error.retryable
+
+
+class CountingBlockStub(Block):
+    TYPE = "test_counting_block_stub"
+
+    def __init__(self, config: BlockBaseConfig):
+        super().__init__(config)
+        self.runs = 0
+
+    async def run(self, run_input: dict) -> dict:
+        self.runs += 1
+        return run_input
+
+
+@pytest.mark.asyncio()
+async def test_outter_run_reuses_cached_outputs():
+    cache = MemoryCache()
+    block = CountingBlockStub({"key": "counting", "cache": cache})
+
+    first = await block.outter_run(RunContext(), override_input={"foo": "baz"})
+    second = await block.outter_run(RunContext(), override_input={"foo": "baz"})
+    third = await block.outter_run(RunContext(), override_input={"foo": "qux"})
+
+    assert block.runs == 2  # noqa: PLR2004
+    assert (first.cached, second.cached, third.cached) == (False, True, False)
+    assert second.output == {"foo": "baz"}
+    assert cache.stats.hits == 1
+
+
+@pytest.mark.asyncio()
+async def test_outter_run_splits_its_duration_into_phases():
+    cache = MemoryCache()
+    block = CountingBlockStub({"key": "counting", "cache": cache})
+
+    first = await block.outter_run(RunContext(), override_input={"foo": "baz"})
+    second = await block.outter_run(RunContext(), override_input={"foo": "baz"})
+
+    for output in (first, second):
+        timings = output.timings
+        assert timings.queue_wait_ns == 0
+        assert min(timings.resolve_ns, timings.run_ns, timings.overhead_ns) >= 0
+        assert (
+            timings.resolve_ns + timings.run_ns + timings.overhead_ns
+            == output.duration_ns
+        )
+
+    assert first.timings.run_ns > 0
+    assert second.timings.run_ns == 0
+
+
+class Opaque:
+    pass
+
+
+def test_cache_rejects_config_that_cannot_be_hashed_deterministically():
+    with pytest.raises(CacheKeyError, match="Opaque"):
+        MinimalBlockStub({"key": "stub", "cache": True, "client": Opaque()})  # type: ignore[typeddict-unknown-key]
+
+    block = MinimalBlockStub(
+        {"key": "stub", "cache": True, "client": Opaque(), "cache_version": "1"}  # type: ignore[typeddict-unknown-key]
+    )
+    assert block.cache is get_default_cache()
+
+
+@pytest.mark.asyncio()
+async def test_outter_run_does_not_cache_input_that_cannot_be_hashed():
+    cache = MemoryCache()
+    block = CountingBlockStub({"key": "counting", "cache": cache})
+
+    for _ in range(2):
+        output = await block.outter_run(RunContext(), override_input={"o": Opaque()})
+        assert not output.cached
+
+    assert block.runs == 2  # noqa: PLR2004
+    assert len(cache) == 0
+
+
+def test_cache_is_disabled_by_default():
+    assert MinimalBlockStub({"key": "stub"}).cache is None
+
+
+def test_cache_true_uses_the_default_cache():
+    assert MinimalBlockStub({"key": "stub", "cache": True}).cache is (
+        get_default_cache()
+    )
+
+
+@pytest.mark.asyncio()
+async def test_outter_run_validates_input_against_its_schema():
+    block = MinimalBlockStub(
+        {"key": "stub", "input_schema": {"required": ["foo"]}},
+    )
+
+    with pytest.raises(BlockValidationError, match="input of block stub") as exc_info:
+        await block.outter_run(RunContext(), override_input={"bar": "baz"})
+
+    assert exc_info.value.block_id == "stub"
+    assert exc_info.value.kind == "input"
+    assert exc_info.value.error.reason == "missing required property `foo`"
+
+
+@pytest.mark.asyncio()
+async def test_outter_run_validates_output_against_its_schema():
+    block = MinimalBlockStub(
+        {
+            "key": "stub",
+            "output_schema": {"properties": {"foo": {"type": "integer"}}},
+        },
+    )
+
+    with pytest.raises(BlockValidationError, match="foo: expected integer"):
+        await block.outter_run(RunContext(), override_input={"foo": "baz"})
+
+
+@pytest.mark.asyncio()
+async def test_outter_run_skips_validation_when_disabled_for_the_run():
+    block = MinimalBlockStub({"key": "stub", "input_schema": {"required": ["foo"]}})
+    context = RunContext(validate_schemas=False)
+
+    result = await block.outter_run(context, override_input={"bar": "baz"})
+
+    assert result.output == {"bar": "baz"}
+
+
+def test_invalid_schemas_raise_on_initialization():
+    with pytest.raises(SchemaError):
+        MinimalBlockStub({"key": "stub", "output_schema": {"$ref": "#/user"}})
+
+
+class BudgetReportingBlockStub(Block):
+    TYPE = "test_budget_reporting_block_stub"
+
+    async def run(self, run_input: dict) -> dict:
+        return {"budget": self.remaining_budget(), **run_input}
+
+
+@pytest.mark.asyncio()
+async def test_blocks_can_read_their_remaining_budget():
+    unbounded = BudgetReportingBlockStub({"key": "unbounded"})
+    bounded = BudgetReportingBlockStub({"key": "bounded", "timeout": 5})
+
+    unbounded_output = await unbounded.outter_run(RunContext(), override_input={})
+    bounded_output = await bounded.outter_run(
+        RunContext(deadline=time.monotonic() + 1), override_input={}
+    )
+
+    assert unbounded_output.output["budget"] is None
+    assert 0 < bounded_output.output["budget"] <= 1
+    assert bounded.remaining_budget() is None
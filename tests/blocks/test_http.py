@@ -1,10 +1,41 @@
-from unittest.mock import patch
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable
+from unittest.mock import Mock
 
 import httpx
 import pytest
 
-from scoutos.blocks import Block
-from scoutos.blocks.http import Http
+from scoutos.blocks import Block, BlockRequestError
+from scoutos.blocks.http import Http, HttpResponseTooLargeError, iter_ndjson
+from scoutos.cache import MemoryCache, SQLiteCache, get_default_http_cache
+from scoutos.transport import Transport
+
+
+def create_block(**config: Any) -> Http:
+    return Http(
+        {"key": "test_http_block", "url": "https://www.example.com", **config}  # type: ignore[typeddict-item]
+    )
+
+
+async def stream(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.fixture()
+def respond(mocker) -> Callable[[httpx.Response], None]:
+    """Answer every request sent through a transport with `response`."""
+
+    def respond_with(response: httpx.Response) -> None:
+        mocker.patch.object(
+            httpx.AsyncHTTPTransport, "handle_async_request", return_value=response
+        )
+
+    return respond_with
 
 
 def test_initialization():
@@ -15,18 +46,9 @@ def test_initialization():
 
 
 @pytest.mark.asyncio()
-@patch(
-    "scoutos.blocks.http.httpx.AsyncClient.request",
-    return_value=httpx.Response(200, json={"foo": "baz"}),
-)
-async def test_json_response(mocker):  # noqa: ARG001
-    block = Http(
-        {
-            "key": "test_http_block",
-            "url": "https://www.example.com",
-            "response_type": "json",
-        }
-    )
+async def test_json_response(respond):
+    respond(httpx.Response(200, json={"foo": "baz"}))
+    block = create_block(response_type="json")
 
     result = await block.run({})
 
@@ -34,19 +56,259 @@ async def test_json_response(mocker):  # noqa: ARG001
 
 
 @pytest.mark.asyncio()
-@patch(
-    "scoutos.blocks.http.httpx.AsyncClient.request",
-    return_value=httpx.Response(200, text="This is the expected text"),
-)
-async def test_text_response(mocker):  # noqa: ARG001
-    block = Http(
-        {
-            "key": "test_http_block",
-            "url": "https://www.example.com",
-            "response_type": "text",
-        }
-    )
+async def test_text_response(respond):
+    respond(httpx.Response(200, text="This is the expected text"))
+    block = create_block(response_type="text")
 
     result = await block.run({})
 
     assert result == {"result": "This is the expected text"}
+
+
+@pytest.mark.asyncio()
+async def test_text_response_replaces_undecodable_bytes(respond):
+    respond(
+        httpx.Response(
+            200,
+            headers={"Content-Type": "text/plain; charset=utf-8"},
+            content=stream(b"caf\xe9 au lait"),
+        )
+    )
+    block = create_block(response_type="text")
+
+    result = await block.run({})
+
+    assert result == {"result": "caf\ufffd au lait"}
+
+
+@pytest.mark.asyncio()
+async def test_bytes_response(respond):
+    respond(httpx.Response(200, content=stream(b"\x00\x01", b"\x02")))
+    block = create_block(response_type="bytes")
+
+    result = await block.run({})
+
+    assert result == {"result": b"\x00\x01\x02"}
+
+
+@pytest.mark.asyncio()
+async def test_ndjson_response_decodes_records_across_chunks(respond):
+    respond(
+        httpx.Response(200, content=stream(b'{"id": 1}\n{"i', b'd": 2}\n\n{"id": 3}'))
+    )
+    block = create_block(response_type="ndjson")
+
+    result = await block.run({})
+
+    assert result == {"result": [{"id": 1}, {"id": 2}, {"id": 3}]}
+
+
+@pytest.mark.asyncio()
+async def test_file_response_streams_the_body_to_disk(respond):
+    records = [{"id": index} for index in range(3)]
+    body = b"".join(json.dumps(record).encode() + b"\n" for record in records)
+    respond(
+        httpx.Response(
+            200,
+            headers={"Content-Type": "application/x-ndjson"},
+            content=stream(body[:10], body[10:]),
+        )
+    )
+    block = create_block(response_type="file")
+
+    result = (await block.run({}))["result"]
+
+    assert result["size"] == len(body)
+    assert result["content_type"] == "application/x-ndjson"
+    assert_downloaded(Path(result["path"]), body, records)
+
+
+def assert_downloaded(path: Path, body: bytes, records: list[dict]) -> None:
+    assert path.read_bytes() == body
+    assert list(iter_ndjson(path)) == records
+    path.unlink()
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("response_type", ["json", "ndjson", "file"])
+async def test_bodies_larger_than_max_body_size_are_rejected(
+    respond, response_type, tmp_path, monkeypatch
+):
+    monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+    respond(httpx.Response(200, content=stream(b'{"id": 1}\n', b'{"id": 2}\n')))
+    block = create_block(response_type=response_type, max_body_size=15)
+
+    with pytest.raises(HttpResponseTooLargeError, match="larger than 15 bytes"):
+        await block.run({})
+
+    assert not any(tmp_path.iterdir())
+
+
+@pytest.mark.asyncio()
+async def test_declared_content_length_is_checked_before_reading(respond):
+    respond(httpx.Response(200, headers={"Content-Length": "2048"}, content=b""))
+    block = create_block(max_body_size=1024)
+
+    with pytest.raises(HttpResponseTooLargeError) as e:
+        await block.run({})
+
+    assert e.value.max_body_size == 1024  # noqa: PLR2004
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("config", [{}, {"max_body_size": None}])
+async def test_bodies_of_any_size_are_accepted_without_max_body_size(respond, config):
+    respond(httpx.Response(200, content=stream(b"x" * 2048)))
+    block = create_block(response_type="text", **config)
+
+    result = await block.run({})
+
+    assert result == {"result": "x" * 2048}
+
+
+@pytest.mark.asyncio()
+async def test_error_response(respond):
+    respond(httpx.Response(503, headers={"Retry-After": "1"}))
+    block = create_block()
+
+    with pytest.raises(BlockRequestError, match=r"GET https://www\.example\.com") as e:
+        await block.run({})
+
+    assert e.value.status_code == 503  # noqa: PLR2004
+    assert e.value.retry_after == 1
+
+
+@pytest.mark.asyncio()
+async def test_connection_error(mocker):
+    mocker.patch.object(
+        httpx.AsyncHTTPTransport,
+        "handle_async_request",
+        side_effect=httpx.ConnectError("refused"),
+    )
+    block = create_block()
+
+    with pytest.raises(BlockRequestError, match="refused") as e:
+        await block.run({})
+
+    assert e.value.retryable
+
+
+@pytest.fixture()
+def server(mocker) -> Mock:
+    """Answer requests with the responses appended to `server.responses`, and
+    record the requests received."""
+    received: list[httpx.Request] = []
+
+    async def handle_async_request(_self, request: httpx.Request) -> httpx.Response:
+        received.append(request)
+        return stub.responses.pop(0)
+
+    stub = Mock(requests=received, responses=[])
+    mocker.patch.object(
+        httpx.AsyncHTTPTransport, "handle_async_request", handle_async_request
+    )
+    return stub
+
+
+@pytest.mark.asyncio()
+async def test_fresh_responses_are_served_from_the_http_cache(server):
+    server.responses = [
+        httpx.Response(200, headers={"Cache-Control": "max-age=60"}, json=[1]),
+    ]
+    block = create_block(http_cache=MemoryCache())
+
+    assert await block.run({}) == {"result": [1]}
+    assert await block.run({}) == {"result": [1]}
+    assert len(server.requests) == 1
+
+
+@pytest.mark.asyncio()
+async def test_stale_responses_are_revalidated(server, tmp_path):
+    server.responses = [
+        httpx.Response(200, headers={"ETag": '"v1"'}, json={"version": 1}),
+        httpx.Response(304, headers={"ETag": '"v1"'}),
+        httpx.Response(200, headers={"ETag": '"v2"'}, json={"version": 2}),
+    ]
+    http_cache = SQLiteCache(tmp_path / "http.sqlite")
+
+    results = [await create_block(http_cache=http_cache).run({}) for _ in range(3)]
+
+    assert results == [
+        {"result": {"version": 1}},
+        {"result": {"version": 1}},
+        {"result": {"version": 2}},
+    ]
+    assert [request.headers.get("If-None-Match") for request in server.requests] == [
+        None,
+        '"v1"',
+        '"v1"',
+    ]
+    http_cache.close()
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"http_cache": False},
+        {"http_cache": True, "method": "post"},
+        {"http_cache": True, "response_type": "file"},
+    ],
+)
+async def test_responses_are_only_cached_for_get_requests_when_enabled(config):
+    assert create_block(**config).http_cache is None
+
+
+def test_http_cache_true_uses_the_default_http_cache():
+    assert create_block(http_cache=True).http_cache is get_default_http_cache()
+
+
+@pytest.mark.asyncio()
+async def test_templated_get_requests_are_sent_without_a_body(server):
+    server.responses = [httpx.Response(200, json={}), httpx.Response(200, json={})]
+    get = create_block(url="https://www.example.com/users/{{ id }}")
+    post = create_block(url="https://www.example.com/users/{{ id }}", method="post")
+
+    await get.run({"id": 1})
+    await post.run({"id": 1})
+
+    assert [request.content for request in server.requests] == [b"", b"id=1"]
+
+
+@pytest.mark.asyncio()
+async def test_identical_get_requests_in_flight_are_coalesced(mocker):
+    async def handle_async_request(_self, _request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"id": 1})
+
+    mocker.patch.object(
+        httpx.AsyncHTTPTransport, "handle_async_request", handle_async_request
+    )
+    transport = Transport(coalesce=True)
+    blocks = [
+        create_block(url="https://www.example.com/users/{{ id }}", response_type=kind)
+        for kind in ("json", "json", "file")
+    ]
+    for block in blocks:
+        block.transport = transport
+
+    results = await asyncio.gather(*(block.run({"id": 1}) for block in blocks))
+
+    assert results[0] == results[1] == {"result": {"id": 1}}
+    assert transport.stats["https://www.example.com"].requests == 2  # noqa: PLR2004
+    assert transport.stats["https://www.example.com"].coalesced == 1
+    assert_downloaded(Path(results[2]["result"]["path"]), b'{"id":1}', [{"id": 1}])
+    await transport.aclose()
+
+
+@pytest.mark.asyncio()
+async def test_coalesced_bodies_larger_than_max_body_size_are_rejected(respond):
+    respond(httpx.Response(200, content=stream(b"x" * 2048)))
+    block = create_block(response_type="text", max_body_size=1024)
+    block.transport = Transport(coalesce=True)
+
+    with pytest.raises(HttpResponseTooLargeError) as e:
+        await block.run({})
+
+    assert e.value.max_body_size == 1024  # noqa: PLR2004
+    await block.transport.aclose()
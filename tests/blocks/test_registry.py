@@ -0,0 +1,70 @@
+import subprocess
+import sys
+from importlib.metadata import EntryPoint
+
+import pytest
+
+import scoutos.blocks
+from scoutos.blocks import Block, Identity, registry
+from scoutos.blocks.registry import (
+    BUILTIN_BLOCKS,
+    ENTRY_POINT_GROUP,
+    block_types,
+    load_block_class,
+)
+
+
+@pytest.fixture()
+def plugin_entry_points(mocker):
+    entry_point = EntryPoint(
+        name="acme:identity",
+        value="scoutos.blocks.identity:Identity",
+        group=ENTRY_POINT_GROUP,
+    )
+    mocker.patch(
+        "scoutos.blocks.registry.entry_points",
+        return_value=[entry_point],
+    )
+    registry._entry_points.cache_clear()  # noqa: SLF001
+    yield
+    registry._entry_points.cache_clear()  # noqa: SLF001
+
+
+@pytest.mark.parametrize("block_type", list(BUILTIN_BLOCKS))
+def test_it_loads_builtin_blocks(block_type):
+    block_cls = load_block_class(block_type)
+
+    assert issubclass(block_cls, Block)
+    assert block_type == block_cls.TYPE
+
+
+@pytest.mark.usefixtures("plugin_entry_points")
+def test_it_loads_blocks_from_entry_points():
+    assert load_block_class("acme:identity") is Identity
+    assert "acme:identity" in block_types()
+    assert "scoutos_input" in block_types()
+
+
+@pytest.mark.usefixtures("plugin_entry_points")
+def test_it_returns_none_for_unknown_block_types():
+    assert load_block_class("acme:unknown") is None
+
+
+def test_blocks_package_raises_on_unknown_attributes():
+    with pytest.raises(AttributeError, match="has no attribute 'Nope'"):
+        scoutos.blocks.Nope  # noqa: B018
+
+
+def test_importing_scoutos_does_not_import_every_block():
+    code = (
+        "import sys, scoutos; "
+        "print(sorted({'httpx', 'jinja2', 'openai'} & sys.modules.keys()))"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,110 @@
+import pytest
+from freezegun import freeze_time
+
+from scoutos.cache import (
+    CachedResponse,
+    create_http_cache_key,
+    get_default_http_cache,
+)
+from scoutos.cache.http import freshness_lifetime, parse_cache_control
+
+
+def test_parse_cache_control():
+    assert parse_cache_control('Max-Age=60, no-cache="Set-Cookie", private,') == {
+        "max-age": "60",
+        "no-cache": "Set-Cookie",
+        "private": None,
+    }
+    assert parse_cache_control(None) == {}
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        ({"Cache-Control": "max-age=60"}, 60),
+        ({"Cache-Control": "max-age=60", "Age": "15"}, 45),
+        ({"Cache-Control": "max-age=60", "Age": "90"}, 0),
+        ({"Cache-Control": "max-age=soon"}, 0),
+        ({"Cache-Control": "no-cache, max-age=60"}, 0),
+        (
+            {
+                "Date": "Mon, 01 Jan 2024 00:00:00 GMT",
+                "Expires": "Mon, 01 Jan 2024 00:02:00 GMT",
+            },
+            120,
+        ),
+        ({"Expires": "Mon, 01 Jan 2024 00:00:30 GMT"}, 30),
+        ({"Expires": "0"}, 0),
+        ({}, 0),
+    ],
+)
+@freeze_time("2024-01-01 00:00:00")
+def test_freshness_lifetime(headers, expected):
+    directives = parse_cache_control(headers.get("Cache-Control"))
+
+    assert freshness_lifetime(headers, directives) == expected
+
+
+def test_fresh_responses_are_reused_until_they_expire():
+    with freeze_time("2024-01-01 00:00:00") as frozen:
+        entry = CachedResponse.from_headers(
+            {"foo": "bar"},
+            {"Cache-Control": "max-age=60", "Content-Type": "application/json"},
+        )
+
+        assert entry is not None
+        assert entry.is_fresh
+        assert entry.headers == {"Cache-Control": "max-age=60"}
+        assert entry.validators == {}
+        frozen.tick(61)
+        assert not entry.is_fresh
+
+
+def test_responses_that_cannot_be_reused_are_not_stored():
+    assert CachedResponse.from_headers("value", {"Cache-Control": "no-store"}) is None
+    assert CachedResponse.from_headers("value", {"Cache-Control": "no-cache"}) is None
+
+
+def test_stale_responses_are_revalidated_with_their_validators():
+    entry = CachedResponse.from_headers(
+        "value",
+        {
+            "Cache-Control": "no-cache",
+            "ETag": '"v1"',
+            "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+        },
+    )
+
+    assert entry is not None
+    assert not entry.is_fresh
+    assert entry.validators == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+    }
+
+
+def test_revalidated_entries_take_the_headers_of_the_304():
+    entry = CachedResponse.from_headers("value", {"ETag": '"v1"'})
+    assert entry is not None
+
+    revalidated = entry.revalidated({"Cache-Control": "max-age=60", "ETag": ""})
+
+    assert revalidated is not None
+    assert revalidated.value == "value"
+    assert revalidated.is_fresh
+    assert revalidated.headers == {"ETag": '"v1"', "Cache-Control": "max-age=60"}
+
+
+def test_http_cache_keys_depend_on_the_request_and_its_decoding():
+    key = create_http_cache_key("https://example.com", {"Accept": "*/*"}, "json")
+
+    assert key == create_http_cache_key(
+        "https://example.com", {"Accept": "*/*"}, "json"
+    )
+    assert key != create_http_cache_key("https://example.com", {}, "json")
+    assert key != create_http_cache_key("https://example.com", None, "text")
+    assert key != create_http_cache_key("https://example.org", None, "json")
+
+
+def test_default_http_cache_is_shared():
+    assert get_default_http_cache() is get_default_http_cache()
@@ -0,0 +1,188 @@
+import os
+import sys
+
+import pytest
+from pydantic import BaseModel
+
+from scoutos.cache import (
+    CacheKeyError,
+    MemoryCache,
+    create_cache_key,
+    create_snapshot_key,
+)
+
+
+class Payload(BaseModel):
+    name: str
+
+
+def test_same_type_config_and_input_share_a_key():
+    first = create_cache_key("block", {"template": "{{ x }}"}, {"x": 1})
+    second = create_cache_key("block", {"template": "{{ x }}"}, {"x": 1})
+
+    assert first == second
+
+
+def test_input_config_and_type_change_the_key():
+    key = create_cache_key("block", {"template": "a"}, {"x": 1})
+
+    assert key != create_cache_key("block", {"template": "a"}, {"x": 2})
+    assert key != create_cache_key("block", {"template": "b"}, {"x": 1})
+    assert key != create_cache_key("other", {"template": "a"}, {"x": 1})
+
+
+def test_non_semantic_config_is_ignored():
+    key = create_cache_key("block", {"key": "first", "timeout": 1}, {})
+
+    assert key == create_cache_key(
+        "block", {"key": "second", "cache": MemoryCache()}, {}
+    )
+
+
+def test_fingerprints_values_json_cannot_encode():
+    key = create_cache_key(
+        "block",
+        {"model": Payload(name="a"), "tags": {"b", "a"}, "blob": b"data"},
+        {"when": Payload},
+    )
+
+    assert key == create_cache_key(
+        "block",
+        {"model": Payload(name="a"), "tags": {"a", "b"}, "blob": b"data"},
+        {"when": Payload},
+    )
+    assert key != create_cache_key(
+        "block",
+        {"model": Payload(name="b"), "tags": {"a", "b"}, "blob": b"data"},
+        {"when": Payload},
+    )
+
+
+def test_fingerprints_functions_by_code():
+    def double(x: int) -> int:
+        return x * 2
+
+    def triple(x: int) -> int:
+        return x * 3
+
+    assert create_cache_key("block", {"fn": double}, {}) == create_cache_key(
+        "block", {"fn": double}, {}
+    )
+    assert create_cache_key("block", {"fn": double}, {}) != create_cache_key(
+        "block", {"fn": triple}, {}
+    )
+
+
+def test_fingerprints_closures_by_the_values_they_close_over():
+    def make(n: int):  # noqa: ANN202
+        return lambda d: {"v": d["x"] * n}
+
+    assert create_cache_key("block", {"fn": make(2)}, {}) == create_cache_key(
+        "block", {"fn": make(2)}, {}
+    )
+    assert create_cache_key("block", {"fn": make(2)}, {}) != create_cache_key(
+        "block", {"fn": make(10)}, {}
+    )
+
+
+def test_fingerprints_functions_by_their_defaults():
+    def scale(x: int, factor: int = 2) -> int:
+        return x * factor
+
+    key = create_cache_key("block", {"fn": scale}, {})
+    scale.__defaults__ = (3,)
+
+    assert key != create_cache_key("block", {"fn": scale}, {})
+
+
+def test_function_fingerprints_do_not_depend_on_memory_addresses():
+    # Each `eval` compiles new code objects, at new addresses, including the
+    # one of the nested comprehension.
+    source = "lambda d: [x for x in d if x]"
+
+    assert create_cache_key("block", {"fn": eval(source)}, {}) == create_cache_key(  # noqa: S307
+        "block",
+        {"fn": eval(source)},  # noqa: S307
+        {},
+    )
+
+
+def test_values_without_a_deterministic_fingerprint_are_rejected():
+    class Opaque:
+        pass
+
+    with pytest.raises(CacheKeyError, match="Opaque values cannot be"):
+        create_cache_key("block", {"client": Opaque()}, {})
+    with pytest.raises(CacheKeyError):
+        create_cache_key("block", {}, {"client": Opaque()})
+
+
+def test_cache_version_stands_in_for_config_without_a_fingerprint():
+    class Opaque:
+        pass
+
+    key = create_cache_key("block", {"client": Opaque(), "cache_version": "1"}, {})
+
+    assert key == create_cache_key(
+        "block", {"client": Opaque(), "cache_version": "1"}, {}
+    )
+    assert key != create_cache_key(
+        "block", {"client": Opaque(), "cache_version": "2"}, {}
+    )
+
+
+def test_functions_closing_over_unassigned_variables_are_rejected():
+    def outer():  # noqa: ANN202
+        def inner():  # noqa: ANN202
+            return later
+
+        with pytest.raises(CacheKeyError, match="unassigned"):
+            create_cache_key("block", {"fn": inner}, {})
+        later = 1
+        return later
+
+    outer()
+
+
+def test_fingerprints_builtins_by_name():
+    assert create_cache_key("block", {"fn": len}, {}) != create_cache_key(
+        "block", {"fn": abs}, {}
+    )
+
+
+def test_fingerprints_other_values_by_repr():
+    assert create_cache_key("block", {}, {"value": 1j}) != create_cache_key(
+        "block", {}, {"value": 2j}
+    )
+
+
+def test_snapshot_key_changes_with_contents_suffix_and_version(mocker):
+    key = create_snapshot_key(b"blocks: []", ".yaml")
+
+    assert key == create_snapshot_key(b"blocks: []", ".yaml")
+    assert key != create_snapshot_key(b"blocks: [] ", ".yaml")
+    assert key != create_snapshot_key(b"blocks: []", ".json")
+
+    module = sys.modules["scoutos.cache.key"]
+    mocker.patch.object(module, "get_package_version", return_value="0.0.0-test")
+    module._code_version.cache_clear()  # noqa: SLF001
+
+    assert key != create_snapshot_key(b"blocks: []", ".yaml")
+    module._code_version.cache_clear()  # noqa: SLF001
+
+
+def test_snapshot_key_changes_with_the_sources_without_a_version(mocker, tmp_path):
+    module = sys.modules["scoutos.cache.key"]
+    mocker.patch.object(module, "get_package_version", return_value="unknown")
+    mocker.patch.object(module, "__file__", str(tmp_path / "cache" / "key.py"))
+    source = tmp_path / "blocks.py"
+    source.write_text("")
+    os.utime(source, ns=(0, 1_000_000_000))
+    module._code_version.cache_clear()  # noqa: SLF001
+    key = create_snapshot_key(b"blocks: []", ".yaml")
+
+    os.utime(source, ns=(0, 2_000_000_000))
+    module._code_version.cache_clear()  # noqa: SLF001
+
+    assert key != create_snapshot_key(b"blocks: []", ".yaml")
+    module._code_version.cache_clear()  # noqa: SLF001
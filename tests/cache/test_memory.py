@@ -0,0 +1,55 @@
+from freezegun import freeze_time
+
+from scoutos.cache import MemoryCache, get_default_cache
+
+
+def test_returns_none_on_miss_and_counts_stats():
+    cache = MemoryCache()
+
+    assert cache.get("missing") is None
+    cache.set("key", {"foo": "bar"})
+    assert cache.get("key") == {"foo": "bar"}
+
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.hit_rate == 0.5  # noqa: PLR2004
+
+
+def test_hit_rate_without_lookups():
+    assert MemoryCache().stats.hit_rate == 0.0
+
+
+def test_does_not_store_none():
+    cache = MemoryCache()
+    cache.set("key", None)
+
+    assert len(cache) == 0
+
+
+def test_evicts_least_recently_used_entries():
+    cache = MemoryCache(max_size=2)
+    cache.set("first", 1)
+    cache.set("second", 2)
+    cache.get("first")
+    cache.set("third", 3)
+
+    assert len(cache) == 2  # noqa: PLR2004
+    assert cache.get("second") is None
+    assert cache.get("first") == 1
+    assert cache.get("third") == 3  # noqa: PLR2004
+
+
+def test_expires_entries_after_ttl():
+    with freeze_time("2024-01-01 00:00:00") as frozen:
+        cache = MemoryCache(ttl=10)
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+
+        frozen.tick(11)
+
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+
+def test_default_cache_is_shared():
+    assert get_default_cache() is get_default_cache()
@@ -0,0 +1,65 @@
+from freezegun import freeze_time
+
+from scoutos.cache import SQLiteCache
+
+
+def test_persists_values_across_connections(tmp_path):
+    path = tmp_path / "cache" / "scoutos.db"
+    cache = SQLiteCache(path)
+    cache.set("key", {"foo": ["bar"]})
+    cache.close()
+
+    reopened = SQLiteCache(path)
+
+    assert reopened.path == path
+    assert reopened.get("key") == {"foo": ["bar"]}
+    assert reopened.get("missing") is None
+    reopened.close()
+
+
+def test_replaces_existing_values(tmp_path):
+    cache = SQLiteCache(tmp_path / "scoutos.db")
+    cache.set("key", 1)
+    cache.set("key", 2)
+
+    assert cache.get("key") == 2  # noqa: PLR2004
+    cache.close()
+
+
+def test_expires_entries_after_ttl(tmp_path):
+    with freeze_time("2024-01-01 00:00:00") as frozen:
+        cache = SQLiteCache(tmp_path / "scoutos.db", ttl=10)
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+
+        frozen.tick(11)
+
+        assert cache.get("key") is None
+        cache.close()
+
+
+def test_prunes_expired_entries_on_write(tmp_path):
+    with freeze_time("2024-01-01 00:00:00") as frozen:
+        cache = SQLiteCache(tmp_path / "scoutos.db", ttl=10)
+        cache.set("stale", "value")
+
+        frozen.tick(11)
+        cache.set("fresh", "value")
+
+        assert len(cache) == 1
+        assert cache.get("fresh") == "value"
+        cache.close()
+
+
+def test_evicts_the_oldest_writes_beyond_max_size(tmp_path):
+    cache = SQLiteCache(tmp_path / "scoutos.db", max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("a", 3)
+    cache.set("c", 4)
+
+    assert len(cache) == 2  # noqa: PLR2004
+    assert cache.get("b") is None
+    assert cache.get("a") == 3  # noqa: PLR2004
+    assert cache.get("c") == 4  # noqa: PLR2004
+    cache.close()
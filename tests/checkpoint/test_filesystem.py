@@ -0,0 +1,62 @@
+import pytest
+
+from scoutos.blocks.base import BlockOutput
+from scoutos.checkpoint import FileCheckpointStore
+
+
+def create_block_output(block_id: str, seq: int) -> BlockOutput:
+    return BlockOutput(
+        block_id=block_id,
+        block_run_id="BLOCK-RUN-ID-1234",
+        ok=True,
+        output={"seq": seq},
+        seq=seq,
+    )
+
+
+def test_persists_runs_across_instances(tmp_path):
+    store = FileCheckpointStore(tmp_path / "checkpoints")
+    store.begin("run-1", "session-1", {"name": "Chili"})
+    for seq, block_id in enumerate(["input", "loop", "loop"]):
+        store.append("run-1", create_block_output(block_id, seq))
+
+    checkpoint = FileCheckpointStore(tmp_path / "checkpoints").load("run-1")
+
+    assert store.path == tmp_path / "checkpoints"
+    assert checkpoint is not None
+    assert checkpoint.app_run_id == "run-1"
+    assert checkpoint.session_id == "session-1"
+    assert checkpoint.initial_input == {"name": "Chili"}
+    assert [output.block_id for output in checkpoint.outputs] == [
+        "input",
+        "loop",
+        "loop",
+    ]
+    assert checkpoint.outputs[2].output == {"seq": 2}
+
+
+def test_begin_replaces_previous_checkpoint_and_delete_removes_it(tmp_path):
+    store = FileCheckpointStore(tmp_path)
+    store.begin("run-1", "session-1", {})
+    store.append("run-1", create_block_output("input", 0))
+    store.begin("run-1", "session-2", {})
+
+    checkpoint = store.load("run-1")
+
+    assert checkpoint is not None
+    assert checkpoint.session_id == "session-2"
+    assert checkpoint.outputs == []
+
+    store.delete("run-1")
+    store.delete("run-1")
+
+    assert store.load("run-1") is None
+    assert store.load("missing") is None
+
+
+@pytest.mark.parametrize("app_run_id", ["", "..", "../run", "nested/run"])
+def test_rejects_run_ids_that_are_not_a_file_name(tmp_path, app_run_id):
+    store = FileCheckpointStore(tmp_path)
+
+    with pytest.raises(ValueError, match="Invalid app_run_id"):
+        store.load(app_run_id)
@@ -0,0 +1,54 @@
+from scoutos.blocks.base import BlockOutput
+from scoutos.checkpoint import SQLiteCheckpointStore
+
+
+def create_block_output(block_id: str, seq: int) -> BlockOutput:
+    return BlockOutput(
+        block_id=block_id,
+        block_run_id="BLOCK-RUN-ID-1234",
+        ok=True,
+        output={"seq": seq},
+        seq=seq,
+    )
+
+
+def test_persists_runs_across_connections(tmp_path):
+    path = tmp_path / "checkpoints" / "runs.db"
+    store = SQLiteCheckpointStore(path)
+    store.begin("run-1", "session-1", {"name": "Chili"})
+    for seq, block_id in enumerate(["input", "loop", "loop"]):
+        store.append("run-1", create_block_output(block_id, seq))
+    store.close()
+
+    reopened = SQLiteCheckpointStore(path)
+    checkpoint = reopened.load("run-1")
+
+    assert reopened.path == path
+    assert checkpoint is not None
+    assert checkpoint.session_id == "session-1"
+    assert checkpoint.initial_input == {"name": "Chili"}
+    assert [output.block_id for output in checkpoint.outputs] == [
+        "input",
+        "loop",
+        "loop",
+    ]
+    assert checkpoint.outputs[2].output == {"seq": 2}
+    reopened.close()
+
+
+def test_begin_replaces_previous_checkpoint_and_delete_removes_it(tmp_path):
+    store = SQLiteCheckpointStore(tmp_path / "runs.db")
+    store.begin("run-1", "session-1", {})
+    store.append("run-1", create_block_output("input", 0))
+    store.begin("run-1", "session-2", {})
+
+    checkpoint = store.load("run-1")
+
+    assert checkpoint is not None
+    assert checkpoint.session_id == "session-2"
+    assert checkpoint.outputs == []
+
+    store.delete("run-1")
+
+    assert store.load("run-1") is None
+    store.close()
@@ -2,21 +2,23 @@ from typing import Any
 
 import pytest
 
+from scoutos import QueryError
 from scoutos.blocks.base import BlockOutput
+from scoutos.dependencies import Depends
 from scoutos.dependencies.base import (
     Dependency,
     DependencyBaseConfig,
     DependencyPathError,
     UnsatisfiedDependencyError,
 )
+from scoutos.run_context import RunContext
+from scoutos.run_state import RunState
 
 
 def create_block_run_output(block_id: str, output: dict) -> BlockOutput:
     return BlockOutput(
         block_id=block_id,
         block_run_id="BLOCK-RUN-ID-1234",
-        block_run_start_ts="1970-01-01T00:00:000Z",
-        block_run_end_ts="1970-01-01T00:00:000Z",
         ok=True,
         output=output,
     )
@@ -137,6 +139,9 @@ def test_path_raises_if_not_multiple_segments():
     with pytest.raises(DependencyPathError):
         dep.path  # noqa: B018
 
+    with pytest.raises(DependencyPathError):
+        dep.segments  # noqa: B018
+
 
 @pytest.mark.parametrize(
     ("current_output", "path", "init_opts", "expected_result"),
@@ -159,7 +164,7 @@ def test_path_raises_if_not_multiple_segments():
 )
 def test_is_resolved(current_output, path, init_opts, expected_result):
     dep = create_dependency({"path": path, **init_opts})
-    result = dep.is_resolved(current_output)
+    result = dep.is_resolved(RunContext(state=RunState(current_output)))
     assert result == expected_result
 
 
@@ -179,11 +184,21 @@ def test_is_resolved(current_output, path, init_opts, expected_result):
             {"default_value": "buzz"},
             "buzz",
         ),
+        (
+            [
+                create_block_run_output(
+                    "llm", {"choices": [{"message": {"content": "hi"}}]}
+                )
+            ],
+            "llm.choices.0.message.content",
+            {},
+            "hi",
+        ),
     ],
 )
 def test_resolve(current_output, path, init_opts, expected_result):
     dep = create_dependency({"path": path, **init_opts})
-    result = dep.resolve(current_output)
+    result = dep.resolve(RunContext(state=RunState(current_output)))
     assert result == expected_result
 
 
@@ -191,7 +206,7 @@ def test_raises_on_resolve_with_no_corresponding_output():
     dep = create_dependency({"path": "non_existent_block_id.some.path"})
 
     with pytest.raises(UnsatisfiedDependencyError):
-        dep.resolve([])
+        dep.resolve(RunContext())
 
 
 def test_raises_on_resolve_with_missing_value():
@@ -199,4 +214,71 @@ def test_raises_on_resolve_with_missing_value():
     current_output = [create_block_run_output("input", {"foo": "baz"})]
 
     with pytest.raises(UnsatisfiedDependencyError):
-        dep.resolve(current_output)
+        dep.resolve(RunContext(state=RunState(current_output)))
+
+
+def test_raises_on_resolve_without_path_into_output():
+    dep = create_dependency({"path": "input"})
+    current_output = [create_block_run_output("input", {"foo": "baz"})]
+
+    with pytest.raises(DependencyPathError):
+        dep.resolve(RunContext(state=RunState(current_output)))
+
+
+def test_segments():
+    dep = create_dependency({"path": "llm.choices.0.text"})
+
+    assert dep.segments == ("choices", "0", "text")
+
+
+def test_dependencies_do_not_have_a_dict():
+    dep = Depends.StrType({"path": "input.foo"})
+
+    assert not hasattr(dep, "__dict__")
+
+
+def test_resolves_queries():
+    dep = create_dependency({"path": "slack.messages[?user == 'bot'].text"})
+    current_output = [
+        create_block_run_output(
+            "slack",
+            {"messages": [{"text": "hi", "user": "bot"}, {"text": "yo", "user": "me"}]},
+        )
+    ]
+
+    assert dep.block_id == "slack"
+    assert dep.path == "messages[?user == 'bot'].text"
+    assert dep.key == "text"
+    assert dep.segments == ()
+    assert dep.resolve(RunContext(state=RunState(current_output))) == "['hi']"
+
+
+def test_queries_can_start_with_a_selector():
+    dep = create_dependency({"path": "llm[0]"})
+
+    assert dep.block_id == "llm"
+    assert dep.path == "[0]"
+    assert dep.key == "llm"
+
+
+def test_raises_on_invalid_query():
+    with pytest.raises(QueryError):
+        create_dependency({"path": "slack.messages[*"})
+
+
+def test_dependencies_on_skipped_blocks_fall_back_to_their_default():
+    skipped = BlockOutput(
+        block_id="gated",
+        block_run_id="BLOCK-RUN-ID-1234",
+        ok=True,
+        output=None,
+        skipped=True,
+    )
+    context = RunContext(state=RunState([skipped]))
+    dep = create_dependency({"path": "gated.text"})
+    dep_with_default = create_dependency({"path": "gated.text", "default_value": "-"})
+
+    assert dep.is_skipped(context)
+    assert not dep.is_resolved(context)
+    assert not dep_with_default.is_skipped(context)
+    assert dep_with_default.resolve(context) == "-"
@@ -28,3 +28,10 @@ def test_parse_when_invalid():
 
     with pytest.raises(UnsatisfiedDependencyError):
         dep.parse(value)
+
+
+def test_parse_coerces_other_types():
+    dep = create_dependency()
+
+    assert dep.parse("42") == 42  # noqa: PLR2004
+    assert type(dep.parse(value=True)) is int
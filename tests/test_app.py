@@ -1,9 +1,38 @@
+import asyncio
+import json
 from pathlib import Path
+from typing import AsyncIterator, ClassVar
 
 import pytest
 
-from scoutos import App, AppExecutionError, Depends
-from scoutos.blocks import Block, Identity, Input, Output, Template
+import scoutos.app
+from scoutos import App, AppExecutionError, Condition, Depends
+from scoutos.app import Scheduler, Validation
+from scoutos.blocks import (
+    Block,
+    BlockBaseConfig,
+    BlockValidationError,
+    Function,
+    Identity,
+    Input,
+    Output,
+    Template,
+)
+from scoutos.cache import MemoryCache
+from scoutos.checkpoint import (
+    CheckpointStore,
+    FileCheckpointStore,
+    SQLiteCheckpointStore,
+)
+from scoutos.events import (
+    BlockFinished,
+    BlockSkipped,
+    BlockStarted,
+    LoopIteration,
+    RunFinished,
+)
+from scoutos.run_context import RunContext
+from scoutos.transport import Transport, get_default_transport
 
 
 def test_instanitation():
@@ -21,7 +50,7 @@ def test_get_output_raises_if_not_present():
 
     missing_block_id = "missing_block_id"
     with pytest.raises(AppExecutionError, match=missing_block_id):
-        app.get_output(missing_block_id)
+        app.get_output(RunContext(), missing_block_id)
 
 
 def test_it_loads_from_valid_data():
@@ -68,13 +97,75 @@ def test_it_loads_from_file(monkeypatch):
     assert isinstance(app, App)
 
 
+def test_loaders_pass_options_to_subclasses(tmp_path):
+    class TracedApp(App):
+        pass
+
+    path = tmp_path / "app.json"
+    path.write_text(
+        json.dumps(
+            {
+                "blocks": [
+                    {"type": "scoutos_input", "key": "input"},
+                    {"type": "scoutos_output", "key": "output"},
+                ]
+            }
+        )
+    )
+    cache = MemoryCache()
+
+    loaded = [
+        TracedApp.load_from_file(path, scheduler="concurrent", max_concurrency=2),
+        TracedApp.load_from_file(path, cache=cache, scheduler="concurrent"),
+        TracedApp.load_from_file(path, cache=cache, retention="none"),
+    ]
+
+    assert all(isinstance(app, TracedApp) for app in loaded)
+    assert [app.scheduler for app in loaded] == [
+        "concurrent",
+        "concurrent",
+        "sequential",
+    ]
+    assert loaded[0].max_concurrency == 2  # noqa: PLR2004
+    assert loaded[2].retention == "none"
+
+
+def test_load_from_file_reuses_cached_config(tmp_path, mocker):
+    path = tmp_path / "app.yaml"
+    path.write_text(
+        "blocks:\n"
+        "  - type: scoutos_input\n"
+        "    key: input\n"
+        "  - type: scoutos_output\n"
+        "    key: output\n"
+        "    depends:\n"
+        "      - path: input.value\n"
+        "        type: str\n"
+    )
+    cache = MemoryCache()
+    parse_data = mocker.spy(scoutos.app, "parse_data")
+
+    first = App.load_from_file(path, cache=cache)
+    second = App.load_from_file(path, cache=cache)
+
+    assert parse_data.call_count == 1
+    assert len(cache) == 1
+    assert list(first.blocks) == list(second.blocks) == ["input", "output"]
+    assert first.blocks["output"] is not second.blocks["output"]
+
+    path.write_text(path.read_text() + "  - type: scoutos_identity\n    key: extra\n")
+    third = App.load_from_file(path, cache=cache)
+
+    assert parse_data.call_count == 2  # noqa: PLR2004
+    assert list(third.blocks) == ["input", "output", "extra"]
+
+
 @pytest.mark.asyncio()
 async def test_raises_if_block_has_exceeded_run_count():
     class WillExceedRuncount(Block):
         TYPE = "test_will_exceed_runcount"
 
-        @property
-        def has_exceeded_run_count(self) -> bool:
+        def has_exceeded_run_count(self, _context: RunContext) -> bool:
             return True
 
         async def run(self, run_input: dict) -> dict:
@@ -133,6 +224,34 @@ async def test_simple_sequential_run():
     assert result.app_output == {"result": "Hello Chili Davis. Nice to meet you!"}
 
 
+@pytest.mark.asyncio()
+async def test_dependencies_query_upstream_outputs():
+    app = App(
+        blocks=[
+            Input({"key": "input"}),
+            Output(
+                {
+                    "key": "output",
+                    "depends": [
+                        Depends.AnyType(
+                            {"path": "input.messages[?score > 0.5].text", "key": "top"}
+                        ),
+                        Depends.StrType({"path": "input.messages[-1].text"}),
+                    ],
+                }
+            ),
+        ]
+    )
+    messages = [
+        {"text": "first", "score": 0.9},
+        {"text": "second", "score": 0.1},
+        {"text": "third", "score": 0.6},
+    ]
+    result = await app.run({"messages": messages})
+
+    assert result.app_output == {"top": ["first", "third"], "text": "third"}
+
+
 @pytest.mark.asyncio()
 async def test_looping_with_single_block():
     """In this test, we demonstrate how it is possible to loop. We provide a
@@ -247,3 +366,1064 @@ async def test_looping_with_multiple_blocks(n, expected_path):
     assert result.ok
     assert result.app_output == {"counter": n, "n": n}
     assert result.app_run_path == expected_path
+
+
+SLEEP_NS = 10_000_000
+
+
+class SleepyBlock(Block):
+    """Sleeps for a moment while keeping track of how many SleepyBlocks are
+    running at the same time."""
+
+    TYPE = "test_sleepy_block"
+
+    active = 0
+    completed = 0
+    max_active = 0
+
+    async def run(self, run_input: dict) -> dict:
+        SleepyBlock.active += 1
+        SleepyBlock.max_active = max(SleepyBlock.max_active, SleepyBlock.active)
+        await asyncio.sleep(SLEEP_NS / 1e9)
+        SleepyBlock.active -= 1
+        SleepyBlock.completed += 1
+        return {"result": self.key, **run_input}
+
+
+class FailingBlock(Block):
+    TYPE = "test_failing_block"
+
+    async def run(self, _run_input: dict) -> dict:
+        message = "boom"
+        raise RuntimeError(message)
+
+
+def create_branching_blocks(*branch_blocks: Block) -> list[Block]:
+    return [
+        Input({"key": "input"}),
+        *branch_blocks,
+        Output(
+            {
+                "key": "output",
+                "depends": [
+                    Depends.AnyType({"path": f"{block.key}.result", "key": block.key})
+                    for block in branch_blocks
+                ],
+            }
+        ),
+    ]
+
+
+@pytest.fixture()
+def sleepy_blocks():
+    SleepyBlock.active = 0
+    SleepyBlock.completed = 0
+    SleepyBlock.max_active = 0
+
+    return [
+        SleepyBlock({"key": key, "depends": [Depends.StrType({"path": "input.name"})]})
+        for key in ("first", "second", "third")
+    ]
+
+
+def test_raises_when_max_concurrency_is_invalid():
+    with pytest.raises(ValueError, match="max_concurrency"):
+        App(blocks=[], max_concurrency=0)
+
+
+@pytest.mark.asyncio()
+async def test_sequential_scheduler_runs_one_block_at_a_time(sleepy_blocks):
+    app = App(blocks=create_branching_blocks(*sleepy_blocks))
+    result = await app.run({"name": "Chili"})
+
+    assert app.scheduler == "sequential"
+    assert SleepyBlock.max_active == 1
+    assert result.app_run_path == ["input", "first", "second", "third", "output"]
+
+
+@pytest.mark.asyncio()
+async def test_concurrent_scheduler_runs_independent_blocks_together(sleepy_blocks):
+    app = App(blocks=create_branching_blocks(*sleepy_blocks), scheduler="concurrent")
+    result = await app.run({"name": "Chili"})
+
+    assert SleepyBlock.max_active == len(sleepy_blocks)
+    assert result.app_run_path[0] == "input"
+    assert sorted(result.app_run_path[1:4]) == ["first", "second", "third"]
+    assert result.app_run_path[-1] == "output"
+    assert result.app_output == {"first": "first", "second": "second", "third": "third"}
+
+
+@pytest.mark.asyncio()
+async def test_concurrent_scheduler_respects_max_concurrency(sleepy_blocks):
+    max_concurrency = 2
+    app = App(
+        blocks=create_branching_blocks(*sleepy_blocks),
+        max_concurrency=max_concurrency,
+        scheduler="concurrent",
+    )
+    await app.run({"name": "Chili"})
+
+    assert app.max_concurrency == max_concurrency
+    assert SleepyBlock.max_active == max_concurrency
+
+
+@pytest.mark.asyncio()
+async def test_max_concurrency_is_shared_by_concurrent_runs(sleepy_blocks):
+    app = App(
+        blocks=create_branching_blocks(*sleepy_blocks),
+        max_concurrency=1,
+        scheduler="concurrent",
+    )
+    await asyncio.gather(app.run({"name": "Chili"}), app.run({"name": "Bingo"}))
+
+    assert SleepyBlock.max_active == 1
+
+
+def test_max_concurrency_is_enforced_in_each_event_loop(sleepy_blocks):
+    app = App(blocks=create_branching_blocks(*sleepy_blocks), max_concurrency=1)
+
+    first = asyncio.run(app.run({"name": "Chili"}))
+    second = asyncio.run(app.run({"name": "Bingo"}))
+
+    assert first.app_output == second.app_output
+
+
+@pytest.mark.asyncio()
+async def test_result_separates_block_time_from_engine_time(sleepy_blocks):
+    app = App(blocks=create_branching_blocks(*sleepy_blocks), scheduler="concurrent")
+    result = await app.run({"name": "Chili"})
+
+    sleeps_ns = [
+        output.timings.run_ns
+        for output in result.block_output
+        if output.block_id in {"first", "second", "third"}
+    ]
+    assert min(sleeps_ns) >= SLEEP_NS
+    assert result.io_wait_ns >= sum(sleeps_ns)
+    assert max(sleeps_ns) <= result.critical_path_ns < sum(sleeps_ns)
+    assert (
+        result.critical_path_ns + result.engine_overhead_ns
+        == result.app_run_duration_ns
+    )
+
+
+@pytest.mark.asyncio()
+async def test_block_timings_record_time_waiting_for_a_run_slot(sleepy_blocks):
+    app = App(
+        blocks=create_branching_blocks(*sleepy_blocks),
+        max_concurrency=1,
+        scheduler="concurrent",
+    )
+    result = await app.run({"name": "Chili"})
+
+    queue_waits_ns = sorted(
+        output.timings.queue_wait_ns
+        for output in result.block_output
+        if output.block_id in {"first", "second", "third"}
+    )
+    assert queue_waits_ns[1] >= SLEEP_NS
+    assert queue_waits_ns[2] >= 2 * SLEEP_NS
+    assert result.engine_overhead_ns >= 2 * SLEEP_NS
+
+
+@pytest.mark.asyncio()
+async def test_concurrent_scheduler_runs_shared_dependencies_once():
+    app = App(
+        blocks=[
+            Input({"key": "input"}),
+            SleepyBlock(
+                {"key": "shared", "depends": [Depends.StrType({"path": "input.name"})]}
+            ),
+            *[
+                Identity(
+                    {"key": key, "depends": [Depends.StrType({"path": "shared.name"})]}
+                )
+                for key in ("left", "right")
+            ],
+            Output(
+                {
+                    "key": "output",
+                    "depends": [
+                        Depends.StrType({"path": "left.name", "key": "left"}),
+                        Depends.StrType({"path": "right.name", "key": "right"}),
+                    ],
+                }
+            ),
+        ],
+        scheduler="concurrent",
+    )
+    result = await app.run({"name": "Chili"})
+
+    assert result.app_run_path.count("shared") == 1
+    assert result.app_output == {"left": "Chili", "right": "Chili"}
+
+
+@pytest.mark.asyncio()
+async def test_concurrent_scheduler_cancels_siblings_on_failure(sleepy_blocks):
+    failing_block = FailingBlock(
+        {"key": "failing", "depends": [Depends.StrType({"path": "input.name"})]}
+    )
+    app = App(
+        blocks=create_branching_blocks(failing_block, *sleepy_blocks),
+        scheduler="concurrent",
+    )
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await app.run({"name": "Chili"})
+
+    await asyncio.sleep(0.02)
+    assert SleepyBlock.completed == 0
+
+
+@pytest.mark.parametrize("scheduler", ["sequential", "concurrent"])
+@pytest.mark.asyncio()
+async def test_looping_with_each_scheduler(scheduler):
+    blocks = [
+        Input({"key": "input"}),
+        Template(
+            {
+                "key": "increment",
+                "depends": [
+                    Depends.IntType({"path": "coerce.counter", "default_value": 0})
+                ],
+                "template": "{{counter + 1}}",
+            }
+        ),
+        Identity(
+            {
+                "key": "coerce",
+                "depends": [
+                    Depends.IntType({"path": "input.n"}),
+                    Depends.IntType(
+                        {
+                            "path": "increment.result",
+                            "key": "counter",
+                            "requires_rerun": True,
+                        }
+                    ),
+                ],
+                "run_until": lambda data: data["counter"] >= data["n"],
+            }
+        ),
+        Output(
+            {"key": "output", "depends": [Depends.IntType({"path": "coerce.counter"})]}
+        ),
+    ]
+
+    app = App(blocks=blocks, scheduler=scheduler)
+    result = await app.run({"n": 3})
+
+    assert result.app_output == {"counter": 3}
+    assert result.app_run_path == [
+        "input",
+        "increment",
+        "coerce",
+        "increment",
+        "coerce",
+        "increment",
+        "coerce",
+        "output",
+    ]
+
+
+@pytest.mark.asyncio()
+async def test_app_can_be_run_repeatedly_and_concurrently():
+    app = App(
+        blocks=[
+            Input({"key": "input"}),
+            SleepyBlock(
+                {"key": "sleepy", "depends": [Depends.StrType({"path": "input.name"})]}
+            ),
+            Output(
+                {"key": "output", "depends": [Depends.StrType({"path": "sleepy.name"})]}
+            ),
+        ]
+    )
+    names = [f"name-{index}" for index in range(20)]
+
+    results = await asyncio.gather(
+        *(app.run({"name": name}, session_id=name) for name in names)
+    )
+    rerun = await app.run({"name": "again"})
+
+    for name, result in zip(names, results, strict=True):
+        assert result.session_id == name
+        assert result.app_output == {"name": name}
+        assert result.app_run_path == ["input", "sleepy", "output"]
+    assert rerun.app_output == {"name": "again"}
+    assert rerun.app_run_path == ["input", "sleepy", "output"]
+
+
+class DelayedEchoBlock(Block):
+    TYPE = "test_delayed_echo_block"
+
+    async def run(self, run_input: dict) -> dict:
+        await asyncio.sleep(run_input["delay"])
+        if run_input["delay"] < 0:
+            message = "negative delay"
+            raise ValueError(message)
+        return {"result": run_input["delay"]}
+
+
+def create_delayed_echo_app() -> App:
+    return App(
+        blocks=[
+            Input({"key": "input"}),
+            DelayedEchoBlock(
+                {"key": "echo", "depends": [Depends.FloatType({"path": "input.delay"})]}
+            ),
+            Output(
+                {
+                    "key": "output",
+                    "depends": [Depends.FloatType({"path": "echo.result"})],
+                }
+            ),
+        ]
+    )
+
+
+@pytest.mark.asyncio()
+async def test_run_many_yields_results_in_completion_order():
+    app = create_delayed_echo_app()
+    inputs = [{"delay": 0.03}, {"delay": 0.01}, {"delay": 0.02}]
+
+    results = [result async for result in app.run_many(inputs, concurrency=3)]
+
+    assert [result.app_output["result"] for result in results] == [0.01, 0.02, 0.03]
+    assert [result.app_run_input for result in results] == [
+        {"delay": 0.01},
+        {"delay": 0.02},
+        {"delay": 0.03},
+    ]
+
+
+@pytest.mark.asyncio()
+async def test_run_many_can_preserve_order():
+    app = create_delayed_echo_app()
+    inputs = [{"delay": 0.03}, {"delay": 0.01}, {"delay": 0.02}]
+
+    results = [
+        result
+        async for result in app.run_many(inputs, concurrency=3, preserve_order=True)
+    ]
+
+    assert [result.app_output["result"] for result in results] == [0.03, 0.01, 0.02]
+
+
+@pytest.mark.asyncio()
+async def test_run_many_pulls_inputs_lazily_from_async_iterables():
+    app = create_delayed_echo_app()
+    pulled = []
+
+    async def generate_inputs() -> AsyncIterator[dict]:
+        for index in range(10):
+            pulled.append(index)
+            yield {"delay": 0}
+
+    results = app.run_many(generate_inputs(), concurrency=2)
+    first = await anext(results)
+    pulled_before_first_result = len(pulled)
+    remaining = [result async for result in results]
+
+    assert first.ok
+    assert pulled_before_first_result == 2  # noqa: PLR2004
+    assert len(remaining) == 9  # noqa: PLR2004
+
+
+@pytest.mark.asyncio()
+async def test_run_many_reports_failures_without_aborting():
+    app = create_delayed_echo_app()
+    inputs = [{"delay": 0}, {"delay": -1}, {"delay": 0}]
+
+    results = [result async for result in app.run_many(inputs, preserve_order=True)]
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, ValueError)
+    assert results[1].app_output == {}
+    assert results[1].app_run_path == ["input"]
+
+
+@pytest.mark.asyncio()
+async def test_run_many_cancels_pending_runs_when_closed():
+    app = create_delayed_echo_app()
+    inputs = [{"delay": 0}, {"delay": 10}]
+
+    results = app.run_many(inputs, concurrency=2)
+    first = await anext(results)
+    await results.aclose()
+
+    assert first.app_output == {"result": 0}
+
+
+@pytest.mark.asyncio()
+async def test_run_many_raises_when_concurrency_is_invalid():
+    app = create_delayed_echo_app()
+
+    with pytest.raises(ValueError, match="concurrency"):
+        await anext(app.run_many([{}], concurrency=0))
+
+
+@pytest.mark.asyncio()
+async def test_run_until_receives_the_iteration_count():
+    iterations = []
+
+    def stop_after_three_runs(_data: dict, iteration: int) -> bool:
+        iterations.append(iteration)
+        return iteration >= 3  # noqa: PLR2004
+
+    app = App(
+        blocks=[
+            Input({"key": "input"}),
+            Identity(
+                {
+                    "key": "looper",
+                    "depends": [Depends.StrType({"path": "input.name"})],
+                    "run_until": stop_after_three_runs,
+                }
+            ),
+            Output(
+                {"key": "output", "depends": [Depends.StrType({"path": "looper.name"})]}
+            ),
+        ]
+    )
+    result = await app.run({"name": "Chili"})
+
+    assert iterations == [1, 2, 3]
+    assert result.app_run_path == ["input", "looper", "looper", "looper", "output"]
+
+
+@pytest.mark.parametrize("scheduler", ["sequential", "concurrent"])
+@pytest.mark.asyncio()
+async def test_long_loops_do_not_recurse(scheduler):
+    n = 1500
+    blocks = [
+        Input({"key": "input"}),
+        Function(
+            {
+                "key": "increment",
+                "depends": [
+                    Depends.IntType({"path": "check.counter", "default_value": 0})
+                ],
+                "fn": lambda data: {"result": data["counter"] + 1},
+                "max_runs": n,
+            }
+        ),
+        Identity(
+            {
+                "key": "check",
+                "depends": [
+                    Depends.IntType({"path": "input.n"}),
+                    Depends.IntType(
+                        {
+                            "path": "increment.result",
+                            "key": "counter",
+                            "requires_rerun": True,
+                        }
+                    ),
+                ],
+                "max_runs": n,
+                "run_until": lambda data: data["counter"] >= data["n"],
+            }
+        ),
+        Output(
+            {"key": "output", "depends": [Depends.IntType({"path": "check.counter"})]}
+        ),
+    ]
+
+    app = App(blocks=blocks, scheduler=scheduler)
+    result = await app.run({"n": n})
+
+    assert app.plan.rerun_slots["check"][0].block_id == "increment"
+    assert result.app_output == {"counter": n}
+    assert result.app_run_path.count("check") == n
+
+
+@pytest.mark.asyncio()
+async def test_outputs_are_ordered_by_sequence_number():
+    app = App(
+        blocks=create_branching_blocks(
+            *[
+                Identity(
+                    {"key": key, "depends": [Depends.StrType({"path": "input.result"})]}
+                )
+                for key in ("first", "second")
+            ]
+        ),
+        scheduler="concurrent",
+    )
+    result = await app.run({"result": "same"})
+
+    assert [output.seq for output in result.block_output] == [0, 1, 2, 3]
+    assert result.app_run_path == ["input", "first", "second", "output"]
+    assert result.app_run_start_ts <= result.app_run_end_ts
+    assert result.app_run_duration_ns > 0
+
+
+def create_sleepy_app(*, timeout: float | None = None) -> App:
+    config: BlockBaseConfig = {
+        "key": "sleepy",
+        "depends": [Depends.StrType({"path": "input.name"})],
+    }
+    if timeout is not None:
+        config["timeout"] = timeout
+
+    return App(
+        blocks=[
+            Input({"key": "input"}),
+            SleepyBlock(config),
+            Output(
+                {"key": "output", "depends": [Depends.StrType({"path": "sleepy.name"})]}
+            ),
+        ]
+    )
+
+
+@pytest.mark.asyncio()
+async def test_run_reports_block_exceeding_its_timeout():
+    app = create_sleepy_app(timeout=0.001)
+    result = await app.run({"name": "Chili"})
+
+    assert result.ok is False
+    assert result.timed_out_block == "sleepy"
+    assert result.app_run_path == ["input"]
+
+
+@pytest.mark.asyncio()
+async def test_run_reports_block_exceeding_the_deadline():
+    app = create_sleepy_app()
+    result = await app.run({"name": "Chili"}, deadline=0.001)
+
+    assert result.ok is False
+    assert result.timed_out_block == "sleepy"
+
+
+@pytest.mark.asyncio()
+async def test_run_completes_within_the_deadline():
+    app = create_sleepy_app()
+    result = await app.run({"name": "Chili"}, deadline=1)
+
+    assert result.ok is True
+    assert result.timed_out_block is None
+
+
+@pytest.mark.asyncio()
+async def test_run_many_applies_the_deadline_to_each_run():
+    app = create_sleepy_app()
+
+    results = [
+        result async for result in app.run_many([{"name": "Chili"}], deadline=0.001)
+    ]
+
+    assert results[0].timed_out_block == "sleepy"
+
+
+@pytest.mark.asyncio()
+async def test_run_stream_yields_events_as_the_run_progresses():
+    app = App(
+        blocks=[
+            Input({"key": "input"}),
+            Identity(
+                {
+                    "key": "looper",
+                    "depends": [Depends.StrType({"path": "input.name"})],
+                    "run_until": lambda _data, iteration: iteration >= 2,  # noqa: PLR2004
+                }
+            ),
+            Output(
+                {"key": "output", "depends": [Depends.StrType({"path": "looper.name"})]}
+            ),
+        ]
+    )
+
+    events = [event async for event in app.run_stream({"name": "Chili"})]
+
+    assert [type(event).__name__ for event in events] == [
+        "BlockStarted",
+        "BlockFinished",
+        "BlockStarted",
+        "BlockFinished",
+        "LoopIteration",
+        "BlockStarted",
+        "BlockFinished",
+        "BlockStarted",
+        "BlockFinished",
+        "RunFinished",
+    ]
+    assert events[0] == BlockStarted("input", iteration=0)
+    assert events[4] == LoopIteration("looper", iteration=1)
+    assert isinstance(events[-2], BlockFinished)
+    assert events[-2].block_output.output == {"name": "Chili"}
+    assert isinstance(events[-1], RunFinished)
+    assert events[-1].result.app_output == {"name": "Chili"}
+
+
+@pytest.mark.asyncio()
+async def test_run_stream_raises_after_yielding_preceding_events():
+    app = App(blocks=create_branching_blocks(FailingBlock({"key": "failing"})))
+    events = []
+
+    async def consume() -> None:
+        async for event in app.run_stream():
+            events.append(event)  # noqa: PERF401
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await consume()
+
+    assert events == [BlockStarted("failing", iteration=0)]
+
+
+@pytest.mark.asyncio()
+async def test_run_stream_cancels_the_run_when_closed():
+    SleepyBlock.completed = 0
+    app = create_sleepy_app()
+
+    events = app.run_stream({"name": "Chili"})
+    first = await anext(events)
+    await events.aclose()
+    await asyncio.sleep(0.02)
+
+    assert first == BlockStarted("input", iteration=0)
+    assert SleepyBlock.completed == 0
+
+
+def create_validated_app(validation: Validation, validation_sample_rate: float) -> App:
+    return App(
+        blocks=[
+            Input({"key": "input", "input_schema": {"required": ["name"]}}),
+            Output(
+                {"key": "output", "depends": [Depends.AnyType({"path": "input.age"})]}
+            ),
+        ],
+        validation=validation,
+        validation_sample_rate=validation_sample_rate,
+    )
+
+
+def test_raises_when_validation_sample_rate_is_invalid():
+    with pytest.raises(ValueError, match="validation_sample_rate"):
+        App(blocks=[], validation_sample_rate=1.5)
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    ("validation", "validation_sample_rate"),
+    [("always", 0), ("sampled", 1)],
+)
+async def test_validates_block_schemas(validation, validation_sample_rate):
+    app = create_validated_app(
+        validation=validation, validation_sample_rate=validation_sample_rate
+    )
+
+    with pytest.raises(BlockValidationError, match="missing required property"):
+        await app.run({"age": 42})
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    ("validation", "validation_sample_rate"),
+    [("off", 1), ("sampled", 0)],
+)
+async def test_skips_validating_block_schemas(validation, validation_sample_rate):
+    app = create_validated_app(
+        validation=validation, validation_sample_rate=validation_sample_rate
+    )
+
+    result = await app.run({"age": 42})
+
+    assert app.validation == validation
+    assert app.validation_sample_rate == validation_sample_rate
+    assert result.app_output == {"age": 42}
+
+
+def create_routed_blocks() -> list[Block]:
+    """Two branches, each taken for one `route`, and each requiring an
+    upstream block of its own."""
+
+    def is_route(name: str) -> Condition:
+        return Condition(
+            lambda route: route == name,
+            depends=[Depends.StrType({"path": "input.route"})],
+        )
+
+    return [
+        Input({"key": "input"}),
+        Identity(
+            {"key": "fetch_a", "depends": [Depends.StrType({"path": "input.text"})]}
+        ),
+        Identity(
+            {"key": "fetch_b", "depends": [Depends.StrType({"path": "input.text"})]}
+        ),
+        Identity(
+            {
+                "key": "branch_a",
+                "depends": [Depends.StrType({"path": "fetch_a.text"})],
+                "when": is_route("a"),
+            }
+        ),
+        Identity(
+            {
+                "key": "branch_b",
+                "depends": [Depends.StrType({"path": "fetch_b.text"})],
+                "when": is_route("b"),
+            }
+        ),
+        Output(
+            {
+                "key": "output",
+                "depends": [
+                    Depends.StrType({"path": "branch_a.text", "key": "a"}),
+                    Depends.StrType({"path": "branch_b.text", "key": "b"}),
+                ],
+            }
+        ),
+    ]
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("scheduler", ["sequential", "concurrent"])
+async def test_untaken_branches_are_skipped_with_their_upstream(scheduler: Scheduler):
+    app = App(blocks=create_routed_blocks(), scheduler=scheduler)
+    result = await app.run({"route": "b", "text": "hello"})
+
+    assert result.ok
+    assert result.app_output == {"b": "hello"}
+    assert result.skipped_blocks == ["branch_a", "fetch_a"]
+    assert result.app_run_path == [
+        "input",
+        "branch_a",
+        "fetch_a",
+        "fetch_b",
+        "branch_b",
+        "output",
+    ]
+    assert all(
+        output.output is None for output in result.block_output if output.skipped
+    )
+
+
+@pytest.mark.asyncio()
+async def test_upstream_blocks_read_by_a_taken_block_are_not_skipped():
+    app = App(
+        blocks=[
+            Input({"key": "input"}),
+            Identity(
+                {"key": "shared", "depends": [Depends.StrType({"path": "input.text"})]}
+            ),
+            Identity(
+                {
+                    "key": "gated",
+                    "depends": [Depends.StrType({"path": "shared.text"})],
+                    "when": Condition(lambda: False, depends=[]),
+                }
+            ),
+            Output(
+                {
+                    "key": "output",
+                    "depends": [
+                        Depends.AnyType({"path": "gated", "key": "gated"}),
+                        Depends.StrType({"path": "shared.text", "key": "shared"}),
+                    ],
+                }
+            ),
+        ]
+    )
+    result = await app.run({"text": "hello"})
+
+    assert result.app_output == {"shared": "hello"}
+    assert result.skipped_blocks == ["gated"]
+    assert result.app_run_path == ["gated", "input", "shared", "output"]
+
+
+@pytest.mark.asyncio()
+async def test_blocks_only_requiring_skipped_blocks_are_skipped():
+    app = App(
+        blocks=[
+            Input({"key": "input"}),
+            Identity(
+                {
+                    "key": "gated",
+                    "depends": [Depends.StrType({"path": "input.text"})],
+                    "when": Condition(lambda: False, depends=[]),
+                }
+            ),
+            Identity(
+                {"key": "after", "depends": [Depends.StrType({"path": "gated.text"})]}
+            ),
+            Identity(
+                {
+                    "key": "guarded",
+                    "when": Condition(
+                        bool, depends=[Depends.StrType({"path": "after.text"})]
+                    ),
+                }
+            ),
+            Output(
+                {
+                    "key": "output",
+                    "depends": [
+                        Depends.AnyType({"path": "guarded", "key": "guarded"}),
+                        Depends.AnyType({"path": "gated", "key": "gated"}),
+                    ],
+                }
+            ),
+        ]
+    )
+    result = await app.run({"text": "hello"})
+
+    assert result.ok
+    assert result.app_output == {}
+    assert result.skipped_blocks == ["gated", "after", "guarded", "output"]
+    assert result.app_run_path == ["gated", "after", "guarded", "output"]
+
+
+@pytest.mark.asyncio()
+async def test_run_stream_yields_skipped_blocks():
+    app = App(blocks=create_routed_blocks())
+
+    events = [event async for event in app.run_stream({"route": "a", "text": "hello"})]
+
+    skips = [event for event in events if isinstance(event, BlockSkipped)]
+    assert [skip.block_output.block_id for skip in skips] == ["branch_b", "fetch_b"]
+
+
+def create_counting_loop_blocks() -> list[Block]:
+    return [
+        Input({"key": "input"}),
+        Function(
+            {
+                "key": "increment",
+                "depends": [
+                    Depends.IntType({"path": "check.counter", "default_value": 0})
+                ],
+                "fn": lambda data: {"result": data["counter"] + 1},
+            }
+        ),
+        Identity(
+            {
+                "key": "check",
+                "depends": [
+                    Depends.IntType({"path": "input.n"}),
+                    Depends.IntType(
+                        {
+                            "path": "increment.result",
+                            "key": "counter",
+                            "requires_rerun": True,
+                        }
+                    ),
+                ],
+                "run_until": lambda data: data["counter"] >= data["n"],
+            }
+        ),
+        Output(
+            {"key": "output", "depends": [Depends.IntType({"path": "check.counter"})]}
+        ),
+    ]
+
+
+def test_raises_when_retained_iterations_is_invalid():
+    with pytest.raises(ValueError, match="retained_iterations"):
+        App(blocks=[], retained_iterations=0)
+
+
+@pytest.mark.asyncio()
+async def test_full_retention_keeps_every_payload():
+    app = App(blocks=create_counting_loop_blocks())
+    result = await app.run({"n": 3})
+
+    assert app.retention == "full"
+    assert not any(output.trimmed for output in result.block_output)
+
+
+@pytest.mark.asyncio()
+async def test_trimmed_retention_keeps_the_latest_iterations_of_loops():
+    app = App(
+        blocks=create_counting_loop_blocks(),
+        retention="trimmed",
+        retained_iterations=2,
+    )
+    result = await app.run({"n": 4})
+
+    checks = [output for output in result.block_output if output.block_id == "check"]
+    assert app.retained_iterations == 2  # noqa: PLR2004
+    assert result.app_output == {"counter": 4}
+    assert [output.trimmed for output in checks] == [True, True, False, False]
+    assert [output.output for output in checks[2:]] == [
+        {"n": 4, "counter": 3},
+        {"n": 4, "counter": 4},
+    ]
+    assert checks[0].output is None
+    assert checks[0].seq < checks[1].seq
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("scheduler", ["sequential", "concurrent"])
+async def test_no_retention_only_returns_the_app_output(scheduler: Scheduler):
+    app = App(
+        blocks=create_counting_loop_blocks(), retention="none", scheduler=scheduler
+    )
+    result = await app.run({"n": 3})
+
+    assert result.ok
+    assert result.app_output == {"counter": 3}
+    assert result.app_run_path.count("check") == 3  # noqa: PLR2004
+    assert [
+        output.block_id for output in result.block_output if not output.trimmed
+    ] == ["output"]
+
+
+@pytest.mark.asyncio()
+async def test_no_retention_drops_payloads_once_nothing_can_read_them():
+    app = App(blocks=create_counting_loop_blocks(), retention="none")
+    context = app._create_context({"n": 3})  # noqa: SLF001
+
+    await app._run_until(context, "check")  # noqa: SLF001
+
+    assert context.state.latest("input").trimmed
+    assert context.state.latest("increment").trimmed
+    assert context.state.latest("check").output == {"n": 3, "counter": 3}
+    assert [
+        output.trimmed for output in context.state.log if output.block_id == "check"
+    ] == [True, True, False]
+    assert context.finished == {"input", "increment", "check"}
+
+
+class FlakyBlock(Block):
+    """Fails while `failing` is set, counting the runs of every instance."""
+
+    TYPE = "test_flaky_block"
+
+    failing = True
+    runs: ClassVar[dict[str, int]] = {}
+
+    async def run(self, run_input: dict) -> dict:
+        FlakyBlock.runs[self.key] = FlakyBlock.runs.get(self.key, 0) + 1
+        if FlakyBlock.failing and self.key == "flaky":
+            message = "boom"
+            raise RuntimeError(message)
+
+        return run_input
+
+
+@pytest.fixture(params=["filesystem", "sqlite"])
+def checkpoints(request, tmp_path) -> CheckpointStore:
+    FlakyBlock.failing = True
+    FlakyBlock.runs = {}
+    if request.param == "filesystem":
+        return FileCheckpointStore(tmp_path)
+
+    return SQLiteCheckpointStore(tmp_path / "checkpoints.db")
+
+
+@pytest.mark.asyncio()
+async def test_resume_continues_from_the_first_incomplete_block(checkpoints):
+    app = App(
+        blocks=[
+            Input({"key": "input"}),
+            FlakyBlock(
+                {"key": "fetch", "depends": [Depends.StrType({"path": "input.name"})]}
+            ),
+            FlakyBlock(
+                {"key": "flaky", "depends": [Depends.StrType({"path": "fetch.name"})]}
+            ),
+            Output(
+                {"key": "output", "depends": [Depends.StrType({"path": "flaky.name"})]}
+            ),
+        ],
+        checkpoints=checkpoints,
+    )
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await app.run({"name": "Chili"}, app_run_id="run-1", session_id="session-1")
+
+    FlakyBlock.failing = False
+    result = await app.resume("run-1")
+
+    assert app.checkpoints is checkpoints
+    assert result.ok
+    assert result.app_output == {"name": "Chili"}
+    assert result.app_run_id == "run-1"
+    assert result.session_id == "session-1"
+    assert result.app_run_path == ["input", "fetch", "flaky", "output"]
+    assert FlakyBlock.runs == {"fetch": 1, "flaky": 2}
+    assert checkpoints.load("run-1") is None
+
+
+@pytest.mark.asyncio()
+async def test_resume_carries_on_with_interrupted_loops(checkpoints):
+    interrupted = False
+
+    def increment(data: dict) -> dict:
+        nonlocal interrupted
+        if data["counter"] == 2 and not interrupted:  # noqa: PLR2004
+            interrupted = True
+            message = "boom"
+            raise RuntimeError(message)
+
+        return {"result": data["counter"] + 1}
+
+    blocks = create_counting_loop_blocks()
+    blocks[1] = Function(
+        {
+            "key": "increment",
+            "depends": [Depends.IntType({"path": "check.counter", "default_value": 0})],
+            "fn": increment,
+        }
+    )
+    app = App(blocks=blocks, checkpoints=checkpoints)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await app.run({"n": 4}, app_run_id="run-1")
+
+    result = await app.resume("run-1")
+
+    assert result.app_output == {"counter": 4}
+    assert result.app_run_path.count("check") == 4  # noqa: PLR2004
+    assert result.app_run_path.count("increment") == 4  # noqa: PLR2004
+
+
+@pytest.mark.asyncio()
+async def test_resume_does_not_rerun_a_completed_run(checkpoints, mocker):
+    app = App(blocks=create_counting_loop_blocks(), checkpoints=checkpoints)
+    mocker.patch.object(checkpoints, "delete")
+    first = await app.run({"n": 2}, app_run_id="run-1")
+
+    result = await app.resume("run-1")
+
+    assert result.app_output == first.app_output == {"counter": 2}
+    assert result.app_run_path == first.app_run_path
+
+
+@pytest.mark.asyncio()
+async def test_resume_raises_without_a_checkpoint(tmp_path):
+    with pytest.raises(AppExecutionError, match="checkpoint store"):
+        await App(blocks=[]).resume("run-1")
+
+    app = App(blocks=[], checkpoints=FileCheckpointStore(tmp_path))
+    with pytest.raises(AppExecutionError, match="No checkpoint found for run run-1"):
+        await app.resume("run-1")
+
+
+@pytest.mark.asyncio()
+async def test_blocks_share_the_transport_of_their_app():
+    blocks = [Input({"key": "input"}), Output({"key": "output"})]
+
+    async with App(blocks=blocks) as app:
+        client = app.transport.client("https://example.com")
+
+        assert all(block.transport is app.transport for block in blocks)
+        assert app.transport is not get_default_transport()
+
+    assert client.is_closed
+
+
+@pytest.mark.asyncio()
+async def test_close_leaves_a_shared_transport_open():
+    transport = Transport()
+    app = App(blocks=[Input({"key": "input"})], transport=transport)
+    client = transport.client("https://example.com")
+
+    await app.close()
+
+    assert app.transport is transport
+    assert not client.is_closed
+    await transport.aclose()
@@ -2,14 +2,14 @@ import pytest
 
 from scoutos import Condition, Depends
 from scoutos.blocks.base import BlockOutput
+from scoutos.run_context import RunContext
+from scoutos.run_state import RunState
 
 
 def create_block_output(block_id: str, output: dict) -> BlockOutput:
     return BlockOutput(
         block_id=block_id,
         block_run_id="BLOCK-RUN-ID-1234",
-        block_run_end_ts="1970-01-01T00:00:000Z",
-        block_run_start_ts="1970-01-01T00:00:000Z",
         ok=True,
         output=output,
     )
@@ -71,4 +71,7 @@ def test_instantiation():
 )
 def test_is_satisfied(fn, deps, current_output, expected_result):
     condition = Condition(fn, depends=deps)
-    assert condition.is_satisfied(current_output) == expected_result
+    assert (
+        condition.is_satisfied(RunContext(state=RunState(current_output)))
+        == expected_result
+    )
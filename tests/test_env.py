@@ -1,6 +1,8 @@
+from pathlib import Path
+
 import pytest
 
-from scoutos.env import get_env
+from scoutos.env import get_cache_dir, get_env
 
 
 def test_get_env(monkeypatch):
@@ -23,3 +25,20 @@ def test_get_env_uses_default():
         get_env("NON_EXISTENT_ENV_VAR", default_value=supplied_default_value)
         == supplied_default_value
     )
+
+
+def test_get_cache_dir_uses_configured_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("SCOUTOS_CACHE_DIR", str(tmp_path))
+
+    assert get_cache_dir() == tmp_path
+
+
+def test_get_cache_dir_defaults_to_user_cache_dir(monkeypatch, tmp_path):
+    monkeypatch.delenv("SCOUTOS_CACHE_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    assert get_cache_dir() == tmp_path / "scoutos"
+
+    monkeypatch.delenv("XDG_CACHE_HOME")
+
+    assert get_cache_dir() == Path.home() / ".cache" / "scoutos"
@@ -0,0 +1,274 @@
+import re
+
+import pytest
+
+from scoutos import App, Condition, Depends, ExecutionPlan, ExecutionPlanError
+from scoutos.blocks import Identity, Input, Output, Template
+from scoutos.dependencies import Dependency
+
+
+def test_compiles_topological_order_and_adjacency():
+    blocks = [
+        Output(
+            {
+                "key": "output",
+                "depends": [
+                    Depends.StrType({"path": "left.name", "key": "left"}),
+                    Depends.StrType({"path": "right.name", "key": "right"}),
+                ],
+            }
+        ),
+        Identity(
+            {"key": "right", "depends": [Depends.StrType({"path": "input.name"})]}
+        ),
+        Identity({"key": "left", "depends": [Depends.StrType({"path": "input.name"})]}),
+        Input({"key": "input"}),
+    ]
+
+    plan = ExecutionPlan.compile(blocks)
+
+    assert plan.order == ("input", "right", "left", "output")
+    assert plan.upstream["output"] == ("left", "right")
+    assert plan.downstream["input"] == ("right", "left")
+    assert [slot.block_id for slot in plan.slots["output"]] == ["left", "right"]
+    assert all(slot.is_required for slot in plan.slots["output"])
+
+
+def test_dependencies_with_defaults_do_not_order_blocks():
+    blocks = [
+        Input({"key": "input"}),
+        Identity(
+            {
+                "key": "looper",
+                "depends": [
+                    Depends.IntType({"path": "looper.count", "default_value": 0})
+                ],
+            }
+        ),
+    ]
+
+    plan = ExecutionPlan.compile(blocks)
+
+    assert plan.order == ("input", "looper")
+    assert plan.upstream["looper"] == ()
+    assert plan.slots["looper"][0].is_required is False
+
+
+def test_input_dependencies_are_not_scheduled():
+    blocks = [
+        Input(
+            {
+                "key": "input",
+                "depends": [Depends.StrType({"path": "name", "default_value": "You"})],
+            }
+        ),
+    ]
+
+    plan = ExecutionPlan.compile(blocks)
+
+    assert plan.slots["input"] == ()
+
+
+def test_raises_on_duplicate_keys():
+    blocks = [Identity({"key": "same"}), Identity({"key": "same"})]
+
+    with pytest.raises(ExecutionPlanError, match="Duplicate block keys: same"):
+        ExecutionPlan.compile(blocks)
+
+
+def test_raises_on_unknown_block():
+    blocks = [
+        Output({"key": "output", "depends": [Depends.StrType({"path": "nope.foo"})]})
+    ]
+
+    with pytest.raises(ExecutionPlanError, match="unknown block `nope`"):
+        ExecutionPlan.compile(blocks)
+
+
+def test_raises_on_cycle():
+    blocks = [
+        Input({"key": "input"}),
+        Identity({"key": "first", "depends": [Depends.StrType({"path": "second.x"})]}),
+        Identity({"key": "second", "depends": [Depends.StrType({"path": "first.x"})]}),
+    ]
+
+    with pytest.raises(ExecutionPlanError, match="cycle between: first, second"):
+        ExecutionPlan.compile(blocks)
+
+
+def test_app_compiles_plan_on_load():
+    data = {
+        "blocks": [
+            {"type": "scoutos_input", "key": "input"},
+            {
+                "type": "scoutos_output",
+                "key": "output",
+                "depends": [{"type": "str", "path": "missing.foo"}],
+            },
+        ]
+    }
+
+    with pytest.raises(ExecutionPlanError, match="unknown block `missing`"):
+        App.load(data)
+
+
+def test_app_exposes_plan():
+    app = App(blocks=[Input({"key": "input"}), Output({"key": "output"})])
+
+    assert app.plan.order == ("input", "output")
+
+
+def test_infers_source_types_from_output_schemas():
+    def compile_reading(*depends: Dependency) -> ExecutionPlan:
+        return ExecutionPlan.compile(
+            [
+                Input(
+                    {
+                        "key": "input",
+                        "input_schema": {
+                            "properties": {
+                                "ids": {"type": "array", "items": {"type": "integer"}}
+                            }
+                        },
+                    }
+                ),
+                Template(
+                    {"key": "template", "template": "Hello {{ name }}"},
+                ),
+                Output({"key": "output", "depends": list(depends)}),
+            ]
+        )
+
+    plan = compile_reading(
+        Depends.StrType({"path": "template.result"}),
+        Depends.StrType({"path": "input.ids[0]", "key": "first"}),
+        Depends.StrType({"path": "input.missing"}),
+    )
+
+    assert [slot.block_id for slot in plan.slots["output"]] == [
+        "template",
+        "input",
+        "input",
+    ]
+    with pytest.raises(ExecutionPlanError, match="outputs integer there"):
+        compile_reading(Depends.StrType({"path": "input.ids.0"}))
+
+
+def test_raises_on_incompatible_types():
+    blocks = [
+        Input(
+            {
+                "key": "input",
+                "input_schema": {"properties": {"age": {"type": "integer"}}},
+            }
+        ),
+        Output({"key": "output", "depends": [Depends.StrType({"path": "input.age"})]}),
+    ]
+
+    with pytest.raises(
+        ExecutionPlanError,
+        match=re.escape(
+            "`output` reads `input.age` as str, but `input` outputs integer there"
+        ),
+    ):
+        ExecutionPlan.compile(blocks)
+
+
+def test_accepts_types_that_can_be_coerced():
+    blocks = [
+        Input(
+            {
+                "key": "input",
+                "input_schema": {"properties": {"age": {"type": ["string", "null"]}}},
+            }
+        ),
+        Output({"key": "output", "depends": [Depends.IntType({"path": "input.age"})]}),
+    ]
+
+    plan = ExecutionPlan.compile(blocks)
+
+    assert plan.slots["output"][0].block_id == "input"
+
+
+def test_dependencies_without_a_path_are_not_typed():
+    blocks = [
+        Input({"key": "input"}),
+        Identity({"key": "identity"}),
+        Output({"key": "output", "depends": [Depends.AnyType({"path": "identity"})]}),
+    ]
+
+    plan = ExecutionPlan.compile(blocks)
+
+    assert plan.slots["output"][0].block_id == "identity"
+
+
+def test_condition_dependencies_order_blocks():
+    blocks = [
+        Input({"key": "input"}),
+        Identity({"key": "router", "depends": [Depends.StrType({"path": "input.x"})]}),
+        Identity(
+            {
+                "key": "gated",
+                "when": Condition(
+                    lambda route: route == "gated",
+                    depends=[Depends.StrType({"path": "router.x"})],
+                ),
+            }
+        ),
+        Output({"key": "output", "depends": [Depends.AnyType({"path": "gated"})]}),
+    ]
+
+    plan = ExecutionPlan.compile(blocks)
+
+    assert plan.upstream["gated"] == ("router",)
+    assert plan.slots["gated"] == ()
+    assert [slot.block_id for slot in plan.condition_slots["gated"]] == ["router"]
+    assert plan.condition_slots["router"] == ()
+
+
+def test_raises_on_condition_depending_on_unknown_block():
+    blocks = [
+        Input({"key": "input"}),
+        Output(
+            {
+                "key": "output",
+                "when": Condition(bool, depends=[Depends.StrType({"path": "nope.x"})]),
+            }
+        ),
+    ]
+
+    with pytest.raises(ExecutionPlanError, match="unknown block `nope`"):
+        ExecutionPlan.compile(blocks)
+
+
+def test_records_readers_and_looping_blocks():
+    blocks = [
+        Input({"key": "input"}),
+        Identity(
+            {
+                "key": "step",
+                "depends": [Depends.StrType({"path": "loop.x", "default_value": ""})],
+            }
+        ),
+        Identity(
+            {
+                "key": "loop",
+                "depends": [
+                    Depends.StrType({"path": "input.x"}),
+                    Depends.StrType({"path": "step.x", "requires_rerun": True}),
+                ],
+                "when": Condition(bool, depends=[Depends.StrType({"path": "input.y"})]),
+            }
+        ),
+        Output({"key": "output", "depends": [Depends.StrType({"path": "loop.x"})]}),
+    ]
+
+    plan = ExecutionPlan.compile(blocks)
+
+    assert plan.readers == {
+        "input": ("loop",),
+        "step": ("loop",),
+        "loop": ("step", "output"),
+        "output": (),
+    }
+    assert plan.rerun_by == {"input": (), "step": ("loop",), "loop": (), "output": ()}
@@ -0,0 +1,109 @@
+import pytest
+from pydantic import BaseModel
+
+from scoutos import QueryError, compile_query
+
+MESSAGES = {
+    "messages": [
+        {"text": "hello", "user": "bot", "score": 0.9, "tags": ["greeting"]},
+        {"text": "how are you?", "user": "me", "score": 0.4, "tags": []},
+        {"text": "fine", "user": "bot", "score": 0.7},
+    ],
+    "channels": {"general": {"id": "C1"}, "random": {"id": "C2"}},
+}
+
+
+class Message(BaseModel):
+    text: str
+
+
+class History(BaseModel):
+    messages: list[Message]
+
+
+@pytest.mark.parametrize(
+    ("expression", "expected_value"),
+    [
+        ("messages[0].text", "hello"),
+        ("messages[-1].text", "fine"),
+        ("messages[3].text", None),
+        ("messages.1.user", "me"),
+        ("messages[*].text", ["hello", "how are you?", "fine"]),
+        ("messages[1:].text", ["how are you?", "fine"]),
+        ("messages[:1].text", ["hello"]),
+        ("messages[::-2].text", ["fine", "hello"]),
+        ("messages[*].tags[0]", ["greeting"]),
+        ("messages[?user == 'bot'].text", ["hello", "fine"]),
+        ('messages[?user != "bot"].text', ["how are you?"]),
+        ("messages[?score >= 0.7].text", ["hello", "fine"]),
+        ("messages[?score < 0.5].text", ["how are you?"]),
+        ("messages[?score > 0.8].text", ["hello"]),
+        ("messages[?score <= 0.4].text", ["how are you?"]),
+        ("messages[?user > 1].text", []),
+        ("messages[?tags].text", ["hello"]),
+        ("messages[*].tags[?@ == 'greeting']", [["greeting"], []]),
+        ("channels[*].id", ["C1", "C2"]),
+        ("channels.general{id}", {"id": "C1"}),
+        (
+            "messages[0].{text, author: user, first_tag: tags[0]}",
+            {"text": "hello", "author": "bot", "first_tag": "greeting"},
+        ),
+        (
+            "messages[*].{text}",
+            [{"text": "hello"}, {"text": "how are you?"}, {"text": "fine"}],
+        ),
+        (
+            "{bots: messages[?user == 'bot,me'].text, general: channels.general.id}",
+            {"bots": [], "general": "C1"},
+        ),
+        ("messages.text", None),
+        ("messages[0].text[0]", None),
+        ("messages[0].text[1:]", None),
+        ("messages[0].text[*]", None),
+        ("messages[0].text[?@]", None),
+        ("missing[*].text", None),
+    ],
+)
+def test_it_evaluates_queries(expression, expected_value):
+    assert compile_query(expression)(MESSAGES) == expected_value
+
+
+def test_it_reads_fields_of_models():
+    history = History(messages=[Message(text="hello"), Message(text="bye")])
+
+    assert compile_query("messages[*].text")(history) == ["hello", "bye"]
+    assert compile_query("messages[0].missing")(history) is None
+
+
+def test_it_exposes_the_last_field_read():
+    assert compile_query("choices[0].message.content").name == "content"
+    assert compile_query("[0]").name is None
+
+
+def test_it_reuses_compiled_queries():
+    query = compile_query("messages[*].text")
+
+    assert query is compile_query("messages[*].text")
+    assert query.expression == "messages[*].text"
+    assert repr(query) == "Query('messages[*].text')"
+
+
+@pytest.mark.parametrize(
+    ("expression", "reason"),
+    [
+        ("", "expected a field"),
+        ("messages.", "expected a field"),
+        ("messages..text", "unexpected `.`"),
+        ("messages[0]text", "unexpected `t`"),
+        ("messages[0", "unclosed `\\[`"),
+        ("messages[x]", "invalid selector `\\[x\\]`"),
+        ("messages[::0]", "slice step cannot be zero"),
+        ("messages[? ]", "expected a field"),
+        ("messages[?]", "expected a filter"),
+        ("messages[?user == bot]", "invalid literal `bot`"),
+        ("messages[0].{, text}", "expected a field name"),
+    ],
+)
+def test_it_raises_on_invalid_queries(expression, reason):
+    with pytest.raises(QueryError, match=reason):
+        compile_query(expression)
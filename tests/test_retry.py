@@ -0,0 +1,101 @@
+import time
+from email.utils import formatdate
+
+import pytest
+
+from scoutos.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    backoff_delay,
+    parse_retry_after,
+)
+
+
+@pytest.mark.parametrize(
+    ("attempt", "expected"),
+    [(1, 0.5), (2, 1.0), (3, 2.0), (4, 3.0)],
+)
+def test_backoff_delay_grows_exponentially_up_to_max_delay(attempt, expected):
+    policy = {"max_attempts": 10, "max_delay": 3, "jitter": False}
+
+    assert backoff_delay(policy, attempt) == expected
+
+
+def test_backoff_delay_stops_after_max_attempts():
+    assert backoff_delay({"jitter": False}, 2) == 1.0
+    assert backoff_delay({"jitter": False}, 3) is None
+
+
+def test_backoff_delay_is_jittered(mocker):
+    uniform = mocker.patch("scoutos.retry.random.uniform", return_value=0.25)
+
+    assert backoff_delay({"initial_delay": 2}, 1) == 0.25  # noqa: PLR2004
+    uniform.assert_called_once_with(0, 2)
+
+
+def test_backoff_delay_honours_retry_after():
+    policy = {"initial_delay": 1, "max_delay": 10, "jitter": False}
+
+    assert backoff_delay(policy, 1, retry_after=5) == 5  # noqa: PLR2004
+    assert backoff_delay(policy, 1, retry_after=0) == 1
+    assert backoff_delay(policy, 1, retry_after=11) is None
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(None, None), ("", None), (" 120 ", 120), ("soon", None)],
+)
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_reads_http_dates():
+    retry_at = formatdate(time.time() + 60, usegmt=True)
+
+    assert 55 < parse_retry_after(retry_at) <= 60  # noqa: PLR2004
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+
+def test_circuit_opens_after_consecutive_failures():
+    breaker = CircuitBreaker({"failure_threshold": 2, "reset_after": 60})
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.allow()
+    assert breaker.retry_after == 0
+
+    breaker.record_failure()
+    assert breaker.is_open
+    assert not breaker.allow()
+    assert 0 < breaker.retry_after <= 60  # noqa: PLR2004
+
+
+def test_circuit_lets_a_single_probe_through(mocker):
+    now = mocker.patch("scoutos.retry.time.monotonic", return_value=100.0)
+    breaker = CircuitBreaker({"failure_threshold": 1, "reset_after": 10})
+    breaker.record_failure()
+
+    now.return_value = 110.0
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_failure()
+    now.return_value = 115.0
+    assert not breaker.allow()
+
+    now.return_value = 120.0
+    assert breaker.allow()
+    breaker.record_success()
+    assert not breaker.is_open
+    assert breaker.allow()
+
+
+def test_circuit_open_error():
+    error = CircuitOpenError("https://slack.com", 12.34)
+
+    assert error.origin == "https://slack.com"
+    assert str(error) == (
+        "The circuit of https://slack.com is open after repeated failures, "
+        "retry in 12.3s"
+    )
@@ -0,0 +1,81 @@
+from scoutos.blocks.base import BlockOutput
+from scoutos.run_state import RunState
+
+
+def create_block_output(block_id: str, output: dict) -> BlockOutput:
+    return BlockOutput(
+        block_id=block_id,
+        block_run_id="BLOCK-RUN-ID-1234",
+        ok=True,
+        output=output,
+    )
+
+
+def test_empty_state():
+    state = RunState()
+
+    assert state.log == []
+    assert state.path == []
+    assert state.latest("input") is None
+    assert state.run_count("input") == 0
+
+
+def test_append_keeps_log_path_and_index():
+    first = create_block_output("looper", {"count": 1})
+    second = create_block_output("looper", {"count": 2})
+    state = RunState([create_block_output("input", {})])
+
+    assert state.append(first) == 1
+    assert state.append(second) == 2  # noqa: PLR2004
+    assert state.path == ["input", "looper", "looper"]
+    assert state.log[1:] == [first, second]
+    assert state.latest("looper") is second
+    assert state.run_count("looper") == 2  # noqa: PLR2004
+
+
+def test_skipped_blocks_are_recorded_but_not_counted_as_runs():
+    skipped = BlockOutput(
+        block_id="gated",
+        block_run_id="BLOCK-RUN-ID-1234",
+        ok=True,
+        output=None,
+        skipped=True,
+    )
+    state = RunState([create_block_output("input", {})])
+
+    state.append(skipped)
+
+    assert state.path == ["input", "gated"]
+    assert state.latest("gated") is skipped
+    assert state.run_count("gated") == 0
+    assert state.is_skipped("gated")
+    assert not state.is_skipped("input")
+
+
+def test_drop_payloads_keeps_metadata_and_the_latest_outputs():
+    state = RunState()
+    for count in range(3):
+        state.append(create_block_output("looper", {"count": count}))
+
+    state.drop_payloads("looper", keep=1)
+
+    assert [output.output for output in state.log] == [None, None, {"count": 2}]
+    assert [output.trimmed for output in state.log] == [True, True, False]
+    assert [output.seq for output in state.log] == [0, 1, 2]
+
+    state.drop_payloads("looper")
+    state.drop_payloads("missing")
+
+    assert state.latest("looper") is state.log[2]
+    assert state.latest("looper").output is None
+
+
+def test_retained_iterations_bounds_payloads_per_block():
+    state = RunState(retained_iterations=2)
+    for count in range(4):
+        state.append(create_block_output("looper", {"count": count}))
+        state.append(create_block_output("other", {"count": count}))
+
+    for block_id in ("looper", "other"):
+        outputs = [output for output in state.log if output.block_id == block_id]
+        assert [output.trimmed for output in outputs] == [True, True, False, False]
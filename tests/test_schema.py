@@ -0,0 +1,171 @@
+import pytest
+from pydantic import BaseModel
+
+from scoutos import SchemaError, SchemaValidationError, compile_schema
+from scoutos.schema import schema_types_at
+
+
+class Message(BaseModel):
+    text: str
+
+
+@pytest.mark.parametrize(
+    ("schema", "value"),
+    [
+        ({"type": "string"}, "hello"),
+        ({"type": ["string", "null"]}, None),
+        ({"type": "integer"}, 1),
+        ({"type": "integer"}, 1.0),
+        ({"type": "number"}, 1.5),
+        ({"type": "boolean"}, False),
+        ({"type": "array"}, (1, 2)),
+        ({"type": "object"}, Message(text="hi")),
+        ({"enum": ["a", "b"]}, "b"),
+        ({"enum": [1, True]}, 1.0),
+        ({"enum": [[1, {"a": True}]]}, (1, {"a": True})),
+        ({"const": 42}, 42),
+        ({"const": False}, False),
+        ({"const": {"text": "hi"}}, Message(text="hi")),
+        ({"multipleOf": 2}, 4),
+        ({"multipleOf": 0.1}, 0.3),
+        ({"multipleOf": 2}, "not a number"),
+        ({"uniqueItems": True}, [1, True, "1", [1], {"a": 1}, {"a": True}]),
+        ({"uniqueItems": False}, [1, 1]),
+        ({"uniqueItems": True}, "not an array"),
+        ({"minProperties": 1, "maxProperties": 1}, {"a": 1}),
+        ({"maxProperties": 0}, "not an object"),
+        ({"minLength": 2, "maxLength": 3}, "abc"),
+        ({"minLength": 2}, 1),
+        ({"pattern": "^h"}, "hello"),
+        ({"minItems": 1, "maxItems": 1}, ["a"]),
+        ({"minimum": 0, "maximum": 1}, 1),
+        ({"exclusiveMinimum": 0, "exclusiveMaximum": 1}, 0.5),
+        ({"minimum": 0}, "not a number"),
+        ({"items": {"type": "integer"}}, [1, 2, 3]),
+        ({"items": {"type": "integer"}}, "not an array"),
+        (
+            {"required": ["text"], "properties": {"text": {"type": "string"}}},
+            {"text": "hi"},
+        ),
+        ({"required": ["text"]}, Message(text="hi")),
+        ({"properties": {"text": {"type": "string"}}}, "not an object"),
+        ({"additionalProperties": False, "properties": {"a": True}}, {"a": 1}),
+        ({"additionalProperties": {"type": "integer"}}, {"a": 1, "b": 2}),
+        ({"allOf": [{"type": "string"}, {"minLength": 1}]}, "a"),
+        ({"anyOf": [{"type": "string"}, {"type": "integer"}]}, 1),
+        ({"oneOf": [{"type": "string"}, {"type": "integer"}]}, "a"),
+        ({"not": {"type": "string"}}, 1),
+        ({"title": "Annotations only", "format": "email"}, "anything"),
+        (True, "anything"),
+    ],
+)
+def test_it_accepts_matching_values(schema, value):
+    validate = compile_schema({"allOf": [schema]})
+
+    assert validate is not None
+    validate(value)
+
+
+@pytest.mark.parametrize(
+    ("schema", "value", "message"),
+    [
+        ({"type": "string"}, 1, "expected string, got int"),
+        ({"type": ["string", "null"]}, 1, "expected string or null, got int"),
+        ({"type": "integer"}, 1.5, "expected integer"),
+        ({"type": "integer"}, True, "expected integer"),
+        ({"type": "number"}, "1", "expected number"),
+        ({"type": "object"}, [], "expected object"),
+        ({"enum": ["a", "b"]}, "c", "'c' is not one of \\['a', 'b'\\]"),
+        ({"const": 42}, 41, "expected 42, got 41"),
+        ({"enum": [1]}, True, "True is not one of \\[1\\]"),
+        ({"const": 0}, False, "expected 0, got False"),
+        ({"const": [1]}, [True], "expected \\[1\\], got \\[True\\]"),
+        ({"multipleOf": 2}, 3, "not a multiple of 2"),
+        ({"multipleOf": 0.1}, 0.35, "not a multiple of 0.1"),
+        ({"uniqueItems": True}, [1, 1.0], "item 1 is a duplicate"),
+        ({"uniqueItems": True}, [{"a": [1]}, {"a": [1]}], "item 1 is a duplicate"),
+        ({"minProperties": 1}, {}, "fewer properties than 1"),
+        ({"maxProperties": 1}, {"a": 1, "b": 2}, "more properties than 1"),
+        ({"minLength": 2}, "a", "shorter than 2"),
+        ({"maxLength": 1}, "ab", "longer than 1"),
+        ({"pattern": "^h"}, "ello", "does not match pattern"),
+        ({"minItems": 1}, [], "fewer items than 1"),
+        ({"maxItems": 0}, [1], "more items than 0"),
+        ({"minimum": 0}, -1, "less than 0"),
+        ({"maximum": 0}, 1, "greater than 0"),
+        ({"exclusiveMinimum": 0}, 0, "not greater than 0"),
+        ({"exclusiveMaximum": 0}, 0, "not less than 0"),
+        ({"items": {"type": "integer"}}, [1, "2"], "^1: expected integer"),
+        ({"required": ["text"]}, {}, "missing required property `text`"),
+        (
+            {"properties": {"user": {"properties": {"id": {"type": "string"}}}}},
+            {"user": {"id": 1}},
+            "^user.id: expected string",
+        ),
+        (
+            {"properties": {"text": {"type": "integer"}}},
+            Message(text="hi"),
+            "^text: expected integer",
+        ),
+        ({"additionalProperties": False}, {"a": 1}, "^a: no value is allowed"),
+        ({"anyOf": [{"type": "string"}, {"type": "null"}]}, 1, "any of the allowed"),
+        ({"oneOf": [{"type": "number"}, {"type": "integer"}]}, 1, "matches 2"),
+        ({"not": {"type": "string"}}, "a", "matches a schema it should not"),
+        ({"allOf": [{"type": "string"}, {"minLength": 2}]}, "a", "shorter than 2"),
+    ],
+)
+def test_it_rejects_values_that_do_not_match(schema, value, message):
+    validate = compile_schema(schema)
+
+    assert validate is not None
+    with pytest.raises(SchemaValidationError, match=message):
+        validate(value)
+
+
+def test_it_skips_empty_schemas():
+    assert compile_schema({}) is None
+    assert compile_schema(None) is None
+
+
+@pytest.mark.parametrize(
+    ("schema", "message"),
+    [
+        ({"$ref": "#/definitions/user"}, "Unsupported schema keywords: \\$ref"),
+        (
+            {"additionalItems": False, "dependencies": {"a": ["b"]}},
+            "Unsupported schema keywords: additionalItems, dependencies",
+        ),
+        ({"type": "str"}, "Unknown schema type: str"),
+        ({"items": "string"}, "Expected a schema, got 'string'"),
+    ],
+)
+def test_it_raises_on_unsupported_schemas(schema, message):
+    with pytest.raises(SchemaError, match=message):
+        compile_schema(schema)
+
+
+SCHEMA = {
+    "properties": {
+        "name": {"type": "string"},
+        "tags": {"type": "array", "items": {"type": ["string", "null"]}},
+        "extra": {"description": "untyped"},
+        "invalid": "not a schema",
+    }
+}
+
+
+@pytest.mark.parametrize(
+    ("segments", "expected_types"),
+    [
+        ((), None),
+        (("name",), {"string"}),
+        (("tags",), {"array"}),
+        (("tags", "0"), {"string", "null"}),
+        (("name", "0"), None),
+        (("extra",), None),
+        (("invalid",), None),
+        (("missing",), None),
+    ],
+)
+def test_schema_types_at(segments, expected_types):
+    assert schema_types_at(SCHEMA, segments) == expected_types
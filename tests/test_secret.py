@@ -5,6 +5,8 @@ import httpx
 import pytest
 
 from scoutos import Secret, SecretNotFoundError
+from scoutos.secret import SCOUTOS_SECRETS_ENDPOINT
+from scoutos.transport import Transport
 
 
 @pytest.mark.asyncio()
@@ -40,7 +42,7 @@ async def test_it_resolves_value_from_scout_cloud():
     with patch.object(
         Secret, "_resolve_from_local_env", MagicMock(return_value=None)
     ) as mock_resolve_from_local_env, patch(
-        "scoutos.secret.httpx.AsyncClient.get",
+        "httpx.AsyncClient.get",
         return_value=httpx.Response(200, json={"value": expected_value}),
     ):
         result = await secret.resolve()
@@ -55,7 +57,7 @@ async def test_when_request_to_scout_cloud_fails():
     secret = Secret(key=key, scoutos_secret_key="FAKE_SECRET_KEY")  # noqa: S106
 
     with patch(
-        "scoutos.secret.httpx.AsyncClient.get",
+        "httpx.AsyncClient.get",
         return_value=httpx.Response(500, text="Internal Server Error"),
     ), pytest.raises(SecretNotFoundError, match=key):
         await secret.resolve()
@@ -70,3 +72,22 @@ async def test_when_secret_is_not_found_anywhere():
         Secret, "_resolve_from_scout_cloud", AsyncMock(return_value=None)
     ), pytest.raises(SecretNotFoundError, match=key):
         await secret.resolve()
+
+
+@pytest.mark.asyncio()
+async def test_it_fetches_through_the_given_transport(mocker):
+    transport = Transport()
+    client = transport.client(SCOUTOS_SECRETS_ENDPOINT)
+    get = mocker.patch.object(
+        client, "get", return_value=httpx.Response(200, json={"value": "VALUE"})
+    )
+    secret = Secret(
+        key="SOME_KEY",
+        scoutos_secret_key="FAKE_SECRET_KEY",  # noqa: S106
+        transport=transport,
+    )
+    mocker.patch.object(Secret, "_resolve_from_local_env", return_value=None)
+
+    assert await secret.resolve() == "VALUE"
+    get.assert_called_once()
+    await transport.aclose()
@@ -0,0 +1,45 @@
+from scoutos.blocks.base import BlockOutput
+from scoutos.timings import BlockTimings, critical_path_ns
+
+
+def create_block_output(block_id: str, run_ns: int) -> BlockOutput:
+    return BlockOutput(
+        block_id=block_id,
+        block_run_id="BLOCK-RUN-ID-1234",
+        ok=True,
+        output={},
+        timings=BlockTimings(run_ns=run_ns),
+    )
+
+
+def test_critical_path_of_an_empty_run():
+    assert critical_path_ns([], {}) == 0
+
+
+def test_critical_path_follows_the_slowest_branch():
+    upstream = {
+        "input": (),
+        "fast": ("input",),
+        "slow": ("input",),
+        "output": ("fast", "slow"),
+    }
+    outputs = [
+        create_block_output("input", 1),
+        create_block_output("fast", 10),
+        create_block_output("slow", 100),
+        create_block_output("output", 1000),
+    ]
+
+    assert critical_path_ns(outputs, upstream) == 1101  # noqa: PLR2004
+
+
+def test_critical_path_chains_loop_iterations():
+    upstream = {"input": (), "loop": ()}
+    outputs = [
+        create_block_output("input", 50),
+        create_block_output("loop", 10),
+        create_block_output("loop", 10),
+        create_block_output("loop", 10),
+    ]
+
+    assert critical_path_ns(outputs, upstream) == 50  # noqa: PLR2004
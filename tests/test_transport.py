@@ -0,0 +1,274 @@
+import asyncio
+import gzip
+
+import httpx
+import pytest
+
+from scoutos.retry import CircuitOpenError
+from scoutos.transport import ResponseTooLargeError, Transport, get_default_transport
+
+
+@pytest.fixture()
+def stubbed_network(mocker):
+    async def handle_async_request(_self, request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"url": str(request.url)})
+
+    mocker.patch.object(
+        httpx.AsyncHTTPTransport, "handle_async_request", handle_async_request
+    )
+
+
+@pytest.mark.asyncio()
+async def test_clients_are_shared_per_origin():
+    transport = Transport()
+
+    client = transport.client("https://slack.com/api/users.info")
+
+    assert transport.client("https://slack.com/api/conversations.list") is client
+    assert transport.client("http://slack.com/api") is not client
+    assert transport.client("https://slack.com:8443/api") is not client
+    assert list(transport.stats) == [
+        "https://slack.com",
+        "http://slack.com",
+        "https://slack.com:8443",
+    ]
+    await transport.aclose()
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures("stubbed_network")
+async def test_stats_track_pool_usage():
+    transport = Transport(max_connections=10)
+    client = transport.client("https://example.com")
+
+    responses = await asyncio.gather(
+        *(client.get(f"https://example.com/{index}") for index in range(3))
+    )
+
+    stats = transport.stats["https://example.com"]
+    assert [response.json()["url"] for response in responses] == [
+        "https://example.com/0",
+        "https://example.com/1",
+        "https://example.com/2",
+    ]
+    assert transport.max_connections == 10  # noqa: PLR2004
+    assert (stats.clients, stats.requests, stats.in_flight) == (1, 3, 0)
+    assert stats.peak_in_flight == 3  # noqa: PLR2004
+    await transport.aclose()
+
+
+def test_clients_are_replaced_in_another_event_loop():
+    transport = Transport()
+
+    async def get_client() -> httpx.AsyncClient:
+        return transport.client("https://example.com")
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+
+    assert first is not second
+    assert transport.stats["https://example.com"].clients == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio()
+async def test_aclose_closes_the_clients_of_the_running_loop():
+    transport = Transport(http2=False)
+    client = transport.client("https://example.com")
+
+    await transport.aclose()
+
+    assert client.is_closed
+    assert not transport.http2
+    assert transport.client("https://example.com") is not client
+    await transport.aclose()
+
+
+def test_default_transport_is_shared():
+    assert get_default_transport() is get_default_transport()
+
+
+@pytest.mark.asyncio()
+async def test_circuit_breaker_rejects_requests_to_a_failing_origin(mocker):
+    statuses = [503, 404, 503, 503]
+
+    async def handle_async_request(_self, _request: httpx.Request) -> httpx.Response:
+        return httpx.Response(statuses.pop(0))
+
+    mocker.patch.object(
+        httpx.AsyncHTTPTransport, "handle_async_request", handle_async_request
+    )
+    transport = Transport(circuit_breaker={"failure_threshold": 2})
+    client = transport.client("https://example.com")
+
+    assert [
+        (await client.get("https://example.com")).status_code for _ in range(4)
+    ] == [503, 404, 503, 503]
+    with pytest.raises(CircuitOpenError, match=r"https://example\.com"):
+        await client.get("https://example.com")
+
+    assert transport.stats["https://example.com"].requests == 4  # noqa: PLR2004
+    assert transport.circuit_breaker("https://example.com").is_open
+    assert not transport.circuit_breaker("https://other.com").is_open
+    await transport.aclose()
+
+
+@pytest.mark.asyncio()
+async def test_circuit_breaker_counts_connection_errors(mocker):
+    mocker.patch.object(
+        httpx.AsyncHTTPTransport,
+        "handle_async_request",
+        side_effect=httpx.ConnectError("refused"),
+    )
+    transport = Transport(circuit_breaker={"failure_threshold": 1})
+    client = transport.client("https://example.com")
+
+    with pytest.raises(httpx.ConnectError):
+        await client.get("https://example.com")
+    with pytest.raises(CircuitOpenError):
+        await client.get("https://example.com")
+
+    assert Transport().circuit_breaker("https://example.com") is None
+    await transport.aclose()
+
+
+@pytest.fixture()
+def slow_network(mocker) -> list[httpx.Request]:
+    sent: list[httpx.Request] = []
+
+    async def handle_async_request(_self, request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        await asyncio.sleep(0.05)
+        if request.url.path == "/down":
+            message = "connection reset"
+            raise httpx.ReadError(message, request=request)
+        return httpx.Response(200, json={"user": request.headers.get("Authorization")})
+
+    mocker.patch.object(
+        httpx.AsyncHTTPTransport, "handle_async_request", handle_async_request
+    )
+    return sent
+
+
+@pytest.mark.asyncio()
+async def test_identical_requests_in_flight_are_coalesced(slow_network):
+    transport = Transport(coalesce=True)
+    client = transport.client("https://slack.com")
+    alice = {"Authorization": "Bearer alice"}
+
+    responses = await asyncio.gather(
+        client.get("https://slack.com/api/users.info?user=U1", headers=alice),
+        client.get("https://slack.com/api/users.info?user=U1", headers=alice),
+        client.get("https://slack.com/api/users.info?user=U2", headers=alice),
+        client.get(
+            "https://slack.com/api/users.info?user=U1",
+            headers={"Authorization": "Bearer bob"},
+        ),
+        client.post("https://slack.com/api/users.info?user=U1", headers=alice),
+        client.post("https://slack.com/api/users.info?user=U1", headers=alice),
+    )
+
+    assert transport.coalesce
+    assert [response.json()["user"] for response in responses] == [
+        "Bearer alice",
+        "Bearer alice",
+        "Bearer alice",
+        "Bearer bob",
+        "Bearer alice",
+        "Bearer alice",
+    ]
+    assert responses[0] is not responses[1]
+    assert len(slow_network) == 5  # noqa: PLR2004
+    assert transport.stats["https://slack.com"].coalesced == 1
+
+    await client.get("https://slack.com/api/users.info?user=U1", headers=alice)
+    assert len(slow_network) == 6  # noqa: PLR2004
+    await transport.aclose()
+
+
+@pytest.mark.asyncio()
+async def test_coalesced_requests_share_failures(slow_network):
+    transport = Transport(coalesce=True)
+    client = transport.client("https://example.com")
+
+    results = await asyncio.gather(
+        client.get("https://example.com/down"),
+        client.get("https://example.com/down"),
+        return_exceptions=True,
+    )
+
+    assert [type(result) for result in results] == [httpx.ReadError] * 2
+    assert len(slow_network) == 1
+    await transport.aclose()
+
+
+@pytest.mark.asyncio()
+async def test_coalesced_requests_outlive_callers_giving_up(slow_network):
+    transport = Transport(coalesce=True)
+    client = transport.client("https://example.com")
+
+    impatient = asyncio.wait_for(client.get("https://example.com/"), 0.01)
+    patient = client.get("https://example.com/")
+    results = await asyncio.gather(impatient, patient, return_exceptions=True)
+
+    assert isinstance(results[0], asyncio.TimeoutError)
+    assert results[1].status_code == 200  # noqa: PLR2004
+    assert len(slow_network) == 1
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(client.get("https://example.com/down"), 0.01)
+    await asyncio.sleep(0.1)
+    await transport.aclose()
+
+
+@pytest.mark.asyncio()
+async def test_requests_can_opt_out_of_coalescing(slow_network):
+    transport = Transport(coalesce=True)
+    client = transport.client("https://example.com")
+
+    await asyncio.gather(
+        client.get("https://example.com/", extensions={"coalesce": False}),
+        client.get("https://example.com/", extensions={"coalesce": False}),
+    )
+
+    assert len(slow_network) == 2  # noqa: PLR2004
+    assert transport.stats["https://example.com"].coalesced == 0
+    await transport.aclose()
+
+
+@pytest.mark.asyncio()
+async def test_coalesced_responses_are_read_up_to_max_body_size(slow_network):
+    transport = Transport(coalesce=True)
+    client = transport.client("https://example.com")
+
+    small, large = await asyncio.gather(
+        client.get("https://example.com/", extensions={"max_body_size": 8}),
+        client.get("https://example.com/", extensions={"max_body_size": 1024}),
+        return_exceptions=True,
+    )
+
+    assert isinstance(small, ResponseTooLargeError)
+    assert small.max_body_size == 8  # noqa: PLR2004
+    assert large.json() == {"user": None}
+    assert len(slow_network) == 2  # noqa: PLR2004
+    await transport.aclose()
+
+
+@pytest.mark.asyncio()
+async def test_coalesced_responses_are_decoded_once(mocker):
+    mocker.patch.object(
+        httpx.AsyncHTTPTransport,
+        "handle_async_request",
+        return_value=httpx.Response(
+            200,
+            headers={"Content-Encoding": "gzip"},
+            stream=httpx.ByteStream(gzip.compress(b'{"ok": true}')),
+        ),
+    )
+    transport = Transport(coalesce=True)
+
+    response = await transport.client("https://example.com").get("https://example.com")
+
+    assert response.json() == {"ok": True}
+    assert "Content-Encoding" not in response.headers
+    await transport.aclose()
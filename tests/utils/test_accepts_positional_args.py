@@ -0,0 +1,44 @@
+import pytest
+
+from scoutos.utils import accepts_positional_args
+
+
+def one_arg(_data):
+    return True
+
+
+def two_args(_data, _iteration):
+    return True
+
+
+def var_args(*_args: object):
+    return True
+
+
+@pytest.mark.parametrize(
+    ("fn", "count", "expected_result"),
+    [
+        (one_arg, 1, True),
+        (one_arg, 2, False),
+        (two_args, 2, True),
+        (var_args, 2, True),
+        (lambda data, *, iteration: (data, iteration), 2, False),
+        (print, 2, False),
+        (object(), 1, False),
+    ],
+)
+def test_accepts_positional_args(fn, count, expected_result):
+    assert accepts_positional_args(fn, count) is expected_result
+
+
+class UnhashableCallable:  # noqa: PLW1641
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, UnhashableCallable)
+
+    def __call__(self, _data, _iteration):
+        return True
+
+
+def test_accepts_unhashable_callables():
+    assert accepts_positional_args(UnhashableCallable(), 2) is True
+    assert accepts_positional_args(UnhashableCallable(), 3) is False
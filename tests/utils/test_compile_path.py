@@ -0,0 +1,27 @@
+import pytest
+
+from scoutos.utils import compile_path
+
+
+@pytest.mark.parametrize(
+    ("segments", "data", "expected_value"),
+    [
+        (("foo",), {"foo": 42}, 42),
+        (("foo",), {"bar": 42}, None),
+        (("foo",), "not a dict", None),
+        (("foo", "bar"), {"foo": {"bar": 42}}, 42),
+        (("foo", "bar"), {"foo": None}, None),
+        (("choices", "0", "text"), {"choices": [{"text": "hi"}]}, "hi"),
+        (("choices", "1", "text"), {"choices": [{"text": "hi"}]}, None),
+        (("pair", "1"), {"pair": ("a", "b")}, "b"),
+        (("by_index", "0"), {"by_index": {"0": "zero"}}, "zero"),
+        (("name", "0"), {"name": "abc"}, None),
+        (("items", "0", "missing"), {"items": [{}]}, None),
+    ],
+)
+def test_it_returns_value_when_present(segments, data, expected_value):
+    assert compile_path(segments)(data) == expected_value
+
+
+def test_it_reuses_compiled_paths():
+    assert compile_path(("foo", "0")) is compile_path(("foo", "0"))
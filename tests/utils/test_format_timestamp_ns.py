@@ -0,0 +1,15 @@
+import pytest
+
+from scoutos.utils import format_timestamp_ns
+
+
+@pytest.mark.parametrize(
+    ("timestamp_ns", "expected_result"),
+    [
+        (0, "1970-01-01T00:00:00Z"),
+        (1_500_000_000, "1970-01-01T00:00:01.500000Z"),
+        (1_714_000_000_123_456_789, "2024-04-24T23:06:40.123456Z"),
+    ],
+)
+def test_format_timestamp_ns(timestamp_ns, expected_result):
+    assert format_timestamp_ns(timestamp_ns) == expected_result
@@ -42,6 +42,7 @@ from scoutos.utils import get_nested_value_from_dict
             },
             {},
         ),
+        ("items.1", {"items": ["first", "second"]}, "second"),
     ],
 )
 def test_it_returns_value_when_present(path, the_dict, expected_value):
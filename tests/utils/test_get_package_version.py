@@ -0,0 +1,20 @@
+import sys
+from importlib.metadata import PackageNotFoundError
+
+from scoutos.utils import get_package_version
+
+module = sys.modules["scoutos.utils.get_package_version"]
+
+
+def test_returns_installed_version(mocker):
+    mocker.patch.object(module, "version", return_value="1.2.3")
+    get_package_version.cache_clear()
+
+    assert get_package_version("some-package") == "1.2.3"
+
+
+def test_returns_unknown_when_not_installed(mocker):
+    mocker.patch.object(module, "version", side_effect=PackageNotFoundError)
+    get_package_version.cache_clear()
+
+    assert get_package_version("not-installed") == "unknown"
@@ -0,0 +1,22 @@
+import re
+
+import pytest
+
+from scoutos.utils import parse_data
+
+
+def test_parses_json_and_yaml_bytes():
+    assert parse_data(b'{"foo": [1, 2]}', ".json") == {"foo": [1, 2]}
+    assert parse_data(b"foo:\n  - 1\n  - 2\n", ".yml") == {"foo": [1, 2]}
+
+
+def test_yaml_is_loaded_safely():
+    with pytest.raises(Exception, match="python/object"):
+        parse_data(b"!!python/object:builtins.object {}", ".yaml")
+
+
+def test_unknown_suffix_raises():
+    with pytest.raises(
+        ValueError, match=re.escape("No handler found for .txt filetype")
+    ):
+        parse_data(b"Lorem Ipsum", ".txt")